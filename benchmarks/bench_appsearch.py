@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark: latência por tecla da busca incremental de aplicativos
+
+Gera um catálogo sintético (padrão 2500 entradas, nomes/keywords variados)
+e digita consultas caractere por caractere, como no campo de busca.
+Não precisa de X.
+
+Uso: python3 benchmarks/bench_appsearch.py [entradas]
+"""
+
+import random
+import sys
+import time
+
+from xvfb import percentile
+
+from cores_appindex import AppEntry
+from cores_appsearch import AppSearch, UsageStats
+
+WORDS = ("text editor terminal browser file manager settings image viewer music player "
+         "video office writer calc mail chat office spreadsheet draw paint system monitor "
+         "network disk archive calendar clock weather photo camera scanner printer code "
+         "debugger database git python console remote desktop screenshot recorder").split()
+
+QUERIES = ["firefox", "term", "text ed", "mus pl", "scrn", "office calc", "zzz", "set"]
+
+
+def synthetic_entries(count, seed=42):
+    """Catálogo sintético com nomes e keywords aleatórios"""
+    rng = random.Random(seed)
+    entries = [AppEntry("firefox.desktop", "Firefox", "Web Browser", "firefox", "firefox", False, "web;")]
+    for i in range(count - 1):
+        name = " ".join(rng.choice(WORDS).capitalize() for _ in range(rng.randint(1, 3)))
+        keywords = ";".join(rng.sample(WORDS, 3))
+        entries.append(AppEntry(f"app{i}.desktop", name, rng.choice(WORDS), f"app{i} --x", "", False, keywords))
+    return entries
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2500
+    entries = synthetic_entries(count)
+
+    usage = UsageStats(path="/dev/null")
+    usage.counts = {f"app{i}.desktop": i % 7 for i in range(0, count, 5)}
+
+    start = time.perf_counter()
+    search = AppSearch(entries, usage)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    samples = []
+    for query in QUERIES * 20:
+        search.search("")
+        for n in range(1, len(query) + 1):
+            start = time.perf_counter()
+            search.search(query[:n])
+            samples.append((time.perf_counter() - start) * 1000)
+        # Backspace volta a buscar do índice
+        start = time.perf_counter()
+        search.search(query[:-1])
+        samples.append((time.perf_counter() - start) * 1000)
+
+    samples.sort()
+    print(f"Entradas: {count}, índice construído em {build_ms:.1f} ms")
+    print(f"Teclas medidas: {len(samples)}")
+    print(f"Latência p50: {percentile(samples, 50):.3f} ms")
+    print(f"Latência p99: {percentile(samples, 99):.3f} ms")
+    print(f"Latência máx: {samples[-1]:.3f} ms")
+    print(f"Exemplo 'term': {[e.name for e in search.search('term')][:4]}")
+
+
+if __name__ == "__main__":
+    main()
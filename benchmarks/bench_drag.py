@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark: custo do arraste (eventos de movimento x chamadas de geometria)
+
+Sobe um Xvfb, arrasta o quadrado S com movimentos sintéticos via XTest numa
+taxa maior que a da tela e conta eventos processados, chamadas de
+geometry() e CPU gasta; ao soltar mede o tempo até o encaixe no canto.
+
+Uso: python3 benchmarks/bench_drag.py [taxa_hz] [segundos]
+"""
+
+import os
+import sys
+import time
+
+from xvfb import BenchTaskbar, load_xtest, start_xvfb
+
+from cores_xhotkeys import load_xlib
+
+DISPLAY = ":97"
+
+
+def pump(root, seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        root.tk.dooneevent(2)  # DONT_WAIT
+
+
+def main():
+    rate = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 2.0
+    xvfb = start_xvfb(DISPLAY)
+
+    try:
+        xtst = load_xtest()
+        xlib = load_xlib()
+        injector = xlib.XOpenDisplay(DISPLAY.encode())
+
+        taskbar = BenchTaskbar()
+        root = taskbar.root
+        pump(root, 0.5)
+
+        geometry_calls = []
+        original_geometry = root.geometry
+
+        def counted_geometry(*args):
+            if args:
+                geometry_calls.append(time.perf_counter())
+            return original_geometry(*args)
+
+        root.geometry = counted_geometry
+
+        # Pressionar no centro do quadrado e arrastar em diagonal
+        x0 = int(taskbar.window.x + taskbar.window.width / 2)
+        y0 = int(taskbar.window.y + taskbar.window.height / 2)
+        xtst.XTestFakeMotionEvent(injector, -1, x0, y0, 0)
+        xtst.XTestFakeButtonEvent(injector, 1, True, 0)
+        xlib.XFlush(injector)
+        pump(root, 0.05)
+
+        # Movimentos injetados por timers do próprio loop (sem espera ativa na medição)
+        steps = int(rate * seconds)
+        period_ms = max(1, round(1000 / rate))
+        state = {"step": 0, "done": False}
+
+        def inject():
+            i = state["step"]
+            if i >= steps:
+                state["done"] = True
+                return
+            xtst.XTestFakeMotionEvent(injector, -1, x0 + i * 600 // steps, y0 - i * 400 // steps, 0)
+            xlib.XFlush(injector)
+            state["step"] += 1
+            root.after(period_ms, inject)
+
+        cpu_start = sum(os.times()[:2])
+        start = time.perf_counter()
+        root.after(0, inject)
+        while not state["done"]:
+            root.tk.dooneevent(0)
+        drag_seconds = time.perf_counter() - start
+        cpu_ms = (sum(os.times()[:2]) - cpu_start) * 1000
+        drag_geometry = len(geometry_calls)
+
+        release = time.perf_counter()
+        xtst.XTestFakeButtonEvent(injector, 1, False, 0)
+        xlib.XFlush(injector)
+        pump(root, 0.05)
+        while taskbar.animation_running and time.perf_counter() - release < 2:
+            pump(root, 0.005)
+        snap_ms = ((geometry_calls[-1] if geometry_calls else release) - release) * 1000
+
+        events = taskbar.drag_events
+        print(f"Movimentos enviados: {steps} ({steps / drag_seconds:.0f} Hz por {drag_seconds:.2f} s)")
+        print(f"Eventos processados: {events} ({events / drag_seconds:.0f}/s)")
+        print(f"Chamadas geometry(): {drag_geometry} ({drag_geometry / drag_seconds:.0f}/s, "
+              f"limite {taskbar.animation_fps}/s)")
+        print(f"CPU durante o arraste: {cpu_ms:.0f} ms ({cpu_ms / drag_seconds / 10:.1f}%)")
+        print(f"Encaixe até o canto: {snap_ms:.0f} ms "
+              f"(canto {taskbar.corners[taskbar.current_corner]})")
+
+        root.destroy()
+        xlib.XCloseDisplay(injector)
+    finally:
+        xvfb.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark: latência tecla -> handler do backend XGrabKey
+
+Sobe um Xvfb, registra Alt+1/2/3 com XHotkeyGrabber e injeta teclas
+sintéticas via XTest, medindo o tempo até o callback rodar no loop do Tk.
+
+Uso: python3 benchmarks/bench_hotkey_latency.py [repetições]
+"""
+
+import statistics
+import sys
+import time
+import tkinter as tk
+
+from xvfb import load_xtest, percentile, start_xvfb
+
+from cores_xhotkeys import XHotkeyGrabber, load_xlib
+
+DISPLAY = ":97"
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    xvfb = start_xvfb(DISPLAY)
+
+    try:
+        xtst = load_xtest()
+        xlib = load_xlib()
+
+        # Conexão separada para injetar teclas (como um teclado real)
+        injector = xlib.XOpenDisplay(DISPLAY.encode())
+        alt = xlib.XKeysymToKeycode(injector, xlib.XStringToKeysym(b"Alt_L"))
+        one = xlib.XKeysymToKeycode(injector, xlib.XStringToKeysym(b"1"))
+
+        root = tk.Tk()
+        root.withdraw()
+
+        samples = []
+        state = {"sent": 0.0}
+
+        def on_hotkey():
+            samples.append(time.perf_counter() - state["sent"])
+
+        grabber = XHotkeyGrabber(root, {"1": on_hotkey})
+        if not grabber.start(DISPLAY):
+            sys.exit("XGrabKey falhou")
+
+        for _ in range(repeats):
+            count = len(samples)
+            xtst.XTestFakeKeyEvent(injector, alt, True, 0)
+            state["sent"] = time.perf_counter()
+            xtst.XTestFakeKeyEvent(injector, one, True, 0)
+            xtst.XTestFakeKeyEvent(injector, one, False, 0)
+            xtst.XTestFakeKeyEvent(injector, alt, False, 0)
+            xlib.XFlush(injector)
+
+            deadline = time.perf_counter() + 1.0
+            while len(samples) == count and time.perf_counter() < deadline:
+                root.tk.dooneevent(0)
+
+        grabber.stop()
+        root.destroy()
+
+        if not samples:
+            sys.exit("Nenhum atalho recebido")
+
+        samples_ms = sorted(s * 1000 for s in samples)
+        print(f"Atalhos recebidos: {len(samples)}/{repeats}")
+        print(f"Latência média:  {statistics.mean(samples_ms):.3f} ms")
+        print(f"Latência p50:    {percentile(samples_ms, 50):.3f} ms")
+        print(f"Latência p99:    {percentile(samples_ms, 99):.3f} ms")
+        print(f"Latência máxima: {samples_ms[-1]:.3f} ms")
+    finally:
+        xvfb.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: backend /proc (preadv + buffer reutilizado) contra psutil
+
+Mede o tempo por amostra (cpu% + ram%) e a memória alocada por chamada.
+Não precisa de X.
+
+Uso: python3 benchmarks/bench_procstats.py [amostras]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from xvfb import REPO_DIR  # noqa: F401 (coloca o repositório no sys.path)
+
+from cores_procstats import ProcStatsReader, PsutilStats
+
+
+def measure(backend, samples):
+    """Tempo médio (µs) e pico de bytes alocados por amostra"""
+    backend.cpu_percent()
+
+    start = time.perf_counter()
+    for _ in range(samples):
+        backend.cpu_percent()
+        backend.ram_percent()
+    elapsed = time.perf_counter() - start
+
+    # Pico de memória temporária de uma amostra
+    tracemalloc.start()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    backend.cpu_percent()
+    backend.ram_percent()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return elapsed / samples * 1e6, peak - current
+
+
+def main():
+    samples = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    results = []
+    for backend in (PsutilStats(), ProcStatsReader()):
+        per_call, allocated = measure(backend, samples)
+        results.append((backend.name, per_call, allocated))
+        backend.close()
+
+    baseline = results[0][1]
+    for name, per_call, allocated in results:
+        print(f"{name:7s}: {per_call:8.2f} µs/amostra  "
+              f"{baseline / per_call:5.1f}x  "
+              f"pico alocado {allocated:6d} B/amostra")
+
+
+if __name__ == "__main__":
+    main()
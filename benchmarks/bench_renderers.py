@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Benchmark: árvore de widgets x canvas único (--canvas)
+
+Cada renderizador roda num processo próprio conectado ao Xvfb através de um
+proxy que conta as requisições X enviadas pelo Tk. Para cada operação
+(tique do relógio, texto de CPU/RAM, ponto novo nos gráficos de 60 s e
+10 min, varredura de hover pelos botões, expandir/recolher) mede requisições
+X e tempo até o redesenho terminar.
+
+Uso: python3 benchmarks/bench_renderers.py [repetições]
+"""
+
+import json
+import os
+import socket
+import struct
+import subprocess
+import sys
+import threading
+import time
+
+from xvfb import REPO_DIR, percentile, start_xvfb
+
+DISPLAY = ":97"
+PROXY_DISPLAY = ":98"
+RENDERERS = ["widgets", "canvas"]
+
+
+class XRequestCounter:
+    """Proxy Unix entre o cliente e o Xvfb que conta requisições do cliente"""
+
+    def __init__(self, display, proxy_display):
+        self.server_path = f"/tmp/.X11-unix/X{display[1:]}"
+        self.proxy_path = f"/tmp/.X11-unix/X{proxy_display[1:]}"
+        self.requests = 0
+        if os.path.exists(self.proxy_path):
+            os.remove(self.proxy_path)
+        self.listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.listener.bind(self.proxy_path)
+        self.listener.listen(4)
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            client, _ = self.listener.accept()
+            server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            server.connect(self.server_path)
+            threading.Thread(target=self._client_to_server, args=(client, server), daemon=True).start()
+            threading.Thread(target=self._relay, args=(server, client), daemon=True).start()
+
+    def _relay(self, src, dst):
+        while True:
+            data = src.recv(65536)
+            if not data:
+                break
+            dst.sendall(data)
+
+    def _client_to_server(self, client, server):
+        """Copiar e separar o fluxo em requisições (cabeçalho de 4 bytes + tamanho)"""
+        buffer = b""
+        setup_done = False
+        endian = "<"
+        while True:
+            data = client.recv(65536)
+            if not data:
+                break
+            server.sendall(data)
+            buffer += data
+
+            if not setup_done:
+                if len(buffer) < 12:
+                    continue
+                endian = "<" if buffer[0:1] == b"l" else ">"
+                name_len, data_len = struct.unpack(endian + "HH", buffer[6:10])
+                setup_len = 12 + name_len + (-name_len % 4) + data_len + (-data_len % 4)
+                if len(buffer) < setup_len:
+                    continue
+                buffer = buffer[setup_len:]
+                setup_done = True
+
+            while len(buffer) >= 4:
+                length = struct.unpack(endian + "H", buffer[2:4])[0] * 4
+                if length == 0:  # BIG-REQUESTS: tamanho em 32 bits
+                    if len(buffer) < 8:
+                        break
+                    length = struct.unpack(endian + "I", buffer[4:8])[0] * 4
+                if len(buffer) < length:
+                    break
+                buffer = buffer[length:]
+                self.requests += 1
+
+
+def run_child(renderer, repeats):
+    """Operações medidas dentro do processo do renderizador"""
+    counter = XRequestCounter(DISPLAY, PROXY_DISPLAY)
+    os.environ["DISPLAY"] = PROXY_DISPLAY
+
+    from cores_metrics import MetricsSampler, MetricsSnapshot
+    from xvfb import BenchTaskbar
+
+    taskbar = BenchTaskbar(renderer=renderer)
+    root = taskbar.root
+    # Histórico cheio (uma hora) para os gráficos, cadência mista 3 s / 10 s
+    taskbar.metrics = MetricsSampler(interval=None, history=taskbar.metrics_history)
+    clock = [time.time() - 3600 * 6.5]
+    for i in range(3600):
+        clock[0] += 3.0 if (i // 100) % 2 else 10.0
+        taskbar.metrics.times.append(clock[0])
+        for name, ring in taskbar.metrics.history.items():
+            ring.append((i * 7 + len(name) * 13) % 100)
+    root.update()
+    taskbar.create_expanded_section()
+    taskbar.is_expanded = True
+    taskbar.window.set(width=taskbar.expanded_width)
+    taskbar.show_expanded_interface()
+    root.update()
+
+    def settle():
+        """Redesenho concluído e requisições entregues (ida e volta ao servidor)"""
+        root.update_idletasks()
+        root.winfo_pointerx()
+
+    def measure(name, op):
+        requests, times = [], []
+        for i in range(repeats):
+            settle()
+            before = counter.requests
+            start = time.perf_counter()
+            op(i)
+            settle()
+            times.append((time.perf_counter() - start) * 1000)
+            requests.append(counter.requests - before - 1)  # sem o winfo_pointerx
+        times.sort()
+        return {"name": name, "requests": sum(requests) / repeats,
+                "p50_ms": percentile(times, 50), "p99_ms": percentile(times, 99)}
+
+    if renderer == "canvas":
+        canvas = taskbar.canvas_bar.canvas
+        centers = [((x0 + x1) // 2, (y0 + y1) // 2)
+                   for x0, y0, x1, y1 in map(taskbar.canvas_bar.button_bounds, range(5))]
+
+        def hover(i):
+            for x, y in centers:
+                canvas.event_generate('<Motion>', x=x, y=y)
+            canvas.event_generate('<Leave>')
+    else:
+        def hover(i):
+            for btn, _ in taskbar.app_buttons:
+                btn.event_generate('<Enter>')
+                btn.event_generate('<Leave>')
+
+    def sparkline_tick(i):
+        """Amostra nova com os gráficos visíveis (deslocamento incremental)"""
+        clock[0] += 3.0
+        taskbar.sparklines.push(MetricsSnapshot(i, clock[0], (i * 7) % 100, 50.0, 5.0))
+
+    def sparkline_view(view):
+        if taskbar.sparklines.view != view:
+            taskbar.sparklines.toggle_view()
+        return measure(f"gráficos {view}s", sparkline_tick)
+
+    def sparkline_redraw(i):
+        taskbar.sparklines.stale = True
+        taskbar.sparklines.refresh()
+
+    def toggle(i):
+        taskbar.show_square_interface()
+        taskbar.is_expanded = False
+        root.update_idletasks()
+        taskbar.is_expanded = True
+        taskbar.show_expanded_interface()
+
+    results = [
+        measure("relógio", lambda i: taskbar.clock_label.configure(text=f"12:{i // 60 % 60:02d}:{i % 60:02d}")),
+        measure("cpu/ram", lambda i: taskbar.system_label.configure(text=f"CPU: {i % 100}% | RAM: 40%")),
+        sparkline_view(60),
+        sparkline_view(600),
+        measure("redesenho 600s", sparkline_redraw),
+        measure("hover 5 botões", hover),
+        measure("recolher+expandir", toggle),
+    ]
+
+    windows = 0
+    pending = [root]
+    while pending:
+        widget = pending.pop()
+        windows += 1
+        pending.extend(widget.winfo_children())
+
+    print("RESULT " + json.dumps({"renderer": renderer, "windows": windows, "ops": results}))
+    root.destroy()
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    if len(sys.argv) > 2 and sys.argv[2].startswith("--child="):
+        run_child(sys.argv[2].split("=", 1)[1], repeats)
+        return
+
+    xvfb = start_xvfb(DISPLAY)
+    try:
+        for renderer in RENDERERS:
+            proc = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), str(repeats), f"--child={renderer}"],
+                cwd=REPO_DIR, capture_output=True, text=True
+            )
+            lines = [l for l in proc.stdout.splitlines() if l.startswith("RESULT ")]
+            if not lines:
+                print(f"❌ {renderer} falhou:\n{proc.stderr[-2000:]}")
+                continue
+
+            result = json.loads(lines[-1][len("RESULT "):])
+            print(f"== {renderer}: {result['windows']} widgets/janelas X")
+            for op in result["ops"]:
+                print(f"   {op['name']:<18} {op['requests']:6.1f} req X/op  "
+                      f"p50 {op['p50_ms']:.3f} ms  p99 {op['p99_ms']:.3f} ms")
+    finally:
+        xvfb.terminate()
+
+
+if __name__ == "__main__":
+    main()
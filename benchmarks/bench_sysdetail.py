@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: custo por tique da amostra em lote (núcleos, disco, rede)
+
+Gera /proc/stat, /proc/diskstats e /proc/net/dev sintéticos com N núcleos e
+M interfaces e mede o tique completo do amostrador (leituras + deltas) com e
+sem os detalhes, mais o psutil e o /proc reais da máquina. Não precisa de X.
+
+Uso: python3 benchmarks/bench_sysdetail.py [tiques]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from xvfb import REPO_DIR  # noqa: F401 (coloca o repositório no sys.path)
+
+from cores_metrics import MetricsSampler
+from cores_procstats import ProcStatsReader, PsutilStats
+
+SIZES = [(4, 2), (16, 4), (64, 8), (256, 32)]  # (núcleos, interfaces)
+DISKS = 4
+
+
+def write_fake_proc(directory, cores, interfaces):
+    """Arquivos no formato do kernel (valores fixos: só o custo importa)"""
+    cpu = "{} 1000 20 300 50000 40 0 10 0 0 0\n"
+    with open(os.path.join(directory, "stat"), "w") as f:
+        f.write(cpu.format("cpu "))
+        for i in range(cores):
+            f.write(cpu.format(f"cpu{i}"))
+        # "intr" tem uma coluna por IRQ: costuma ser a maior linha do arquivo
+        f.write("intr 123456 " + " ".join("0" for _ in range(cores * 16)) + "\n")
+        f.write("ctxt 987654\nbtime 1700000000\nprocesses 4321\n"
+                "procs_running 2\nprocs_blocked 0\nsoftirq 1 2 3 4 5 6 7 8 9 10 11\n")
+
+    block_dir = os.path.join(directory, "block")
+    os.makedirs(block_dir, exist_ok=True)
+    with open(os.path.join(directory, "diskstats"), "w") as f:
+        for i in range(DISKS):
+            name = f"sd{chr(ord('a') + i)}"
+            os.makedirs(os.path.join(block_dir, name), exist_ok=True)
+            for part in ("", "1", "2"):
+                f.write(f"   8  {i * 16}  {name}{part} 1000 10 80000 500 2000 20 160000 900 "
+                        "0 1200 1400 0 0 0 0 0 0\n")
+        for i in range(8):
+            f.write(f"   7  {i} loop{i} 10 0 80 1 0 0 0 0 0 1 1 0 0 0 0 0 0\n")
+
+    with open(os.path.join(directory, "net_dev"), "w") as f:
+        f.write("Inter-|   Receive                            "
+                "                    |  Transmit\n")
+        f.write(" face |bytes    packets errs drop fifo frame compressed multicast"
+                "|bytes    packets errs drop fifo colls carrier compressed\n")
+        f.write("    lo: 1000 10 0 0 0 0 0 0 1000 10 0 0 0 0 0 0\n")
+        for i in range(interfaces):
+            f.write(f"  eth{i}: 123456789 98765 0 0 0 0 0 0 987654321 56789 0 0 0 0 0 0\n")
+
+    return dict(
+        stat_path=os.path.join(directory, "stat"),
+        meminfo_path="/proc/meminfo",
+        diskstats_path=os.path.join(directory, "diskstats"),
+        netdev_path=os.path.join(directory, "net_dev"),
+        block_dir=block_dir,
+    )
+
+
+def measure(sampler, ticks):
+    """µs por tique de sample_now()"""
+    sampler.sample_now()
+    start = time.perf_counter()
+    for _ in range(ticks):
+        sampler.sample_now()
+    return (time.perf_counter() - start) / ticks * 1e6
+
+
+def run(name, backend, ticks, cores=None, interfaces=None):
+    light = MetricsSampler(interval=None, history=ticks + 1, backend=backend)
+    base = measure(light, ticks)
+
+    detailed = MetricsSampler(interval=None, history=ticks + 1, backend=backend)
+    detailed.set_detailed(True)
+    full = measure(detailed, ticks)
+
+    detail = detailed.detail
+    cores = len(detail.cores) if cores is None else cores
+    interfaces = len(detail.net) if interfaces is None else interfaces
+    print(f"{name:8s} {cores:5d} núcleos {interfaces:3d} ifaces: "
+          f"cpu/ram/swap {base:8.1f} µs  +detalhes {full:8.1f} µs  "
+          f"({full / base:4.1f}x, {(full - base) / max(cores, 1):5.2f} µs/núcleo)")
+    backend.close()
+
+
+def main():
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    with tempfile.TemporaryDirectory() as directory:
+        for cores, interfaces in SIZES:
+            paths = write_fake_proc(directory, cores, interfaces)
+            run("proc", ProcStatsReader(**paths), ticks, cores, interfaces)
+
+    print("-- máquina atual")
+    run("proc", ProcStatsReader(), ticks)
+    run("psutil", PsutilStats(), max(1, ticks // 10))
+
+
+if __name__ == "__main__":
+    main()
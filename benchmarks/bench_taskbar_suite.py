@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Benchmark: task.py x cores_floating_taskbar.py sob Xvfb
+
+Cada variante roda num processo próprio, com um roteiro de
+toggle_expansion, move_to_next_corner e toggle_visibility executado
+dentro do loop do Tk. Mede:
+
+- intervalo entre quadros (cada escrita de geometria/alpha na janela)
+- latência do comando até a janela assentar (última escrita)
+- CPU ociosa por minuto (recolhida e expandida) e RSS ao longo do tempo
+
+Uso: python3 benchmarks/bench_taskbar_suite.py [--cycles N] [--idle S] [--variants task,cores_floating_taskbar]
+"""
+
+import argparse
+import importlib
+import json
+import os
+import subprocess
+import sys
+import time
+
+from xvfb import REPO_DIR, percentile, rss_kb, start_xvfb
+
+VARIANTS = ["task", "cores_floating_taskbar"]
+
+# Janela sem escritas por este tempo (e sem animação ativa) = assentada
+SETTLE_QUIET = 0.15
+SETTLE_TIMEOUT = 5.0
+
+# Acima de dois quadros a 60 fps conta como quadro perdido
+FRAME_BUDGET_MS = 2 * 1000 / 60
+
+
+class WindowProbe:
+    """Registra o instante de cada escrita visível na janela raiz"""
+
+    def __init__(self, root):
+        self.root = root
+        self.writes = []
+        for name in ("geometry", "wm_geometry", "attributes", "wm_attributes",
+                     "withdraw", "deiconify"):
+            self._wrap(name)
+
+    def _wrap(self, name):
+        original = getattr(self.root, name)
+        min_args = 2 if name.endswith("attributes") else 1
+
+        def wrapper(*args, **kwargs):
+            # Só escritas contam (geometry()/attributes('-alpha') sem valor são leituras)
+            if name in ("withdraw", "deiconify") or len(args) >= min_args:
+                self.writes.append(time.perf_counter())
+            return original(*args, **kwargs)
+
+        setattr(self.root, name, wrapper)
+
+
+def make_taskbar(module):
+    """Instanciar a variante sem atalhos globais (não disputar o teclado do Xvfb)"""
+    base = module.CoresFloatingTaskbar
+
+    class BenchTaskbar(base):
+        def setup_hotkeys(self):
+            self.hotkey_running = True
+
+    return BenchTaskbar()
+
+
+def is_busy(taskbar):
+    """Animação em andamento (thread da task.py ou Animator)"""
+    animator = getattr(taskbar, "animator", None)
+    return getattr(taskbar, "animation_running", False) or bool(animator and animator.running)
+
+
+def cpu_seconds():
+    times = os.times()
+    return times.user + times.system
+
+
+def run_child(variant, cycles, idle):
+    """Roteiro dentro do processo da variante; resultado em JSON no stdout"""
+    module = importlib.import_module(variant)
+    taskbar = make_taskbar(module)
+    root = taskbar.root
+    probe = WindowProbe(root)
+
+    script = []
+    for _ in range(cycles):
+        script += ["toggle_expansion", "toggle_expansion"]
+        script += ["move_to_next_corner"] * 4
+        script += ["toggle_visibility", "toggle_visibility"]
+
+    result = {"variant": variant, "actions": {}, "frames": [], "idle": {}, "rss": []}
+    state = {"step": 0, "start": 0.0, "first_write": 0}
+
+    def record(name, latency_ms, frames):
+        stats = result["actions"].setdefault(name, [])
+        stats.append(latency_ms)
+        result["frames"] += frames
+
+    def next_action():
+        if state["step"] >= len(script):
+            root.after(0, start_idle, "collapsed")
+            return
+
+        state["first_write"] = len(probe.writes)
+        state["start"] = time.perf_counter()
+        getattr(taskbar, script[state["step"]])()
+        root.after(5, wait_settled)
+
+    def wait_settled():
+        now = time.perf_counter()
+        writes = probe.writes[state["first_write"]:]
+        last = writes[-1] if writes else state["start"]
+
+        timed_out = now - state["start"] > SETTLE_TIMEOUT
+        if not timed_out and (is_busy(taskbar) or now - last < SETTLE_QUIET):
+            root.after(5, wait_settled)
+            return
+
+        frames = [(b - a) * 1000 for a, b in zip(writes, writes[1:])]
+        record(script[state["step"]], (last - state["start"]) * 1000, frames)
+        state["step"] += 1
+        root.after(50, next_action)
+
+    def start_idle(mode):
+        if mode == "expanded":
+            taskbar.toggle_expansion()
+        root.after(1000, measure_idle, mode, cpu_seconds(), time.perf_counter(), 0)
+
+    def measure_idle(mode, cpu_start, t_start, seconds):
+        if seconds < idle:
+            result["rss"].append([mode, seconds, rss_kb()])
+            root.after(1000, measure_idle, mode, cpu_start, t_start, seconds + 1)
+            return
+
+        elapsed = time.perf_counter() - t_start
+        result["idle"][mode] = (cpu_seconds() - cpu_start) / elapsed * 60 * 1000
+        if mode == "collapsed":
+            start_idle("expanded")
+        else:
+            root.quit()
+
+    # Aguardar primeira pintura e etapas de inicialização adiadas
+    root.after(3000, next_action)
+    root.mainloop()
+
+    print("RESULT " + json.dumps(result))
+    os._exit(0)  # threads daemon da task.py não seguram o processo
+
+
+def summarize(result):
+    """Linhas da tabela de uma variante"""
+    lines = [f"== {result['variant']}"]
+    for name, values in result["actions"].items():
+        values.sort()
+        lines.append(f"   {name:<20} assentar p50 {percentile(values, 50):7.1f} ms  "
+                     f"p99 {percentile(values, 99):7.1f} ms")
+
+    frames = sorted(result["frames"])
+    if frames:
+        dropped = sum(1 for f in frames if f > FRAME_BUDGET_MS)
+        lines.append(f"   quadros: {len(frames)}  intervalo p50 {percentile(frames, 50):.1f} ms  "
+                     f"p99 {percentile(frames, 99):.1f} ms  max {frames[-1]:.1f} ms  "
+                     f"perdidos {dropped}")
+
+    for mode, cpu_ms in result["idle"].items():
+        rss = [kb for m, _, kb in result["rss"] if m == mode]
+        lines.append(f"   ociosa {mode:<10} CPU {cpu_ms:7.1f} ms/min  "
+                     f"RSS {min(rss)}-{max(rss)} KiB")
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cycles", type=int, default=10)
+    parser.add_argument("--idle", type=int, default=60, help="segundos ociosos por estado")
+    parser.add_argument("--variants", default=",".join(VARIANTS))
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.cycles, args.idle)
+        return
+
+    xvfb = start_xvfb()
+    try:
+        results = []
+        for variant in args.variants.split(","):
+            proc = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--child", variant,
+                 "--cycles", str(args.cycles), "--idle", str(args.idle)],
+                cwd=REPO_DIR, capture_output=True, text=True
+            )
+            lines = [l for l in proc.stdout.splitlines() if l.startswith("RESULT ")]
+            if not lines:
+                print(f"❌ {variant} falhou:\n{proc.stderr[-2000:]}")
+                continue
+            results.append(json.loads(lines[-1][len("RESULT "):]))
+
+        for result in results:
+            print("\n".join(summarize(result)))
+    finally:
+        xvfb.terminate()
+
+
+if __name__ == "__main__":
+    main()
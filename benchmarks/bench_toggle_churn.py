@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark: custo de alternar a interface expandida/recolhida
+
+Mede a latência de cada troca de interface (até o Tk processar o layout)
+e o crescimento de RSS ao longo de milhares de ciclos. Funciona tanto com
+a árvore persistente (show_*_interface) quanto com a versão antiga que
+destrói/recria widgets (create_*_interface), para comparar antes/depois:
+
+    python3 benchmarks/bench_toggle_churn.py [ciclos]
+    git stash; git checkout <commit antigo> -- cores_floating_taskbar.py; ...
+"""
+
+import gc
+import statistics
+import sys
+import time
+
+from xvfb import BenchTaskbar, percentile, rss_kb, start_xvfb
+
+
+def main():
+    cycles = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    xvfb = start_xvfb()
+
+    try:
+        taskbar = BenchTaskbar()
+        root = taskbar.root
+        root.update()
+
+        if hasattr(taskbar, "show_expanded_interface"):
+            expand = taskbar.show_expanded_interface
+            collapse = taskbar.show_square_interface
+            mode = "árvore persistente"
+        else:
+            expand = taskbar.create_expanded_interface
+            collapse = taskbar.create_square_interface
+            mode = "destruir/recriar"
+
+        samples = []
+        rss_start = rss_kb()
+        rss_points = []
+
+        for i in range(cycles):
+            for action in (expand, collapse):
+                start = time.perf_counter()
+                action()
+                root.update_idletasks()
+                samples.append((time.perf_counter() - start) * 1000)
+
+            if i % 500 == 0:
+                gc.collect()
+                rss_points.append((i, rss_kb()))
+
+        gc.collect()
+        rss_end = rss_kb()
+        root.destroy()
+
+        samples.sort()
+        print(f"Modo: {mode}, {cycles} ciclos")
+        print(f"Troca média: {statistics.mean(samples):.3f} ms")
+        print(f"Troca p50:   {percentile(samples, 50):.3f} ms")
+        print(f"Troca p99:   {percentile(samples, 99):.3f} ms")
+        print(f"RSS: {rss_start} KiB -> {rss_end} KiB (+{rss_end - rss_start} KiB)")
+        for cycle, rss in rss_points:
+            print(f"   ciclo {cycle:6d}: {rss} KiB")
+    finally:
+        xvfb.terminate()
+
+
+if __name__ == "__main__":
+    main()
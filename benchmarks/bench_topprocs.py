@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: tabela de processos incremental x varredura completa
+
+Para tabelas de tamanhos crescentes (processos extras dormindo) mede o tique
+de ProcessTable.refresh() contra psutil.process_iter() lendo nome, linha de
+comando, tempos de CPU e RSS de todos os processos a cada tique. Não precisa
+de X.
+
+Uso: python3 benchmarks/bench_topprocs.py [tiques]
+"""
+
+import subprocess
+import sys
+import time
+
+from xvfb import REPO_DIR  # noqa: F401 (coloca o repositório no sys.path)
+
+import psutil
+
+from cores_topprocs import ProcessTable
+
+EXTRA_PROCESSES = [0, 200, 1000]
+FULL_ATTRS = ["name", "cmdline", "cpu_times", "memory_info"]
+
+
+def full_walk():
+    """Abordagem ingênua: tudo de todos os processos a cada tique"""
+    return [p.info for p in psutil.process_iter(FULL_ATTRS)]
+
+
+def measure(tick, ticks):
+    tick()  # aquecimento (primeira leitura completa)
+    start = time.perf_counter()
+    for _ in range(ticks):
+        tick()
+    return (time.perf_counter() - start) / ticks * 1000
+
+
+def main():
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    children = []
+
+    try:
+        for extra in EXTRA_PROCESSES:
+            while len(children) < extra:
+                children.append(subprocess.Popen(["sleep", "600"]))
+
+            table = ProcessTable()
+            incremental = measure(table.refresh, ticks)
+            full = measure(full_walk, ticks)
+            count = len(table.entries)
+            print(f"{count:5d} processos: incremental {incremental:7.2f} ms/tique "
+                  f"({incremental * 1000 / count:5.1f} µs/proc)  "
+                  f"varredura completa {full:7.2f} ms/tique  ({full / incremental:4.1f}x)")
+
+        # Primeiro tique depois de reabrir: cache mantido, só PIDs novos lidos por inteiro
+        table.pause()
+        start = time.perf_counter()
+        table.refresh()
+        print(f"reabertura com cache: {(time.perf_counter() - start) * 1000:.2f} ms "
+              f"(novos {table.stats['new']}, saíram {table.stats['gone']})")
+    finally:
+        for child in children:
+            child.kill()
+            child.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Utilitário comum dos benchmarks: Xvfb dedicado e caminho do repositório
+"""
+
+import ctypes
+import ctypes.util
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if REPO_DIR not in sys.path:
+    sys.path.insert(0, REPO_DIR)
+
+
+def __getattr__(name):
+    """BenchTaskbar sob demanda: benchmarks sem interface não carregam o Tk"""
+    if name != "BenchTaskbar":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import cores_floating_taskbar
+
+    class BenchTaskbar(cores_floating_taskbar.CoresFloatingTaskbar):
+        """Taskbar sem atalhos globais nem monitoramento (só a interface)"""
+
+        def setup_hotkeys(self):
+            pass
+
+        def start_monitoring(self):
+            pass
+
+    globals()[name] = BenchTaskbar
+    return BenchTaskbar
+
+
+def start_xvfb(display=":97", size="1280x800x24"):
+    """Iniciar Xvfb e exportar DISPLAY (devolve o processo)"""
+    if not shutil.which("Xvfb"):
+        sys.exit("Xvfb não encontrado")
+
+    proc = subprocess.Popen(["Xvfb", display, "-screen", "0", size],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    for _ in range(50):
+        if os.path.exists(f"/tmp/.X11-unix/X{display[1:]}"):
+            break
+        time.sleep(0.1)
+
+    os.environ["DISPLAY"] = display
+    return proc
+
+
+def load_xtest():
+    """libXtst com protótipos (Display* vai como ponteiro, não int de 32 bits)"""
+    path = ctypes.util.find_library("Xtst") or "libXtst.so.6"
+    try:
+        xtst = ctypes.CDLL(path)
+    except OSError:
+        sys.exit("libXtst não encontrada")
+
+    xtst.XTestFakeKeyEvent.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.c_int, ctypes.c_ulong]
+    xtst.XTestFakeButtonEvent.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.c_int, ctypes.c_ulong]
+    # (display, tela, x, y, atraso)
+    xtst.XTestFakeMotionEvent.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_int,
+                                          ctypes.c_int, ctypes.c_ulong]
+    return xtst
+
+
+def rss_kb(pid=None):
+    """RSS atual do processo em KiB (lido de /proc)"""
+    with open(f"/proc/{pid or os.getpid()}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+def percentile(values, pct):
+    """Percentil simples de uma lista já ordenada"""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, max(0, int(round(len(values) * pct / 100)) - 1))
+    return values[index]
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Core S Animation
+Animações no loop do Tk com easing baseado no tempo decorrido
+"""
+
+import math
+import time
+
+
+def linear(t):
+    return t
+
+
+def ease_in_cubic(t):
+    return t * t * t
+
+
+def ease_out_cubic(t):
+    return 1 - (1 - t) ** 3
+
+
+def ease_in_out_quad(t):
+    return 2 * t * t if t < 0.5 else 1 - (-2 * t + 2) ** 2 / 2
+
+
+EASINGS = {
+    "linear": linear,
+    "ease_in_cubic": ease_in_cubic,
+    "ease_out_cubic": ease_out_cubic,
+    "ease_in_out_quad": ease_in_out_quad,
+}
+
+
+class WindowState:
+    """Geometria e alpha atuais da janela (sem consultar o X a cada quadro)"""
+
+    PROPERTIES = ("width", "height", "x", "y", "alpha")
+
+    def __init__(self, window, width, height, x, y, alpha=1.0):
+        self.window = window
+        self.width = width
+        self.height = height
+        self.x = x
+        self.y = y
+        self.alpha = alpha
+        self._applied_geometry = None
+        self._applied_alpha = None
+
+    def set(self, **values):
+        """Atualizar propriedades e aplicar na janela"""
+        for name, value in values.items():
+            setattr(self, name, value)
+        self.apply()
+
+    def apply(self):
+        """Enviar ao Tk só o que mudou"""
+        geometry = f"{int(round(self.width))}x{int(round(self.height))}+{int(round(self.x))}+{int(round(self.y))}"
+        if geometry != self._applied_geometry:
+            self.window.geometry(geometry)
+            self._applied_geometry = geometry
+
+        alpha = round(self.alpha, 3)
+        if alpha != self._applied_alpha:
+            self.window.attributes('-alpha', alpha)
+            self._applied_alpha = alpha
+
+
+class Animation:
+    """Transição de uma ou mais propriedades de um WindowState"""
+
+    def __init__(self, state, targets, duration, easing, on_done):
+        self.state = state
+        self.tracks = {name: (getattr(state, name), end) for name, end in targets.items()}
+        self.duration = max(duration, 0.0)
+        self.easing = EASINGS[easing] if isinstance(easing, str) else easing
+        self.on_done = on_done
+        self.start_time = time.monotonic()
+        self.frames = 0
+
+    def step(self, now):
+        """Aplicar o quadro correspondente a `now` (True quando terminou)"""
+        if self.duration:
+            progress = min(1.0, (now - self.start_time) / self.duration)
+        else:
+            progress = 1.0
+
+        eased = self.easing(progress)
+        for name, (start, end) in self.tracks.items():
+            setattr(self.state, name, start + (end - start) * eased)
+
+        self.frames += 1
+        return progress >= 1.0
+
+
+class Animator:
+    """Agendador de animações via root.after (thread do Tk)"""
+
+    def __init__(self, root, fps=60):
+        self.root = root
+        self.fps = fps
+        self.animations = []
+        self._after_id = None
+        self._epoch = None
+
+    @property
+    def running(self):
+        return bool(self.animations)
+
+    def animate_window(self, state, duration, easing="ease_out_cubic", on_done=None, **targets):
+        """Animar width/height/x/y/alpha de uma janela até os valores dados"""
+        for name in targets:
+            if name not in WindowState.PROPERTIES:
+                raise ValueError(f"Propriedade não animável: {name}")
+
+        # Nova animação assume as propriedades que já estavam animando
+        for animation in list(self.animations):
+            if animation.state is state:
+                for name in targets:
+                    animation.tracks.pop(name, None)
+                if not animation.tracks:
+                    self.animations.remove(animation)
+
+        animation = Animation(state, targets, duration, easing, on_done)
+        self.animations.append(animation)
+
+        if self._after_id is None:
+            self._epoch = animation.start_time
+            self._after_id = self.root.after_idle(self._tick)
+
+        return animation
+
+    def cancel(self, animation):
+        """Cancelar sem chamar on_done"""
+        if animation in self.animations:
+            self.animations.remove(animation)
+
+    def cancel_all(self):
+        """Cancelar todas as animações"""
+        self.animations.clear()
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _tick(self):
+        """Calcular e aplicar um quadro de todas as animações"""
+        self._after_id = None
+        now = time.monotonic()
+
+        finished = []
+        touched = set()
+        for animation in list(self.animations):
+            if animation.step(now):
+                self.animations.remove(animation)
+                finished.append(animation)
+            touched.add(animation.state)
+
+        for state in touched:
+            state.apply()
+
+        for animation in finished:
+            if animation.on_done:
+                animation.on_done()
+
+        if self.animations and self._after_id is None:
+            # Próximo quadro alinhado ao relógio; quadros atrasados são pulados
+            interval = 1.0 / self.fps
+            elapsed = time.monotonic() - self._epoch
+            next_frame = self._epoch + math.floor(elapsed / interval + 1) * interval
+            delay = max(1, math.ceil((next_frame - time.monotonic()) * 1000))
+            self._after_id = self.root.after(delay, self._tick)
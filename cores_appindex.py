@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Core S App Index
+Catálogo de aplicativos (.desktop) com cache em disco por mtime de diretório
+"""
+
+import json
+import os
+import re
+import threading
+from collections import namedtuple
+
+# Entrada indexada (campos usados pela taskbar)
+AppEntry = namedtuple("AppEntry", ["id", "name", "generic_name", "exec", "icon", "terminal", "keywords"])
+
+CACHE_VERSION = 1
+
+# Códigos de campo do Exec (%f, %U, ...) não fazem sentido ao lançar pela taskbar
+FIELD_CODE_RE = re.compile(r"\s*%[fFuUdDnNickvm]")
+
+DIRECTORIES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "directories.json")
+
+
+def application_dirs(directories_file=DIRECTORIES_FILE):
+    """Diretórios XDG de aplicativos + extras de directories.json (em ordem de prioridade)"""
+    data_home = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+    data_dirs = os.environ.get("XDG_DATA_DIRS") or "/usr/local/share:/usr/share"
+
+    dirs = [os.path.join(data_home, "applications")]
+    dirs += [os.path.join(d, "applications") for d in data_dirs.split(":") if d]
+
+    try:
+        with open(directories_file) as f:
+            extra = json.load(f).get("dicts", [])
+        dirs += [os.path.expanduser(d) for d in extra if d]
+    except (OSError, ValueError):
+        pass
+
+    # Sem duplicatas, mantendo a ordem
+    seen = set()
+    return [d for d in dirs if not (d in seen or seen.add(d))]
+
+
+def parse_desktop_file(path, desktop_id):
+    """Ler a seção [Desktop Entry] (None se não for um app exibível)"""
+    fields = {}
+    in_entry = False
+
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                line = line.strip()
+                if line.startswith("["):
+                    if in_entry:
+                        break
+                    in_entry = line == "[Desktop Entry]"
+                    continue
+
+                if not in_entry or "=" not in line or line.startswith("#"):
+                    continue
+
+                key, value = line.split("=", 1)
+                key = key.strip()
+                if key in ("Type", "Name", "GenericName", "Exec", "Icon",
+                           "Terminal", "NoDisplay", "Hidden", "Keywords"):
+                    fields[key] = value.strip()
+    except OSError:
+        return None
+
+    if (fields.get("Type") != "Application" or "Exec" not in fields or "Name" not in fields
+            or fields.get("NoDisplay") == "true" or fields.get("Hidden") == "true"):
+        return None
+
+    return AppEntry(
+        desktop_id,
+        fields["Name"],
+        fields.get("GenericName", ""),
+        FIELD_CODE_RE.sub("", fields["Exec"]).strip(),
+        fields.get("Icon", ""),
+        fields.get("Terminal") == "true",
+        fields.get("Keywords", "")
+    )
+
+
+def dir_signature(directory):
+    """mtimes do diretório e subdiretórios (mudam ao criar/remover arquivos)"""
+    signature = []
+    for current, subdirs, _ in os.walk(directory):
+        subdirs.sort()
+        signature.append(os.stat(current).st_mtime_ns)
+    return signature
+
+
+def scan_directory(directory):
+    """Indexar todos os .desktop de um diretório"""
+    entries = []
+    for current, subdirs, files in os.walk(directory):
+        subdirs.sort()
+        prefix = os.path.relpath(current, directory)
+        for filename in sorted(files):
+            if not filename.endswith(".desktop"):
+                continue
+
+            # ID XDG: caminho relativo com "/" trocado por "-"
+            relative = filename if prefix == "." else os.path.join(prefix, filename)
+            entry = parse_desktop_file(os.path.join(current, filename), relative.replace(os.sep, "-"))
+            if entry:
+                entries.append(entry)
+    return entries
+
+
+class AppIndex:
+    """Índice de aplicativos com cache incremental"""
+
+    def __init__(self, cache_path=None, dirs=None):
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+        self.cache_path = cache_path or os.path.join(cache_home, "cores-taskbar", "apps.json")
+        self.dirs = dirs
+        self.entries = []   # publicado de uma vez quando o índice fica pronto
+        self.ready = False
+        self.stats = {"cached_dirs": 0, "scanned_dirs": 0}
+
+    def load_async(self, on_ready=None):
+        """Construir índice em segundo plano (não atrasa a primeira pintura)"""
+        def worker():
+            try:
+                self.load()
+            except Exception as e:
+                print(f"Erro ao indexar aplicativos: {e}")
+            if on_ready:
+                on_ready()
+
+        thread = threading.Thread(target=worker, name="cores-appindex", daemon=True)
+        thread.start()
+        return thread
+
+    def load(self):
+        """Carregar cache e re-indexar só diretórios alterados"""
+        cache = self._read_cache()
+        cached_dirs = cache.get("dirs", {}) if cache.get("version") == CACHE_VERSION else {}
+
+        new_cache = {}
+        entries = []
+        seen_ids = set()
+        self.stats = {"cached_dirs": 0, "scanned_dirs": 0}
+
+        for directory in (self.dirs or application_dirs()):
+            if not os.path.isdir(directory):
+                continue
+
+            signature = dir_signature(directory)
+            cached = cached_dirs.get(directory)
+            if cached and cached["mtimes"] == signature:
+                dir_entries = [AppEntry(*row) for row in cached["entries"]]
+                self.stats["cached_dirs"] += 1
+            else:
+                dir_entries = scan_directory(directory)
+                self.stats["scanned_dirs"] += 1
+
+            new_cache[directory] = {"mtimes": signature, "entries": [list(e) for e in dir_entries]}
+
+            # Diretórios anteriores têm prioridade (mesmo ID)
+            for entry in dir_entries:
+                if entry.id not in seen_ids:
+                    seen_ids.add(entry.id)
+                    entries.append(entry)
+
+        entries.sort(key=lambda e: e.name.lower())
+
+        if new_cache != cached_dirs:
+            self._write_cache({"version": CACHE_VERSION, "dirs": new_cache})
+
+        self.entries = entries
+        self.ready = True
+        return entries
+
+    def _read_cache(self):
+        try:
+            with open(self.cache_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_cache(self, data):
+        """Gravar cache de forma atômica"""
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            tmp_path = f"{self.cache_path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            print(f"Erro ao gravar cache de aplicativos: {e}")
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Core S App Search
+Busca incremental de aplicativos (índice por inicial + refinamento por tecla)
+"""
+
+import heapq
+import json
+import os
+import re
+from collections import defaultdict
+
+# Níveis de relevância do casamento
+MATCH_NAME_PREFIX = 3   # nome começa com a busca
+MATCH_WORD_PREFIX = 2   # alguma palavra começa com cada termo
+MATCH_FUZZY = 1         # termo é subsequência a partir do início de uma palavra
+
+
+def compile_term(term):
+    """Padrões (início de palavra, subsequência) de um termo da busca"""
+    escaped = [re.escape(c) for c in term]
+    word_prefix = re.compile(r"(?:^| )" + "".join(escaped))
+    fuzzy = re.compile(r"(?:^| )" + escaped[0] + "".join(".*?" + c for c in escaped[1:]))
+    return word_prefix, fuzzy
+
+
+class UsageStats:
+    """Contagem de lançamentos por aplicativo (persistida em disco)"""
+
+    def __init__(self, path=None):
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+        self.path = path or os.path.join(cache_home, "cores-taskbar", "usage.json")
+        try:
+            with open(self.path) as f:
+                self.counts = json.load(f)
+        except (OSError, ValueError):
+            self.counts = {}
+
+    def get(self, app_id):
+        return self.counts.get(app_id, 0)
+
+    def record(self, app_id):
+        """Registrar lançamento e gravar"""
+        self.counts[app_id] = self.counts.get(app_id, 0) + 1
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(self.counts, f, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+
+
+class AppSearch:
+    """Busca incremental sobre as entradas do AppIndex"""
+
+    def __init__(self, entries, usage=None, limit=8):
+        self.entries = entries
+        self.usage = usage
+        self.limit = limit
+
+        # Pré-processamento único: textos normalizados e índice por inicial de palavra
+        self.names = []
+        self.haystacks = []
+        self.initial_index = defaultdict(list)
+
+        for i, entry in enumerate(entries):
+            name = entry.name.lower()
+            parts = [name, entry.generic_name.lower(), entry.keywords.lower().replace(";", " "),
+                     os.path.basename(entry.exec.split(" ", 1)[0]).lower()]
+            haystack = " ".join(p for p in parts if p)
+
+            self.names.append(name)
+            self.haystacks.append(haystack)
+
+            for initial in {word[0] for word in haystack.split()}:
+                self.initial_index[initial].append(i)
+
+        # Parte fixa da ordenação: uso (mais lançados primeiro), depois nome curto
+        self.static_scores = [self._static_score(i) for i in range(len(entries))]
+
+        self._initial_matches = {}  # primeira tecla: resultado pré-calculado por inicial
+        self._last_query = ""
+        self._last_matches = None  # {índice: nível} da busca anterior
+
+    def search(self, query):
+        """Resultados ordenados para a busca (refina a anterior quando possível)"""
+        query = " ".join(query.lower().split())
+        if not query:
+            self._last_query = ""
+            self._last_matches = None
+            return []
+
+        if len(query) == 1:
+            matches = self._match_initial(query)
+        else:
+            if self._last_matches is not None and query.startswith(self._last_query):
+                # Busca mais longa: só pode casar com o que já casava
+                candidates = self._last_matches
+            else:
+                candidates = self._match_initial(query[0])
+
+            matches = self._match_all(candidates, query)
+
+        self._last_query = query
+        self._last_matches = matches
+        return self._rank(matches)
+
+    def _match_initial(self, char):
+        """Busca de um caractere: toda entrada com palavra iniciada por ele"""
+        matches = self._initial_matches.get(char)
+        if matches is None:
+            matches = {
+                i: MATCH_NAME_PREFIX if self.names[i].startswith(char) else MATCH_WORD_PREFIX
+                for i in self.initial_index.get(char, ())
+            }
+            self._initial_matches[char] = matches
+        return matches
+
+    def _match_all(self, candidates, query):
+        """Filtrar candidatos calculando o nível de cada um"""
+        names = self.names
+        haystacks = self.haystacks
+        patterns = [compile_term(t) for t in query.split(" ")]
+        matches = {}
+
+        if len(patterns) == 1:
+            # Caso comum (um termo): laço sem geradores
+            word_prefix, fuzzy = patterns[0]
+            for i in candidates:
+                haystack = haystacks[i]
+                if names[i].startswith(query):
+                    matches[i] = MATCH_NAME_PREFIX
+                elif word_prefix.search(haystack):
+                    matches[i] = MATCH_WORD_PREFIX
+                elif fuzzy.search(haystack):
+                    matches[i] = MATCH_FUZZY
+            return matches
+
+        for i in candidates:
+            haystack = haystacks[i]
+            if names[i].startswith(query):
+                matches[i] = MATCH_NAME_PREFIX
+            elif all(word_prefix.search(haystack) for word_prefix, _ in patterns):
+                matches[i] = MATCH_WORD_PREFIX
+            # Subsequência a partir do início de uma palavra ("scrn" -> "screenshot")
+            elif all(fuzzy.search(haystack) for _, fuzzy in patterns):
+                matches[i] = MATCH_FUZZY
+        return matches
+
+    def _static_score(self, i):
+        count = self.usage.get(self.entries[i].id) if self.usage else 0
+        return count * 1000 - min(len(self.names[i]), 999)
+
+    def record_launch(self, entry):
+        """Registrar lançamento (afeta a ordenação das próximas buscas)"""
+        if self.usage:
+            self.usage.record(entry.id)
+        for i, candidate in enumerate(self.entries):
+            if candidate.id == entry.id:
+                self.static_scores[i] = self._static_score(i)
+
+    def _rank(self, matches):
+        """Top N por nível, depois frequência de uso, depois nome"""
+        scores = self.static_scores
+        scored = [(level, scores[i], -i) for i, level in matches.items()]
+        return [self.entries[-i] for _, _, i in heapq.nlargest(self.limit, scored)]
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Core S Canvas Bar
+Renderizador opcional: a barra inteira num único tk.Canvas (itens em vez de
+Frames/Labels/Buttons), hover por teste de posição em vez de <Enter>/<Leave>
+"""
+
+import tkinter as tk
+
+
+class CanvasItem:
+    """Item do canvas com a interface mínima de um Label (configure/place)"""
+
+    def __init__(self, canvas, item):
+        self.canvas = canvas
+        self.item = item
+
+    def configure(self, **options):
+        self.canvas.itemconfigure(self.item, **options)
+
+    config = configure
+
+    def cget(self, option):
+        return self.canvas.itemcget(self.item, option)
+
+    def place(self, **_):
+        """Exibir (posição fixa definida na criação)"""
+        self.canvas.itemconfigure(self.item, state="normal")
+
+    def place_forget(self):
+        self.canvas.itemconfigure(self.item, state="hidden")
+
+
+class CanvasBar:
+    """Quadrado S + seção expandida desenhados num só canvas"""
+
+    def __init__(self, parent, taskbar, apps, on_app_click):
+        self.taskbar = taskbar
+        self.apps = apps
+        self.on_app_click = on_app_click
+        self.built_expanded = False
+        self.hovered = None
+        self.pressed = None
+        self.images = {}  # índice -> PhotoImage em uso (referência mantida aqui)
+
+        t = taskbar
+        self.canvas = tk.Canvas(
+            parent,
+            width=t.square_size,
+            height=t.square_size,
+            bg=t.bg_color,
+            highlightthickness=0,
+            bd=0
+        )
+        self.canvas.pack(fill=tk.BOTH, expand=True)
+
+        # Quadrado S
+        self.canvas.create_text(
+            t.square_size // 2, t.square_size // 2,
+            text="S", font=("Ubuntu", 24, "bold"), fill=t.accent_color
+        )
+        self.indicator = CanvasItem(self.canvas, self.canvas.create_text(
+            45, 45, anchor="nw", font=("Arial", 8), fill=t.accent_color,
+            text=""
+        ))
+        self.badge = CanvasItem(self.canvas, self.canvas.create_text(
+            52, 2, anchor="nw", text="●", font=("Arial", 9), fill="#f0b429", state="hidden"
+        ))
+
+        # Geometria dos botões (teste de posição aritmético, sem find_overlapping)
+        self.button_x0 = t.square_size + 7
+        self.button_y0 = 28
+        self.button_width = t.icon_size + 12
+        self.button_height = t.icon_size + 10
+        self.button_gap = 2
+
+        # Gráficos entre o texto de CPU/RAM e o relógio
+        self.sparkline_origin = (t.square_size + 137, 5)
+        # Núcleos/disco/rede abaixo dos botões: (x, y, largura)
+        self.detail_origin = (t.square_size + 7, self.button_y0 + self.button_height + 1,
+                              t.expanded_width - t.square_size - 12)
+
+    def build_expanded(self):
+        """Criar itens da seção expandida (ocultos até expandir)"""
+        if self.built_expanded:
+            return
+
+        t = self.taskbar
+        c = self.canvas
+        left = t.square_size + 2
+
+        c.create_rectangle(left, 0, t.expanded_width, t.square_size,
+                           fill=t.secondary_color, width=0, state="hidden", tags=("expanded",))
+        self.system = CanvasItem(c, c.create_text(
+            left + 5, 12, anchor="w", font=("Ubuntu Mono", 8), fill=t.accent_color,
+            text=f"CPU: {t.last_cpu:.0f}% | RAM: {t.last_ram:.0f}%", state="hidden", tags=("expanded",)
+        ))
+        self.clock = CanvasItem(c, c.create_text(
+            t.expanded_width - 5, 12, anchor="e", font=("Ubuntu Mono", 9, "bold"),
+            fill=t.text_color, text=t.last_time or "00:00:00", state="hidden", tags=("expanded",)
+        ))
+
+        self.button_rects = []
+        self.button_labels = []
+        self.button_images = []
+        for i, (icon, name, command, icon_name) in enumerate(self.apps):
+            x0, y0, x1, y1 = self.button_bounds(i)
+            self.button_rects.append(c.create_rectangle(
+                x0, y0, x1, y1, fill=t.bg_color, width=0, state="hidden", tags=("expanded",)
+            ))
+            self.button_labels.append(c.create_text(
+                (x0 + x1) // 2, (y0 + y1) // 2, text=icon, font=("Arial", 12),
+                fill=t.text_color, state="hidden", tags=("expanded", "emoji")
+            ))
+            # Ícone do tema: criado vazio, preenchido por set_app_image
+            self.button_images.append(c.create_image(
+                (x0 + x1) // 2, (y0 + y1) // 2, state="hidden", tags=("app_image",)
+            ))
+
+        c.bind('<Motion>', self._on_motion)
+        c.bind('<Leave>', lambda e: self._set_hover(None))
+        c.bind('<ButtonPress-1>', self._on_press)
+        c.bind('<ButtonRelease-1>', self._on_release)
+        self.built_expanded = True
+
+    def add_search_entry(self, entry):
+        """Campo de busca (widget real: precisa de foco e edição de texto)"""
+        x0, _, _, _ = self.button_bounds(len(self.apps))
+        width = self.taskbar.expanded_width - x0 - 5
+        self.search_window = self.canvas.create_window(
+            x0 + 2, self.button_y0 + self.button_height // 2, anchor="w",
+            window=entry, width=width, state="hidden", tags=("expanded",)
+        )
+
+    def button_bounds(self, index):
+        x0 = self.button_x0 + index * (self.button_width + self.button_gap)
+        return x0, self.button_y0, x0 + self.button_width, self.button_y0 + self.button_height
+
+    def button_at(self, x, y):
+        """Índice do botão sob (x, y) ou None"""
+        if not self.built_expanded or not self.taskbar.is_expanded:
+            return None
+        if not self.button_y0 <= y < self.button_y0 + self.button_height:
+            return None
+
+        offset = x - self.button_x0
+        index, inside = divmod(offset, self.button_width + self.button_gap)
+        if offset < 0 or inside >= self.button_width or index >= len(self.apps):
+            return None
+        return int(index)
+
+    def set_expanded(self, expanded):
+        """Exibir/ocultar itens da seção expandida (um itemconfigure por tag)"""
+        state = "normal" if expanded else "hidden"
+        self.canvas.itemconfigure("expanded", state=state)
+
+        # Botões com ícone do tema não mostram o emoji
+        if expanded:
+            for i, image in enumerate(self.button_images):
+                if i in self.images:
+                    self.canvas.itemconfigure(image, state="normal")
+                    self.canvas.itemconfigure(self.button_labels[i], state="hidden")
+        else:
+            self.canvas.itemconfigure("app_image", state="hidden")
+            self._set_hover(None)
+
+        self.indicator.configure(state="hidden" if expanded else "normal")
+
+    def set_app_image(self, index, image):
+        """Trocar emoji do botão pelo ícone do tema"""
+        self.images[index] = image
+        state = "normal" if self.taskbar.is_expanded else "hidden"
+        self.canvas.itemconfigure(self.button_images[index], image=image, state=state)
+        self.canvas.itemconfigure(self.button_labels[index], state="hidden")
+
+    def _on_motion(self, event):
+        self._set_hover(self.button_at(event.x, event.y))
+
+    def _set_hover(self, index):
+        """Realce só quando o botão sob o ponteiro muda"""
+        if index == self.hovered:
+            return
+
+        t = self.taskbar
+        if self.hovered is not None:
+            self.canvas.itemconfigure(self.button_rects[self.hovered], fill=t.bg_color)
+        if index is not None:
+            self.canvas.itemconfigure(self.button_rects[index], fill=t.accent_color)
+        self.hovered = index
+
+    def _on_press(self, event):
+        self.pressed = self.button_at(event.x, event.y)
+
+    def _on_release(self, event):
+        index = self.button_at(event.x, event.y)
+        if index is not None and index == self.pressed:
+            self.on_app_click(index)
+        self.pressed = None
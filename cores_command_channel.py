@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Core S Command Channel
+Canal de comandos local (socket Unix) da Core S Taskbar
+"""
+
+import os
+import socket
+
+# tkinter só no servidor (start): o cliente cores-taskbar-ctl não carrega o Tk
+
+# Comandos aceitos pela taskbar
+COMMANDS = ("toggle_expansion", "move_corner", "toggle_visibility", "show", "wakeup_stats",
+            "loop_stats", "next_monitor", "top_processes")
+
+
+def get_socket_path():
+    """Caminho do socket de comandos do usuário atual"""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return os.path.join(runtime_dir, "cores_taskbar.sock")
+    return f"/tmp/cores_taskbar_{os.getuid()}.sock"
+
+
+def send_command(command, path=None):
+    """Enviar comando para a taskbar em execução"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+        sock.sendto(command.encode(), path or get_socket_path())
+
+
+class CommandServer:
+    """Servidor de comandos atendido direto pelo loop do Tk"""
+
+    def __init__(self, root, handlers, path=None):
+        self.root = root
+        self.handlers = handlers
+        self.path = path or get_socket_path()
+        self.sock = None
+
+    def start(self):
+        """Abrir socket e registrar no loop de eventos"""
+        import tkinter as tk
+
+        # Socket antigo de uma execução anterior
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self.sock.bind(self.path)
+        self.sock.setblocking(False)
+        os.chmod(self.path, 0o600)
+
+        # Sem polling: o Tk acorda só quando chega um comando
+        self.root.tk.createfilehandler(self.sock, tk.READABLE, self._on_readable)
+
+    def _on_readable(self, sock, mask):
+        """Processar todos os comandos pendentes"""
+        while True:
+            try:
+                data = self.sock.recv(256)
+            except (BlockingIOError, OSError):
+                break
+
+            handler = self.handlers.get(data.decode(errors="ignore").strip())
+            if handler:
+                try:
+                    handler()
+                except Exception as e:
+                    print(f"Erro ao executar comando: {e}")
+
+    def stop(self):
+        """Fechar socket e remover do loop"""
+        if self.sock is None:
+            return
+
+        try:
+            self.root.tk.deletefilehandler(self.sock)
+        except Exception:
+            pass
+
+        self.sock.close()
+        self.sock = None
+
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
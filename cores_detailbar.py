@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Core S Detail Bar
+Barras de carga por núcleo e taxas de disco/rede num canvas, desenhadas a
+partir da amostra em lote do amostrador (nenhuma leitura própria)
+"""
+
+
+def format_rate(value):
+    """Bytes/s compactos: 512B, 3.4K, 12M"""
+    for unit in ("B", "K", "M", "G"):
+        if value < 1024 or unit == "G":
+            break
+        value /= 1024
+    if unit == "B" or value >= 10:
+        return f"{value:.0f}{unit}"
+    return f"{value:.1f}{unit}"
+
+
+class DetailBar:
+    """Uma linha: barras por núcleo à esquerda, texto de disco/rede à direita"""
+
+    def __init__(self, canvas, x, y, width, height, bar_color, text_color,
+                 font=("Ubuntu Mono", 7), max_interfaces=2, tags=()):
+        self.canvas = canvas
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.bar_color = bar_color
+        self.max_interfaces = max_interfaces
+        self.tags = tags
+
+        self.core_items = []
+        self.core_heights = []
+        self.core_positions = []
+        self.text = canvas.create_text(x, y + height / 2, anchor="w", text="",
+                                       fill=text_color, font=font, tags=tags)
+        self.last_text = ""
+
+    def _layout_cores(self, count):
+        """Uma barra por núcleo (refeito só se o número de núcleos mudar)"""
+        for item in self.core_items:
+            self.canvas.delete(item)
+
+        # Até um terço da linha para as barras, 1-4 px cada com 1 px de espaço
+        bar_width = max(1, min(4, (self.width // 3) // max(count, 1) - 1))
+        bottom = self.y + self.height
+        self.core_items = []
+        self.core_positions = []
+        for i in range(count):
+            x0 = self.x + i * (bar_width + 1)
+            self.core_positions.append((x0, x0 + bar_width))
+            self.core_items.append(self.canvas.create_rectangle(
+                x0, bottom, x0 + bar_width, bottom, fill=self.bar_color, width=0, tags=self.tags
+            ))
+        self.core_heights = [0] * count
+
+        cores_width = count * (bar_width + 1)
+        self.canvas.coords(self.text, self.x + cores_width + 5, self.y + self.height / 2)
+
+    def update(self, detail):
+        """Aplicar SystemDetail tocando só nas barras/texto que mudaram"""
+        if len(detail.cores) != len(self.core_items):
+            self._layout_cores(len(detail.cores))
+
+        bottom = self.y + self.height
+        scale = self.height / 100.0
+        for i, percent in enumerate(detail.cores):
+            height = round(percent * scale)
+            if height != self.core_heights[i]:
+                self.core_heights[i] = height
+                x0, x1 = self.core_positions[i]
+                self.canvas.coords(self.core_items[i], x0, bottom - height, x1, bottom)
+
+        # Interfaces mais ativas primeiro (nome desempata, ordem estável em repouso)
+        busiest = sorted(detail.net.items(), key=lambda item: (-(item[1][0] + item[1][1]), item[0]))
+        parts = [f"D ↓{format_rate(detail.disk_read)} ↑{format_rate(detail.disk_write)}"]
+        for name, (rx, tx) in busiest[:self.max_interfaces]:
+            parts.append(f"{name} ↓{format_rate(rx)} ↑{format_rate(tx)}")
+
+        text = "  ".join(parts)
+        if text != self.last_text:
+            self.last_text = text
+            self.canvas.itemconfigure(self.text, text=text)
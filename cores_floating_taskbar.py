@@ -4,24 +4,74 @@ Core S Floating Taskbar - VERSÃO OTIMIZADA
 Taskbar flutuante revolucionária para Core S System
 """
 
+import time
+
+# Referência do --startup-profile (antes de qualquer import pesado)
+STARTUP_T0 = time.perf_counter()
+
 import tkinter as tk
 import os
-from tkinter import ttk
-import subprocess
-import threading
-import time
-import psutil
+import sys
 from datetime import datetime
 
+from cores_animation import Animator, WindowState
+from cores_instance import InstanceLock, ensure_manager_running
+from cores_scheduler import PeriodicScheduler
+from cores_screens import ScreenGeometry, build_corner_table
+
+# Demais módulos (atalhos, métricas, lançador, ícones, catálogo) são
+# importados nas etapas que rodam depois da primeira pintura
+
+# Cliente usado pelo xbindkeys para falar com a taskbar
+CTL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cores-taskbar-ctl")
+
+# Indicadores de canto (mesma ordem de self.corners)
+CORNER_INDICATORS = ["◣", "◤", "◥", "◢"]
+
+# Aplicativos fixos da barra: (emoji, nome, comando, ícone do tema)
+APPS = [
+    ("📁", "Files", "thunar", "system-file-manager"),
+    ("🌐", "Browser", "firefox", "firefox"),
+    ("⚙️", "Settings", "xfce4-settings-manager", "preferences-system"),
+    ("💻", "Terminal", "xfce4-terminal", "utilities-terminal"),
+    ("📝", "Editor", "mousepad", "accessories-text-editor")
+]
+
+class StartupProfile:
+    """Tempos da inicialização (exibidos com --startup-profile)"""
+    
+    def __init__(self, t0=STARTUP_T0, enabled=False):
+        self.t0 = t0
+        self.last = t0
+        self.enabled = enabled
+        self.marks = []
+    
+    def mark(self, name):
+        """Registrar fim de uma etapa"""
+        now = time.perf_counter()
+        self.marks.append((name, (now - self.last) * 1000, (now - self.t0) * 1000))
+        self.last = now
+    
+    def report(self):
+        """Exibir tempos por etapa e acumulados"""
+        print("⏱️ Perfil de inicialização:")
+        for name, stage_ms, total_ms in self.marks:
+            print(f"   {name:<14} {stage_ms:8.1f} ms   (t+{total_ms:.1f} ms)")
+
 class CoresFloatingTaskbar:
-    def __init__(self):
+    def __init__(self, profile=None, loop_profiler=None, target_monitor="primary", renderer="widgets"):
+        self.profile = profile or StartupProfile()
+        self.profile.mark("imports")
+        self.loop_profiler = loop_profiler  # cores_loopstats.LoopProfiler (opcional)
+        
         self.root = tk.Tk()
         self.root.title("Core S Taskbar")
         
         # Configurações da janela
         self.root.overrideredirect(True)
         self.root.attributes('-topmost', True)
-        self.root.attributes('-alpha', 0.95)
+        self.window_alpha = 0.95
+        self.root.attributes('-alpha', self.window_alpha)
         
         # Estados da taskbar
         self.is_expanded = False
@@ -34,6 +84,24 @@ class CoresFloatingTaskbar:
         self.expanded_width = 400
         self.expanded_height = 30
         self.margin = 20
+        self.icon_size = 20
+        self.icon_cache_bytes = 2 * 1024 * 1024
+        
+        # Animação (quadros calculados pelo tempo decorrido)
+        self.animation_fps = 60
+        self.animation_duration = 0.2
+        self.fade_duration = 0.15
+        self.animation_running = False
+        self.animator = Animator(self.root, fps=self.animation_fps)
+        self.window = WindowState(
+            self.root, self.square_size, self.square_size, 0, 0, self.window_alpha
+        )
+        
+        # Arraste: no máximo uma geometria por quadro, encaixe no canto ao soltar
+        self.drag_threshold = 4  # px antes de virar arraste (cliques continuam cliques)
+        self.drag_active = False
+        self.drag_frame_id = None
+        self.last_drag_stats = None
         
         # Cores Core S
         self.bg_color = "#3F0808"
@@ -52,23 +120,108 @@ class CoresFloatingTaskbar:
         self.last_cpu = 0
         self.last_ram = 0
         
+        # Política de amostragem por estado da interface (segundos; None = suspenso)
+        self.sampling_policy = {
+            "expanded": 3.0,
+            "collapsed": 10.0,
+            "hidden": None
+        }
+        
+        # Todas as tarefas periódicas (relógio, métricas, atualização) num só despertar
+        self.scheduler = PeriodicScheduler(self.root)
+        
+        # Serviços criados nas etapas pós-primeira pintura
+        self.metrics = None       # amostrador de métricas (thread própria)
+        self.metrics_queue = None  # amostras entregues ao loop do Tk
+        self.shown_seq = 0        # última amostra exibida
+        self.metrics_history = 3600  # amostras guardadas (buffers dos gráficos do mesmo tamanho)
+        self.launcher = None      # lançador (reaping via pidfd/SIGCHLD)
+        self.manager_pid = None
+        self.icons = None         # LRU de ícones
+        self.app_index = None     # catálogo de aplicativos (.desktop)
+        self.app_search = None
+        self.search_results = []
+        self.expanded_section = None
+        self.sparklines = None    # gráficos de CPU/RAM/swap (seção expandida)
+        self.sparkline_colors = {"cpu": self.accent_color, "ram": "#f0b429", "swap": "#7fb2ff"}
+        self.detail_bar = None    # núcleos, disco e rede (seção expandida)
+        
+        # Popover de processos (botão direito no S); sem leituras enquanto fechado
+        self.top_monitor = None   # tabela de processos (thread própria)
+        self.top_popover = None
+        self.top_count = 5
+        self.top_interval = 1.0
+        self.top_geometry = ""
+        
+        # "widgets" (árvore de Frames/Labels) ou "canvas" (um único tk.Canvas)
+        self.renderer = renderer
+        self.canvas_bar = None
+        self.update_notifier = None   # verificação de atualização em segundo plano
+        self.update_badge = None
+        self.update_check_interval = 6 * 60 * 60  # segundos
+        
+        # Monitores (XRandR) e tabela de posições por monitor/canto/estado
+        self.target_monitor = target_monitor
+        self.screens = ScreenGeometry(self.root, on_change=self.on_screens_changed)
+        self.screens.start()
+        self.rebuild_corner_table()
+        
         # Configurar janela
         self.setup_window()
         
-        # Criar interface
-        self.create_square_interface()
+        # Criar interface (só o quadrado: é o que aparece no primeiro quadro)
+        self.create_interface()
         
         # Posicionar inicial
         self.position_taskbar()
+        self.profile.mark("window")
+        
+        # Todo o resto em etapas, uma por iteração do loop, após a primeira pintura
+        self.startup_stages = [
+            ("hotkeys", self.setup_hotkeys),
+            ("metrics", self.start_monitoring),
+            ("launcher", self.start_launcher),
+            ("expanded_ui", self.create_expanded_section),
+            ("icons", self.load_app_icons),
+            ("app_index", self.start_app_index),
+            ("update_check", self.start_update_check)
+        ]
+        self.first_paint_done = False
+        if self.loop_profiler:
+            self.loop_profiler.attach(self.root)
+        self.root.bind('<Map>', self.on_first_map, add='+')
+        self.root.after(2000, self.on_first_paint)
+    
+    def on_first_map(self, event):
+        """Janela mapeada: agendar marca de primeira pintura"""
+        if event.widget is self.root and not self.first_paint_done:
+            # Redesenhos pendentes rodam antes deste after_idle
+            self.root.after_idle(self.on_first_paint)
+    
+    def on_first_paint(self):
+        """Primeiro quadro na tela: iniciar etapas adiadas"""
+        if self.first_paint_done:
+            return
         
-        # Configurar atalhos globais
-        self.setup_hotkeys()
+        self.first_paint_done = True
+        self.profile.mark("first_paint")
+        self.root.after(0, self.run_next_startup_stage)
+    
+    def run_next_startup_stage(self):
+        """Executar uma etapa e devolver o controle ao loop"""
+        if not self.startup_stages:
+            if self.profile.enabled:
+                self.profile.report()
+            return
         
-        # Iniciar monitoramento otimizado
-        self.start_monitoring()
+        name, stage = self.startup_stages.pop(0)
+        try:
+            stage()
+        except Exception as e:
+            print(f"Erro na etapa {name}: {e}")
+        self.profile.mark(name)
         
-        # Variáveis para animação
-        self.animation_running = False
+        self.root.after(0, self.run_next_startup_stage)
     
     def setup_window(self):
         """Configurar janela principal"""
@@ -76,12 +229,18 @@ class CoresFloatingTaskbar:
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         self.root.bind('<Button-1>', self.start_drag)
         self.root.bind('<B1-Motion>', self.on_drag)
+        self.root.bind('<ButtonRelease-1>', self.end_drag)
     
-    def create_square_interface(self):
-        """Criar interface do quadrado recolhido"""
-        # Limpar frame se existir
-        if hasattr(self, 'square_frame'):
-            self.square_frame.destroy()
+    def create_interface(self):
+        """Criar quadrado S (a seção expandida vem depois, uma única vez)"""
+        if self.renderer == "canvas":
+            from cores_canvasbar import CanvasBar
+            
+            self.canvas_bar = CanvasBar(self.root, self, APPS, self.on_canvas_app_click)
+            self.position_indicator = self.canvas_bar.indicator
+            self.position_indicator.configure(text=CORNER_INDICATORS[self.current_corner])
+            self.canvas_bar.canvas.bind('<Button-3>', self.on_square_right_click)
+            return
         
         # Frame principal do quadrado
         self.square_frame = tk.Frame(
@@ -95,49 +254,6 @@ class CoresFloatingTaskbar:
         self.square_frame.pack(fill=tk.BOTH, expand=True)
         self.square_frame.pack_propagate(False)
         
-        # Label com "S"
-        self.s_label = tk.Label(
-            self.square_frame,
-            text="S",
-            font=("Ubuntu", 24, "bold"),
-            fg=self.accent_color,
-            bg=self.bg_color
-        )
-        self.s_label.pack(expand=True)
-        
-        # Indicador de posição (pequeno ponto)
-        corner_indicators = ["◣", "◤", "◥", "◢"]
-        self.position_indicator = tk.Label(
-            self.square_frame,
-            text=corner_indicators[self.current_corner],
-            font=("Arial", 8),
-            fg=self.accent_color,
-            bg=self.bg_color
-        )
-        self.position_indicator.place(x=45, y=45)
-        
-        # Limpar referências de widgets expandidos
-        self.clear_expanded_refs()
-    
-    def clear_expanded_refs(self):
-        """Limpar referências de widgets expandidos para liberar memória"""
-        self.clock_label = None
-        self.system_label = None
-        self.expanded_section = None
-        self.s_section = None
-    
-    def create_expanded_interface(self):
-        """Criar interface expandida"""
-        # Limpar frame atual
-        for widget in self.square_frame.winfo_children():
-            widget.destroy()
-        
-        # Redimensionar para expansão
-        self.square_frame.configure(
-            width=self.expanded_width,
-            height=self.square_size
-        )
-        
         # Frame do quadrado S (esquerda)
         self.s_section = tk.Frame(
             self.square_frame,
@@ -150,7 +266,7 @@ class CoresFloatingTaskbar:
         self.s_section.pack(side=tk.LEFT, fill=tk.Y)
         self.s_section.pack_propagate(False)
         
-        # Label S
+        # Label com "S"
         self.s_label = tk.Label(
             self.s_section,
             text="S",
@@ -160,6 +276,41 @@ class CoresFloatingTaskbar:
         )
         self.s_label.pack(expand=True)
         
+        # Indicador de posição (pequeno ponto)
+        self.position_indicator = tk.Label(
+            self.s_section,
+            text=CORNER_INDICATORS[self.current_corner],
+            font=("Arial", 8),
+            fg=self.accent_color,
+            bg=self.bg_color
+        )
+        self.position_indicator.place(x=45, y=45)
+        
+        for widget in (self.s_section, self.s_label, self.position_indicator):
+            widget.bind('<Button-3>', self.on_square_right_click)
+    
+    def create_expanded_section(self):
+        """Criar seção expandida (uma vez; depois só exibida/ocultada)"""
+        if self.expanded_section is not None:
+            return
+        
+        if self.canvas_bar:
+            self.canvas_bar.build_expanded()
+            self.clock_label = self.canvas_bar.clock
+            self.system_label = self.canvas_bar.system
+            self.create_sparklines(self.canvas_bar.canvas, *self.canvas_bar.sparkline_origin,
+                                   tags=("expanded", "sparkline"))
+            self.canvas_bar.canvas.itemconfigure("sparkline", state="hidden")
+            self.canvas_bar.canvas.tag_bind("sparkline", '<Button-1>', self.sparklines.toggle_view)
+            x, y, width = self.canvas_bar.detail_origin
+            self.create_detail_bar(self.canvas_bar.canvas, x, y, width, tags=("expanded", "detail"))
+            self.canvas_bar.canvas.itemconfigure("detail", state="hidden")
+            self.app_buttons = []
+            self.create_search_box(self.canvas_bar.canvas)
+            self.canvas_bar.add_search_entry(self.search_entry)
+            self.expanded_section = self.canvas_bar
+            return
+        
         # Frame expandido (direita)
         self.expanded_section = tk.Frame(
             self.square_frame,
@@ -169,12 +320,42 @@ class CoresFloatingTaskbar:
             relief='raised',
             bd=0
         )
-        self.expanded_section.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(2, 0))
         self.expanded_section.pack_propagate(False)
         
         # Conteúdo da expansão
         self.create_expanded_content()
     
+    def show_square_interface(self):
+        """Exibir só o quadrado (sem destruir widgets)"""
+        if self.expanded_section is None:
+            return
+        
+        self.clear_search()
+        if self.canvas_bar:
+            self.canvas_bar.set_expanded(False)
+            return
+        
+        self.expanded_section.pack_forget()
+        self.square_frame.configure(width=self.square_size)
+        self.position_indicator.place(x=45, y=45)
+    
+    def show_expanded_interface(self):
+        """Exibir seção expandida já construída"""
+        self.create_expanded_section()
+        
+        # Dados do cache podem ter mudado enquanto recolhido
+        self.clock_label.configure(text=self.last_time if self.last_time else "00:00:00")
+        self.system_label.configure(text=f"CPU: {self.last_cpu:.0f}% | RAM: {self.last_ram:.0f}%")
+        self.sparklines.refresh()
+        
+        if self.canvas_bar:
+            self.canvas_bar.set_expanded(True)
+            return
+        
+        self.position_indicator.place_forget()
+        self.square_frame.configure(width=self.expanded_width)
+        self.expanded_section.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(2, 0))
+    
     def create_expanded_content(self):
         """Criar conteúdo da parte expandida"""
         # Frame superior (informações do sistema)
@@ -202,24 +383,61 @@ class CoresFloatingTaskbar:
         )
         self.system_label.pack(side=tk.LEFT)
         
+        # Gráficos CPU/RAM/swap (clique alterna 60 s / 10 min)
+        sparkline_canvas = tk.Canvas(top_frame, height=16, bg=self.secondary_color,
+                                     highlightthickness=0, bd=0)
+        self.create_sparklines(sparkline_canvas, 1, 1)
+        sparkline_canvas.configure(width=self.sparklines.total_width + 2)
+        sparkline_canvas.bind('<Button-1>', self.sparklines.toggle_view)
+        sparkline_canvas.pack(side=tk.LEFT, padx=(6, 0))
+        
+        # Núcleos, disco e rede (linha de baixo)
+        width = self.expanded_width - self.square_size - 12
+        detail_canvas = tk.Canvas(self.expanded_section, width=width, height=10,
+                                  bg=self.secondary_color, highlightthickness=0, bd=0)
+        detail_canvas.pack(side=tk.BOTTOM, fill=tk.X, padx=5, pady=(0, 1))
+        self.create_detail_bar(detail_canvas, 0, 0, width)
+        
         # Frame inferior (aplicações)
         bottom_frame = tk.Frame(self.expanded_section, bg=self.secondary_color)
         bottom_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=2)
         
         # Botões de aplicações
         self.create_app_buttons(bottom_frame)
+        
+        # Busca de aplicativos instalados
+        self.create_search_box(bottom_frame)
+        self.search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(4, 0))
+    
+    def create_sparklines(self, canvas, x, y, tags=()):
+        """Gráficos desenhados a partir do histórico do amostrador"""
+        from cores_sparklines import SparklineGroup
+        
+        def window(seconds):
+            return self.metrics.window(seconds) if self.metrics else None
+        
+        self.sparklines = SparklineGroup(
+            canvas, x, y, window, self.metrics_history, self.sparkline_colors,
+            outline=self.bg_color, tags=tags
+        )
+    
+    def create_detail_bar(self, canvas, x, y, width, tags=()):
+        """Barras por núcleo e taxas de disco/rede (amostra em lote do amostrador)"""
+        from cores_detailbar import DetailBar
+        
+        self.detail_bar = DetailBar(canvas, x, y, width, 10, self.accent_color,
+                                    self.text_color, tags=tags)
+        if self.metrics:
+            self.metrics.set_detailed(True)
+    
+    def update_detail_bar(self):
+        if self.detail_bar and self.metrics.detail:
+            self.detail_bar.update(self.metrics.detail)
     
     def create_app_buttons(self, parent):
         """Criar botões das aplicações"""
-        apps = [
-            ("📁", "Files", "thunar"),
-            ("🌐", "Browser", "firefox"),
-            ("⚙️", "Settings", "xfce4-settings-manager"),
-            ("💻", "Terminal", "xfce4-terminal"),
-            ("📝", "Editor", "mousepad")
-        ]
-        
-        for icon, name, command in apps:
+        self.app_buttons = []
+        for icon, name, command, icon_name in APPS:
             btn = tk.Button(
                 parent,
                 text=icon,
@@ -229,58 +447,232 @@ class CoresFloatingTaskbar:
                 bg=self.bg_color,
                 fg=self.text_color,
                 relief='flat',
-                command=lambda cmd=command: self.launch_app_safe(cmd)
+                command=lambda cmd=command, n=name: self.launch_app_safe(cmd, n)
             )
             btn.pack(side=tk.LEFT, padx=1)
+            self.app_buttons.append((btn, icon_name))
             
             # Hover effects
             btn.bind('<Enter>', lambda e, b=btn: b.configure(bg=self.accent_color))
             btn.bind('<Leave>', lambda e, b=btn: b.configure(bg=self.bg_color))
     
-    def launch_app_safe(self, command):
-        """Lançar aplicação de forma segura sem travar a GUI"""
-        def launch_in_thread():
-            try:
-                # Usar Popen com DEVNULL para não bloquear
-                subprocess.Popen(
-                    command, 
-                    shell=True,
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                    stdin=subprocess.DEVNULL
-                )
-                print(f"✅ Aplicativo {command} iniciado")
-            except Exception as e:
-                print(f"❌ Erro ao lançar {command}: {e}")
+    def load_app_icons(self):
+        """Trocar emojis pelos ícones do tema (depois da primeira pintura)"""
+        if self.icons is None:
+            from cores_icons import IconCache
+            
+            # Ícones decodificados uma vez e mantidos num LRU limitado
+            self.icons = IconCache(self.root, max_bytes=self.icon_cache_bytes)
         
-        # Executar em thread separada para não travar GUI
-        threading.Thread(target=launch_in_thread, daemon=True).start()
+        self.create_expanded_section()
+        # SVG sem cache em disco chega depois, pelo callback (sem travar o loop)
+        if self.canvas_bar:
+            for i, (_, _, _, icon_name) in enumerate(APPS):
+                show = lambda image, i=i: self.canvas_bar.set_app_image(i, image)
+                image = self.icons.get(icon_name, self.icon_size, on_ready=show)
+                if image is not None:
+                    show(image)
+            return
+        
+        for btn, icon_name in self.app_buttons:
+            show = lambda image, btn=btn: self.set_button_icon(btn, image)
+            image = self.icons.get(icon_name, self.icon_size, on_ready=show)
+            if image is not None:
+                show(image)
     
-    def position_taskbar(self):
-        """Posicionar taskbar no canto atual"""
-        screen_width = self.root.winfo_screenwidth()
-        screen_height = self.root.winfo_screenheight()
+    def set_button_icon(self, btn, image):
+        """Trocar o emoji de um botão de app pelo ícone"""
+        # Referência no botão: imagem expulsa do LRU continua válida aqui
+        btn.image = image
+        btn.configure(image=image, width=self.icon_size + 8, height=self.icon_size + 2)
+    
+    def create_search_box(self, parent):
+        """Campo de busca de aplicativos (type-to-search)"""
+        self.search_var = tk.StringVar()
+        self.search_entry = tk.Entry(
+            parent,
+            textvariable=self.search_var,
+            font=("Ubuntu Mono", 9),
+            bg=self.bg_color,
+            fg=self.text_color,
+            insertbackground=self.text_color,
+            relief='flat',
+            width=10
+        )
         
-        corner = self.corners[self.current_corner]
+        # Janela sem borda não recebe foco sozinha
+        self.search_entry.bind('<Button-1>', lambda e: self.search_entry.focus_force())
+        self.search_entry.bind('<Return>', self.launch_search_selection)
+        self.search_entry.bind('<Escape>', lambda e: self.clear_search())
+        self.search_entry.bind('<Down>', lambda e: self.move_search_selection(1))
+        self.search_entry.bind('<Up>', lambda e: self.move_search_selection(-1))
+        self.search_var.trace_add('write', self.on_search_changed)
+        
+        # Lista de resultados: janela própria criada uma vez e só exibida/ocultada
+        self.search_popup = tk.Toplevel(self.root)
+        self.search_popup.overrideredirect(True)
+        self.search_popup.attributes('-topmost', True)
+        self.search_popup.withdraw()
+        
+        self.search_list = tk.Listbox(
+            self.search_popup,
+            height=8,
+            font=("Ubuntu Mono", 9),
+            bg=self.secondary_color,
+            fg=self.text_color,
+            selectbackground=self.accent_color,
+            selectforeground=self.bg_color,
+            activestyle='none',
+            highlightthickness=0,
+            relief='flat'
+        )
+        self.search_list.pack(fill=tk.BOTH, expand=True)
+        self.search_list.bind('<ButtonRelease-1>', self.launch_search_selection)
+    
+    def start_app_index(self):
+        """Indexar aplicativos (.desktop) em segundo plano"""
+        from cores_appindex import AppIndex
+        
+        self.app_index = AppIndex()
+        self.app_index.load_async(on_ready=self.prepare_app_search)
+    
+    def prepare_app_search(self):
+        """Construir índice de busca na thread do catálogo (fora do Tk)"""
+        from cores_appsearch import AppSearch, UsageStats
+        
+        if self.app_index.ready:
+            self.app_search = AppSearch(self.app_index.entries, UsageStats())
+    
+    def get_app_search(self):
+        """Índice de busca (construído uma vez quando o catálogo fica pronto)"""
+        if self.app_index is None or not self.app_index.ready:
+            return None
         
-        if corner == 'bottom_left':
-            x = self.margin
-            y = screen_height - self.square_size - self.margin
-        elif corner == 'top_left':
-            x = self.margin
-            y = self.margin
-        elif corner == 'top_right':
-            x = screen_width - self.square_size - self.margin
-            y = self.margin
-        elif corner == 'bottom_right':
-            x = screen_width - self.square_size - self.margin
-            y = screen_height - self.square_size - self.margin
-        
-        # Atualizar geometria da janela
-        if self.is_expanded and corner in ['top_left', 'bottom_left']:
-            self.root.geometry(f"{self.expanded_width}x{self.square_size}+{x}+{y}")
+        if self.app_search is None or self.app_search.entries is not self.app_index.entries:
+            self.prepare_app_search()
+        return self.app_search
+    
+    def on_search_changed(self, *args):
+        """Refinar resultados a cada tecla"""
+        search = self.get_app_search()
+        results = search.search(self.search_var.get()) if search else []
+        
+        if results != self.search_results:
+            self.search_results = results
+            self.search_list.delete(0, tk.END)
+            for entry in results:
+                self.search_list.insert(tk.END, entry.name)
+            if results:
+                self.search_list.selection_set(0)
+        
+        if results:
+            self.show_search_popup()
         else:
-            self.root.geometry(f"{self.square_size}x{self.square_size}+{x}+{y}")
+            self.search_popup.withdraw()
+    
+    def show_search_popup(self):
+        """Posicionar lista de resultados junto à barra"""
+        self.search_list.configure(height=len(self.search_results))
+        self.search_popup.update_idletasks()
+        
+        width = self.expanded_width - self.square_size
+        height = self.search_list.winfo_reqheight()
+        x = int(self.window.x) + self.square_size
+        
+        # Abrir para dentro da tela
+        if self.corners[self.current_corner].startswith('bottom'):
+            y = int(self.window.y) - height
+        else:
+            y = int(self.window.y) + self.square_size
+        
+        self.search_popup.geometry(f"{width}x{height}+{x}+{y}")
+        self.search_popup.deiconify()
+        self.search_popup.lift()
+    
+    def move_search_selection(self, step):
+        """Mover seleção da lista com as setas"""
+        if not self.search_results:
+            return
+        
+        current = self.search_list.curselection()
+        index = (current[0] if current else -step) + step
+        index = max(0, min(len(self.search_results) - 1, index))
+        
+        self.search_list.selection_clear(0, tk.END)
+        self.search_list.selection_set(index)
+        self.search_list.see(index)
+    
+    def launch_search_selection(self, event=None):
+        """Lançar aplicativo selecionado na busca"""
+        if not self.search_results:
+            return
+        
+        current = self.search_list.curselection()
+        entry = self.search_results[current[0] if current else 0]
+        
+        command = entry.exec
+        if entry.terminal:
+            command = f"xfce4-terminal -x {command}"
+        
+        self.launch_app_safe(command, entry.name)
+        self.app_search.record_launch(entry)
+        self.clear_search()
+    
+    def clear_search(self):
+        """Limpar busca e ocultar resultados"""
+        if self.search_var.get():
+            self.search_var.set("")
+        self.search_popup.withdraw()
+    
+    def on_canvas_app_click(self, index):
+        """Clique num botão do renderizador canvas"""
+        _, name, command, _ = APPS[index]
+        self.launch_app_safe(command, name)
+    
+    def start_launcher(self):
+        """Criar lançador e acompanhar o manager.py"""
+        from cores_launcher import AppLauncher
+        
+        self.launcher = AppLauncher(self.root)
+        if self.manager_pid:
+            self.launcher.track(self.manager_pid, "manager.py")
+    
+    def launch_app_safe(self, command, name=None):
+        """Lançar aplicação direto (posix_spawn), sem shell nem thread"""
+        if self.launcher is None:
+            self.start_launcher()
+        
+        try:
+            pid = self.launcher.launch(command, name)
+            print(f"✅ Aplicativo {command} iniciado (PID {pid})")
+        except Exception as e:
+            print(f"❌ Erro ao lançar {command}: {e}")
+    
+    def rebuild_corner_table(self):
+        """Pré-calcular posições (muda só com o layout de monitores)"""
+        self.monitor_index = self.screens.find_monitor(self.target_monitor)
+        self.corner_table = build_corner_table(
+            self.screens.monitors, self.square_size, self.expanded_width,
+            self.square_size, self.margin
+        )
+    
+    def on_screens_changed(self, monitors):
+        """Layout de monitores mudou (evento RandR)"""
+        self.rebuild_corner_table()
+        self.position_taskbar()
+    
+    def position_taskbar(self):
+        """Posicionar taskbar no canto atual (consulta à tabela)"""
+        corner = self.corners[self.current_corner]
+        width, height, x, y = self.corner_table[(self.monitor_index, corner, self.is_expanded)]
+        self.window.set(width=width, height=height, x=x, y=y)
+    
+    def move_to_next_monitor(self):
+        """Levar a taskbar para o próximo monitor (mesmo canto)"""
+        monitors = self.screens.monitors
+        self.monitor_index = (self.monitor_index + 1) % len(monitors)
+        self.target_monitor = monitors[self.monitor_index].name
+        self.position_taskbar()
     
     def toggle_expansion(self):
         """Alternar entre expandido e recolhido"""
@@ -299,63 +691,37 @@ class CoresFloatingTaskbar:
             self.expand_taskbar()
     
     def expand_taskbar(self):
-        """Expandir taskbar com animação otimizada"""
-        def animate_expand():
-            steps = 8  # Reduzido para melhor performance
-            start_width = self.square_size
-            end_width = self.expanded_width
-            step_size = (end_width - start_width) / steps
-            
-            for i in range(steps + 1):
-                current_width = int(start_width + (step_size * i))
-                
-                screen_height = self.root.winfo_screenheight()
-                corner = self.corners[self.current_corner]
-                
-                if corner == 'bottom_left':
-                    y = screen_height - self.square_size - self.margin
-                else:
-                    y = self.margin
-                
-                self.root.geometry(f"{current_width}x{self.square_size}+{self.margin}+{y}")
-                self.root.update_idletasks()  # Mais eficiente que update()
-                time.sleep(0.025)
-            
-            self.create_expanded_interface()
-            self.is_expanded = True
-            self.animation_running = False
-        
-        threading.Thread(target=animate_expand, daemon=True).start()
+        """Expandir taskbar com animação no loop do Tk"""
+        self.create_expanded_section()
+        self.animator.animate_window(
+            self.window, self.animation_duration,
+            width=self.expanded_width,
+            on_done=self._finish_expand
+        )
     
-    def collapse_taskbar(self):
-        """Recolher taskbar com animação otimizada"""
-        def animate_collapse():
-            self.create_square_interface()
-            
-            steps = 8  # Reduzido para melhor performance
-            start_width = self.expanded_width
-            end_width = self.square_size
-            step_size = (start_width - end_width) / steps
-            
-            for i in range(steps + 1):
-                current_width = int(start_width - (step_size * i))
-                
-                screen_height = self.root.winfo_screenheight()
-                corner = self.corners[self.current_corner]
-                
-                if corner == 'bottom_left':
-                    y = screen_height - self.square_size - self.margin
-                else:
-                    y = self.margin
-                
-                self.root.geometry(f"{current_width}x{self.square_size}+{self.margin}+{y}")
-                self.root.update_idletasks()
-                time.sleep(0.025)
-            
+    def _finish_expand(self):
+        """Exibir conteúdo ao final da expansão"""
+        self.is_expanded = True
+        self.apply_sampling_policy()
+        self.show_expanded_interface()
+        self.animation_running = False
+    
+    def collapse_taskbar(self, on_done=None):
+        """Recolher taskbar com animação no loop do Tk"""
+        self.show_square_interface()
+        
+        def finish_collapse():
             self.is_expanded = False
+            self.apply_sampling_policy()
             self.animation_running = False
+            if on_done:
+                on_done()
         
-        threading.Thread(target=animate_collapse, daemon=True).start()
+        self.animator.animate_window(
+            self.window, self.animation_duration,
+            width=self.square_size,
+            on_done=finish_collapse
+        )
     
     def move_to_next_corner(self):
         """Mover para próximo canto"""
@@ -363,8 +729,8 @@ class CoresFloatingTaskbar:
             return
         
         if self.is_expanded:
-            self.collapse_taskbar()
-            self.root.after(300, self._complete_corner_move)
+            self.animation_running = True
+            self.collapse_taskbar(on_done=self._complete_corner_move)
         else:
             self._complete_corner_move()
     
@@ -374,51 +740,205 @@ class CoresFloatingTaskbar:
         self.position_taskbar()
         
         # Atualizar indicador de posição
-        corner_indicators = ["◣", "◤", "◥", "◢"]
-        if hasattr(self, 'position_indicator') and self.position_indicator:
-            self.position_indicator.configure(text=corner_indicators[self.current_corner])
+        self.position_indicator.configure(text=CORNER_INDICATORS[self.current_corner])
     
     def toggle_visibility(self):
-        """Alternar visibilidade completa"""
+        """Alternar visibilidade completa (com fade de -alpha)"""
         try:
             if self.is_visible:
                 print("🙈 Ocultando taskbar...")
-                self.root.withdraw()
                 self.is_visible = False
+                self.close_top_processes()
+                self.apply_sampling_policy()
+                self.animator.animate_window(
+                    self.window, self.fade_duration,
+                    alpha=0.0,
+                    on_done=self.root.withdraw
+                )
             else:
                 print("👁️ Exibindo taskbar...")
+                self.is_visible = True
+                self.apply_sampling_policy()
+                self.window.set(alpha=0.0)
                 self.root.deiconify()
                 self.root.lift()
                 self.root.attributes('-topmost', True)
-                self.is_visible = True
                 self.position_taskbar()
+                self.animator.animate_window(
+                    self.window, self.fade_duration,
+                    alpha=self.window_alpha
+                )
         except Exception as e:
             print(f"Erro ao alternar visibilidade: {e}")
     
+    def on_square_right_click(self, event):
+        """Botão direito no quadrado S: abrir/fechar processos"""
+        if self.canvas_bar and event.x >= self.square_size:
+            return
+        self.toggle_top_processes()
+    
+    def toggle_top_processes(self):
+        # Aberto = tarefa registrada no agendador
+        if "top_processes" in self.scheduler.tasks:
+            self.close_top_processes()
+        else:
+            self.open_top_processes()
+    
+    def create_top_popover(self):
+        """Janela do popover (criada uma vez; depois só exibida/ocultada)"""
+        self.top_popover = tk.Toplevel(self.root)
+        self.top_popover.overrideredirect(True)
+        self.top_popover.attributes('-topmost', True)
+        self.top_popover.configure(bg=self.secondary_color)
+        self.top_popover.withdraw()
+        
+        self.top_labels = []
+        for _ in ("cpu", "rss"):
+            label = tk.Label(
+                self.top_popover,
+                font=("Ubuntu Mono", 8),
+                fg=self.text_color,
+                bg=self.secondary_color,
+                justify=tk.LEFT,
+                anchor='w'
+            )
+            label.pack(side=tk.LEFT, anchor='n', padx=5, pady=4)
+            self.top_labels.append(label)
+    
+    def open_top_processes(self):
+        """Pedir a tabela agora e atualizar só enquanto aberto"""
+        if not self.is_visible:
+            return  # barra oculta: nada de popover solto na tela
+        
+        if self.top_monitor is None:
+            try:
+                from cores_topprocs import TopProcessesMonitor
+                self.top_monitor = TopProcessesMonitor(self.root, self.show_top_processes,
+                                                       self.top_count)
+            except ImportError:
+                print("⚠️ psutil indisponível: lista de processos desativada")
+                return
+        
+        if self.top_popover is None:
+            self.create_top_popover()
+        
+        # Leitura na thread do monitor; o popover aparece com o primeiro resultado
+        self.top_monitor.request()
+        self.scheduler.register("top_processes", self.top_interval, self.top_monitor.request)
+    
+    def close_top_processes(self):
+        """Fechar: tarefa removida do agendador, nenhuma leitura até reabrir"""
+        self.scheduler.unregister("top_processes")
+        if self.top_monitor:
+            self.top_monitor.pause()
+        if self.top_popover is not None:
+            self.top_popover.withdraw()
+    
+    def show_top_processes(self, texts):
+        """Textos dos dois rankings prontos (entregues pelo monitor no loop do Tk)"""
+        if "top_processes" not in self.scheduler.tasks:
+            return  # fechado enquanto a leitura estava em andamento
+        
+        for label, text in zip(self.top_labels, texts):
+            if label.cget('text') != text:
+                label.configure(text=text)
+        
+        self.position_top_popover()
+        if self.top_popover.state() == 'withdrawn':
+            self.top_popover.deiconify()
+            self.top_popover.lift()
+    
+    def position_top_popover(self):
+        """Junto ao quadrado S, abrindo para dentro da tela"""
+        self.top_popover.update_idletasks()
+        width = self.top_popover.winfo_reqwidth()
+        height = self.top_popover.winfo_reqheight()
+        
+        corner = self.corners[self.current_corner]
+        if corner.endswith('left'):
+            x = int(self.window.x)
+        else:
+            x = int(self.window.x + self.window.width) - width
+        if corner.startswith('bottom'):
+            y = int(self.window.y) - height
+        else:
+            y = int(self.window.y + self.window.height)
+        
+        geometry = f"{width}x{height}+{x}+{y}"
+        if geometry != self.top_geometry:
+            self.top_geometry = geometry
+            self.top_popover.geometry(geometry)
+    
+    def show_taskbar(self):
+        """Exibir taskbar se estiver oculta (nova execução do programa)"""
+        if not self.is_visible:
+            self.toggle_visibility()
+    
     def setup_hotkeys(self):
         """Configurar atalhos de teclado globais otimizado"""
         if self.hotkey_running:
             return
         
         self.hotkey_running = True
-        self.start_global_hotkey_daemon()
+        self.xbindkeys_started = False
+        self.start_command_server()
+        
+        from cores_xhotkeys import XHotkeyGrabber
+        
+        # Backend nativo (XGrabKey); xbindkeys só como fallback
+        self.hotkey_grabber = XHotkeyGrabber(self.root, {
+            "1": self.toggle_expansion,
+            "2": self.move_to_next_corner,
+            "3": self.toggle_visibility
+        })
+        
+        if not self.hotkey_grabber.start():
+            print("⚠️ XGrabKey indisponível, usando xbindkeys")
+            self.start_global_hotkey_daemon()
         
         # Binds locais otimizados
         self.root.bind_all('<Alt-Key-1>', lambda e: self.toggle_expansion())
         self.root.bind_all('<Alt-Key-2>', lambda e: self.move_to_next_corner())
         self.root.bind_all('<Alt-Key-3>', lambda e: self.toggle_visibility())
     
+    def start_command_server(self):
+        """Canal de comandos orientado a eventos (sem polling)"""
+        from cores_command_channel import CommandServer
+        
+        self.command_server = CommandServer(self.root, {
+            "toggle_expansion": self.toggle_expansion,
+            "move_corner": self.move_to_next_corner,
+            "toggle_visibility": self.toggle_visibility,
+            "show": self.show_taskbar,
+            "wakeup_stats": self.print_wakeup_stats,
+            "loop_stats": self.print_loop_stats,
+            "next_monitor": self.move_to_next_monitor,
+            "top_processes": self.toggle_top_processes
+        })
+        
+        try:
+            self.command_server.start()
+        except Exception as e:
+            print(f"Erro no canal de comandos: {e}")
+    
     def start_global_hotkey_daemon(self):
-        """Daemon otimizado para atalhos globais"""
+        """Daemon xbindkeys para atalhos globais (fallback)"""
+        import shlex
+        import subprocess
+        import threading
+        
+        self.xbindkeys_started = True
+        
         def hotkey_daemon():
-            xbindkeys_config = """
-"echo 'toggle_expansion' > /tmp/cores_taskbar_cmd"
+            ctl = shlex.quote(CTL_PATH)
+            xbindkeys_config = f"""
+"{ctl} toggle_expansion"
     Alt + 1
 
-"echo 'move_corner' > /tmp/cores_taskbar_cmd"
+"{ctl} move_corner"
     Alt + 2
 
-"echo 'toggle_visibility' > /tmp/cores_taskbar_cmd"
+"{ctl} toggle_visibility"
     Alt + 3
 """
             
@@ -432,26 +952,6 @@ class CoresFloatingTaskbar:
                     stdout=subprocess.DEVNULL, 
                     stderr=subprocess.DEVNULL
                 )
-                
-                while self.hotkey_running:
-                    try:
-                        if os.path.exists("/tmp/cores_taskbar_cmd"):
-                            with open("/tmp/cores_taskbar_cmd", "r") as f:
-                                cmd = f.read().strip()
-                            
-                            os.remove("/tmp/cores_taskbar_cmd")
-                            
-                            if cmd == "toggle_expansion":
-                                self.root.after_idle(self.toggle_expansion)
-                            elif cmd == "move_corner":
-                                self.root.after_idle(self.move_to_next_corner)
-                            elif cmd == "toggle_visibility":
-                                self.root.after_idle(self.toggle_visibility)
-                    
-                    except Exception:
-                        pass
-                    
-                    time.sleep(0.2)  # Aumentado para economizar CPU
             
             except Exception as e:
                 print(f"Erro no daemon de atalhos: {e}")
@@ -461,77 +961,249 @@ class CoresFloatingTaskbar:
     def start_monitoring(self):
         """Iniciar monitoramento otimizado do sistema"""
         if not self.update_running:
+            from cores_metrics import MetricsSampler
+            from cores_tkqueue import TkResultQueue
+            
+            # Leitura (/proc, disco/rede, fallback psutil) na thread do amostrador;
+            # cada amostra publicada acorda o loop do Tk pelo pipe (histórico da última hora)
+            self.metrics_queue = TkResultQueue(self.root, self.show_metrics, latest_only=True)
+            self.metrics = MetricsSampler(interval=None, history=self.metrics_history)
+            if self.detail_bar:
+                self.metrics.set_detailed(True)
+            self.metrics.start()
             self.update_running = True
-            self.start_optimized_updates()
+            
+            self.scheduler.register("clock", None, self.update_clock)
+            self.apply_sampling_policy()
     
-    def start_optimized_updates(self):
-        """Sistema de atualizações otimizado usando tkinter.after"""
-        def update_system_safe():
-            if not self.update_running:
-                return
+    def ui_state(self):
+        """Estado atual da interface para a política de amostragem"""
+        if not self.is_visible:
+            return "hidden"
+        return "expanded" if self.is_expanded else "collapsed"
+    
+    def apply_sampling_policy(self):
+        """Ajustar amostragem e atualizações ao estado da interface"""
+        if not self.update_running:
+            return
+        
+        state = self.ui_state()
+        interval = self.sampling_policy[state]
+        self.metrics.set_interval(interval)
+        
+        # Relógio/labels/gráficos só existem na tela quando expandido: recolhida,
+        # a thread segue gravando o histórico sem acordar o Tk
+        if state == "expanded":
+            self.metrics.on_sample = self.metrics_queue.post
+            self.refresh_metrics_cache()
+            self.scheduler.set_interval("clock", 1.0)
+        else:
+            self.metrics.on_sample = None
+            self.scheduler.set_interval("clock", None)
+    
+    def refresh_metrics_cache(self):
+        """Exibir o que já foi amostrado ao voltar de recolhido/oculto"""
+        snapshot = self.metrics.snapshot
+        if time.time() - snapshot.timestamp > self.sampling_policy["expanded"]:
+            # Amostra nova sai na thread e chega em show_metrics pelo pipe
+            self.metrics.request_sample()
+        if self.sparklines:
+            if snapshot.seq != self.shown_seq:
+                self.sparklines.stale = True  # amostras gravadas com os gráficos ocultos
+            self.sparklines.refresh()
+        
+        self.shown_seq = snapshot.seq
+        self.update_system_label(snapshot)
+        self.update_detail_bar()
+        self.update_clock()
+    
+    def show_metrics(self, snapshot):
+        """Amostra publicada pelo amostrador (entregue no loop do Tk pelo pipe)"""
+        if self.ui_state() != "expanded" or snapshot.seq <= self.shown_seq:
+            return  # recolhida no caminho, ou já exibida por refresh_metrics_cache
+        
+        if self.sparklines:
+            if snapshot.seq != self.shown_seq + 1:
+                self.sparklines.stale = True  # amostras puladas: série inteira do histórico
+            self.sparklines.push(snapshot)  # desloca a linha e acrescenta um ponto
+        self.shown_seq = snapshot.seq
+        self.update_system_label(snapshot)
+        self.update_detail_bar()
+    
+    def update_system_label(self, snapshot):
+        """Atualizar CPU/RAM só quando mudar mais de 1 ponto"""
+        if (abs(snapshot.cpu - self.last_cpu) > 1 or
+            abs(snapshot.ram - self.last_ram) > 1):
             
-            try:
-                # Só atualizar se expandido e widgets existem
-                if self.is_expanded and self.system_label and self.clock_label:
-                    
-                    # Atualizar hora (mais frequente)
-                    current_time = datetime.now().strftime("%H:%M:%S")
-                    if current_time != self.last_time:
-                        self.last_time = current_time
-                        if self.clock_label.winfo_exists():
-                            self.clock_label.configure(text=current_time)
-                    
-                    # Atualizar sistema (menos frequente) - só a cada 3 segundos
-                    current_seconds = int(time.time())
-                    if current_seconds % 3 == 0:
-                        try:
-                            cpu_percent = psutil.cpu_percent(interval=None)  # Non-blocking
-                            memory = psutil.virtual_memory()
-                            ram_percent = memory.percent
-                            
-                            # Só atualizar se mudou significativamente
-                            if (abs(cpu_percent - self.last_cpu) > 1 or 
-                                abs(ram_percent - self.last_ram) > 1):
-                                
-                                self.last_cpu = cpu_percent
-                                self.last_ram = ram_percent
-                                
-                                if self.system_label and self.system_label.winfo_exists():
-                                    info_text = f"CPU: {cpu_percent:.0f}% | RAM: {ram_percent:.0f}%"
-                                    self.system_label.configure(text=info_text)
-                        
-                        except Exception:
-                            pass
-                
-                else:
-                    # Se não expandido, só atualizar cache
-                    current_time = datetime.now().strftime("%H:%M:%S")
-                    self.last_time = current_time
-                    
-                    try:
-                        self.last_cpu = psutil.cpu_percent(interval=None)
-                        self.last_ram = psutil.virtual_memory().percent
-                    except Exception:
-                        pass
-                        
-            except Exception:
-                pass
+            self.last_cpu = snapshot.cpu
+            self.last_ram = snapshot.ram
             
-            # Reagendar próxima atualização
-            if self.update_running:
-                self.root.after(1000, update_system_safe)
+            info_text = f"CPU: {self.last_cpu:.0f}% | RAM: {self.last_ram:.0f}%"
+            self.system_label.configure(text=info_text)
+    
+    def update_clock(self):
+        """Tarefa "clock": alinhada à borda do segundo (sem deriva nem saltos)"""
+        current_time = datetime.now().strftime("%H:%M:%S")
+        if current_time != self.last_time:
+            self.last_time = current_time
+            self.clock_label.configure(text=current_time)
+    
+    def wakeup_stats(self):
+        """Despertares por minuto do agendador (Tk) e do amostrador"""
+        scheduler = self.scheduler.wakeups.per_minute()
+        sampler = self.metrics.wakeups.per_minute() if self.metrics else 0.0
+        return {"scheduler": scheduler, "sampler": sampler, "total": scheduler + sampler}
+    
+    def print_wakeup_stats(self):
+        """Exibir despertares por minuto"""
+        stats = self.wakeup_stats()
+        tasks = ", ".join(f"{t.name}={t.interval:g}s" for t in self.scheduler.tasks.values()
+                          if t.interval is not None)
+        print(f"⏱️ Despertares/min: agendador {stats['scheduler']:.0f} | "
+              f"amostrador {stats['sampler']:.0f} | total {stats['total']:.0f} "
+              f"(estado: {self.ui_state()}; tarefas: {tasks or 'nenhuma'})")
+        
+        drag = self.last_drag_stats
+        if drag:
+            print(f"   último arraste: {drag['events']} eventos ({drag['events_per_sec']:.0f}/s), "
+                  f"{drag['updates']} geometrias ({drag['updates_per_sec']:.0f}/s) "
+                  f"em {drag['seconds']:.1f} s")
+    
+    def start_update_check(self):
+        """Verificar atualização fora da thread do Tk (repete periodicamente)"""
+        if self.update_notifier is None:
+            from cores_updatecheck import UpdateNotifier
+            self.update_notifier = UpdateNotifier(self.root, self.on_update_result)
+        
+        self.update_notifier.start_check()
+        self.scheduler.register("update_check", self.update_check_interval,
+                                self.update_notifier.start_check, align=False)
+    
+    def on_update_result(self, result):
+        """Resultado do worker (já na thread do Tk)"""
+        if result["error"]:
+            print(f"⚠️ Verificação de atualização: {result['error']}")
         
-        # Iniciar ciclo de atualizações
-        self.root.after(100, update_system_safe)
+        if result["update"]:
+            self.show_update_badge(result["version"])
+        elif self.update_badge is not None:
+            self.update_badge.place_forget()
+    
+    def show_update_badge(self, version):
+        """Marcador de atualização no quadrado S"""
+        if self.update_badge is None and self.canvas_bar:
+            self.update_badge = self.canvas_bar.badge
+        elif self.update_badge is None:
+            self.update_badge = tk.Label(
+                self.s_section,
+                text="●",
+                font=("Arial", 9),
+                fg="#f0b429",
+                bg=self.bg_color
+            )
+        
+        self.update_badge.place(x=52, y=2)
+        print(f"⬆️ Atualização disponível: {version}")
+    
+    def print_loop_stats(self):
+        """Exibir e gravar tempos dos callbacks (com --loop-profile)"""
+        if not self.loop_profiler:
+            print("ℹ️ Instrumentação do loop desligada (use --loop-profile)")
+            return
+        
+        self.loop_profiler.write_stats()
+        self.loop_profiler.report()
     
     def start_drag(self, event):
         """Iniciar arraste da janela"""
         self.drag_start_x = event.x_root
         self.drag_start_y = event.y_root
+        self.drag_origin = (self.window.x, self.window.y)
+        self.drag_offset = None
+        self.drag_events = 0
+        self.drag_updates = 0
+        self.drag_started_at = time.monotonic()
     
     def on_drag(self, event):
-        """Processar arraste da janela"""
-        pass  # Implementação futura
+        """Guardar só a última posição do ponteiro (geometria no próximo quadro)"""
+        # Expandida a barra fica presa ao canto esquerdo
+        if self.is_expanded or self.animation_running:
+            return
+        
+        self.drag_events += 1
+        dx = event.x_root - self.drag_start_x
+        dy = event.y_root - self.drag_start_y
+        
+        if not self.drag_active:
+            if abs(dx) < self.drag_threshold and abs(dy) < self.drag_threshold:
+                return
+            self.drag_active = True
+        
+        self.drag_offset = (dx, dy)
+        if self.drag_frame_id is None:
+            self.drag_frame_id = self.root.after(
+                max(1, round(1000 / self.animation_fps)), self.apply_drag_frame
+            )
+    
+    def apply_drag_frame(self):
+        """Aplicar a posição mais recente (eventos do quadro coalescidos)"""
+        self.drag_frame_id = None
+        if self.drag_offset is None:
+            return
+        
+        dx, dy = self.drag_offset
+        self.window.set(x=self.drag_origin[0] + dx, y=self.drag_origin[1] + dy)
+        self.drag_updates += 1
+    
+    def end_drag(self, event):
+        """Soltar: posição final e encaixe animado no canto mais próximo"""
+        if not self.drag_active:
+            return
+        
+        if self.drag_frame_id is not None:
+            self.root.after_cancel(self.drag_frame_id)
+            self.apply_drag_frame()
+        
+        self.drag_active = False
+        seconds = time.monotonic() - self.drag_started_at
+        self.last_drag_stats = {
+            "events": self.drag_events,
+            "updates": self.drag_updates,
+            "seconds": seconds,
+            "events_per_sec": self.drag_events / seconds if seconds else 0.0,
+            "updates_per_sec": self.drag_updates / seconds if seconds else 0.0,
+        }
+        self.snap_to_nearest_corner()
+    
+    def snap_to_nearest_corner(self):
+        """Encaixar no canto (de qualquer monitor) mais próximo do centro da barra"""
+        center_x = self.window.x + self.window.width / 2
+        center_y = self.window.y + self.window.height / 2
+        
+        def distance(key):
+            width, height, x, y = self.corner_table[key]
+            return (x + width / 2 - center_x) ** 2 + (y + height / 2 - center_y) ** 2
+        
+        candidates = [(index, corner, False)
+                      for index in range(len(self.screens.monitors))
+                      for corner in self.corners]
+        index, corner, _ = min(candidates, key=distance)
+        
+        self.monitor_index = index
+        self.target_monitor = self.screens.monitors[index].name
+        self.current_corner = self.corners.index(corner)
+        self.position_indicator.configure(text=CORNER_INDICATORS[self.current_corner])
+        
+        _, _, x, y = self.corner_table[(index, corner, False)]
+        self.animation_running = True
+        self.animator.animate_window(
+            self.window, self.animation_duration,
+            x=x, y=y,
+            on_done=self._finish_snap
+        )
+    
+    def _finish_snap(self):
+        self.animation_running = False
     
     def on_closing(self):
         """Fechar aplicação liberando recursos"""
@@ -540,18 +1212,42 @@ class CoresFloatingTaskbar:
         # Parar todos os threads
         self.update_running = False
         self.hotkey_running = False
+        self.scheduler.stop()
+        self.screens.stop()
+        if self.metrics:
+            self.metrics.stop()
+            self.metrics_queue.close()
+        if self.launcher:
+            self.launcher.close()
+        self.animator.cancel_all()
+        
+        if self.loop_profiler:
+            self.loop_profiler.detach()
+            self.loop_profiler.write_stats()
+        
+        if self.update_notifier:
+            self.update_notifier.close()
+        if self.top_monitor:
+            self.top_monitor.close()
+        
+        if hasattr(self, 'command_server'):
+            self.command_server.stop()
+        
+        if hasattr(self, 'hotkey_grabber'):
+            self.hotkey_grabber.stop()
         
         # Limpar arquivos temporários
         try:
             files_to_clean = [
-                "/tmp/cores_taskbar_cmd",
                 "/tmp/cores_xbindkeys"
             ]
             for file in files_to_clean:
                 if os.path.exists(file):
                     os.remove(file)
             
-            subprocess.run("killall xbindkeys 2>/dev/null", shell=True)
+            if getattr(self, 'xbindkeys_started', False):
+                import subprocess
+                subprocess.run("killall xbindkeys 2>/dev/null", shell=True)
         except Exception:
             pass
         
@@ -569,6 +1265,7 @@ class CoresFloatingTaskbar:
         print("   Alt+1: Expandir/Recolher (só cantos esquerdos)")
         print("   Alt+2: Mover entre cantos")
         print("   Alt+3: Ocultar/Exibir")
+        print("   Botão direito no S: processos (CPU/RAM)")
         
         try:
             self.root.mainloop()
@@ -577,15 +1274,51 @@ class CoresFloatingTaskbar:
 
 def main():
     """Função principal otimizada"""
+    args = sys.argv[1:]
+    profile = StartupProfile(enabled="--startup-profile" in args)
+    
+    # --loop-profile: cronometrar callbacks do Tk (travamento acima de CORES_LOOP_STALL_MS)
+    loop_profiler = None
+    if "--loop-profile" in args:
+        from cores_loopstats import LoopProfiler
+        loop_profiler = LoopProfiler(stall_ms=float(os.environ.get("CORES_LOOP_STALL_MS", 50)))
+    
+    # --monitor=<nome|índice|primary>: monitor de destino (ex.: --monitor=HDMI-1)
+    target_monitor = "primary"
+    for arg in args:
+        if arg.startswith("--monitor="):
+            target_monitor = arg.split("=", 1)[1]
+    
+    # --canvas: barra desenhada num único tk.Canvas
+    renderer = "canvas" if "--canvas" in args else "widgets"
+    
+    args = [a for a in args if a not in ("--startup-profile", "--loop-profile", "--canvas")
+            and not a.startswith("--monitor=")]
+    
+    # Comando entregue à instância que já estiver rodando (padrão: exibir)
+    command = args[0] if args else "show"
+    
+    instance_lock = InstanceLock("cores_taskbar")
+    if not instance_lock.acquire():
+        from cores_command_channel import send_command
+        
+        try:
+            send_command(command)
+            print(f"ℹ️ Core S Taskbar já em execução: comando '{command}' enviado")
+        except OSError as e:
+            print(f"❌ Erro ao contatar a taskbar em execução: {e}")
+        return
+    
     try:
-        # Verificar se manager.py já está rodando
-        result = subprocess.run("pgrep -f manager.py", shell=True, capture_output=True)
-        if not result.stdout:
-            # Só iniciar se não estiver rodando
-            subprocess.Popen("python3 /opt/cores-system/scripts/manager.py", 
-                           shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        
-        taskbar = CoresFloatingTaskbar()
+        # manager.py protegido pelo próprio lock (sem pgrep)
+        manager_pid = ensure_manager_running()
+        
+        # Instrumentar antes de criar widgets para pegar todos os binds
+        if loop_profiler:
+            loop_profiler.install()
+        
+        taskbar = CoresFloatingTaskbar(profile, loop_profiler, target_monitor, renderer)
+        taskbar.manager_pid = manager_pid  # acompanhado na etapa "launcher"
         taskbar.run()
     except KeyboardInterrupt:
         print("\n⏹️ Encerrando Core S Taskbar...")
@@ -593,5 +1326,4 @@ def main():
         print(f"❌ Erro: {e}")
 
 if __name__ == "__main__":
-    os.system('python3 /opt/cores-system/scripts/manager.py &')
     main()
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Core S Icons
+Ícones de aplicativos: busca no tema (índice por diretório), redimensionamento
+único, LRU de PhotoImage e cache em disco de imagens já redimensionadas; SVG
+convertido fora do loop do Tk
+"""
+
+import configparser
+import hashlib
+import math
+import os
+import shutil
+import subprocess
+import tkinter as tk
+from collections import OrderedDict
+
+ICON_DIRS = [
+    os.path.expanduser("~/.local/share/icons"),
+    os.path.expanduser("~/.icons"),
+    "/usr/local/share/icons",
+    "/usr/share/icons",
+]
+PIXMAP_DIRS = ["/usr/share/pixmaps"]
+# Temas de reserva depois do tema do usuário; hicolor é sempre o último
+FALLBACK_THEMES = ["Adwaita", "elementary-xfce", "gnome"]
+CONTEXTS = ["apps", "places", "categories", "devices", "actions", "mimetypes"]
+EXTENSIONS = (".png", ".svg", ".gif")  # ordem de preferência no mesmo tamanho
+SVG_TIMEOUT_MS = 5000
+
+GTK_SETTINGS = [
+    os.path.expanduser("~/.config/gtk-3.0/settings.ini"),
+    os.path.expanduser("~/.config/gtk-4.0/settings.ini"),
+    "/etc/gtk-3.0/settings.ini",
+]
+
+
+def user_icon_theme():
+    """Tema de ícones configurado no GTK (None se não houver)"""
+    for path in GTK_SETTINGS:
+        parser = configparser.ConfigParser(interpolation=None)
+        try:
+            parser.read(path)
+            theme = parser.get("Settings", "gtk-icon-theme-name", fallback=None)
+        except configparser.Error:
+            continue
+        if theme:
+            return theme.strip().strip('"')
+    return None
+
+
+def default_themes():
+    """Tema do usuário primeiro, reservas e por fim hicolor"""
+    themes = [user_icon_theme()] + FALLBACK_THEMES + ["hicolor"]
+    ordered = []
+    for theme in themes:
+        if theme and theme not in ordered:
+            ordered.append(theme)
+    return ordered
+
+
+def index_theme(theme):
+    """{nome: {tamanho: caminho}} de um tema em todas as bases (um listdir por pasta)"""
+    index = {}
+    for base in ICON_DIRS:
+        theme_dir = os.path.join(base, theme)
+        try:
+            size_dirs = os.listdir(theme_dir)
+        except OSError:
+            continue
+        for size_dir in size_dirs:
+            for context in CONTEXTS:
+                directory = os.path.join(theme_dir, size_dir, context)
+                try:
+                    filenames = os.listdir(directory)
+                except OSError:
+                    continue
+                for filename in filenames:
+                    stem, ext = os.path.splitext(filename)
+                    if ext not in EXTENSIONS:
+                        continue
+                    sizes = index.setdefault(stem, {})
+                    current = sizes.get(size_dir)
+                    # Base anterior vence; na mesma pasta, PNG antes de SVG
+                    if current is None or (os.path.dirname(current) == directory and
+                                           EXTENSIONS.index(ext) < EXTENSIONS.index(os.path.splitext(current)[1])):
+                        sizes[size_dir] = os.path.join(directory, filename)
+    return index
+
+
+class IconCache:
+    """LRU de PhotoImage limitado por memória, com cache em disco"""
+
+    def __init__(self, root, max_bytes=4 * 1024 * 1024, cache_dir=None, themes=None):
+        self.root = root
+        self.max_bytes = max_bytes
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+        self.cache_dir = cache_dir or os.path.join(cache_home, "cores-taskbar", "icons")
+        self.themes = themes or default_themes()
+        self.theme_indexes = {}  # tema -> índice (montado na primeira busca)
+        self.pixmaps = None
+        self.pending = {}        # (nome, tamanho) -> callbacks aguardando o SVG
+
+        self.images = OrderedDict()  # (nome, tamanho) -> (PhotoImage, bytes)
+        self.paths = {}              # (nome, tamanho) -> caminho de origem (ou None)
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+
+    def get(self, name, size, on_ready=None):
+        """PhotoImage do ícone no tamanho pedido (None se não encontrado)
+
+        SVG ainda fora do cache em disco é convertido em segundo plano: get
+        devolve None e on_ready(imagem) é chamado no loop do Tk ao terminar.
+        Quem exibe a imagem deve manter uma referência a ela: uma imagem
+        expulsa do LRU só é liberada pelo Tk quando ninguém mais a usa.
+        """
+        key = (name, size)
+        cached = self.images.get(key)
+        if cached:
+            self.images.move_to_end(key)
+            self.hits += 1
+            return cached[0]
+
+        self.misses += 1
+        image = self._load(name, size, on_ready)
+        if image is not None:
+            self._store(key, image)
+        return image
+
+    def _store(self, key, image):
+        cost = image.width() * image.height() * 4
+        self.images[key] = (image, cost)
+        self.used_bytes += cost
+        self._evict()
+
+    def hit_rate(self):
+        """Fração de acessos atendidos pela memória"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        return {
+            "entries": len(self.images),
+            "bytes": self.used_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_hits": self.disk_hits,
+            "hit_rate": self.hit_rate(),
+        }
+
+    def set_max_bytes(self, max_bytes):
+        """Alterar limite de memória"""
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def _evict(self):
+        """Remover os menos usados até caber no limite"""
+        while self.used_bytes > self.max_bytes and len(self.images) > 1:
+            _, (_, cost) = self.images.popitem(last=False)
+            self.used_bytes -= cost
+
+    def _load(self, name, size, on_ready=None):
+        """Carregar do cache em disco ou decodificar e redimensionar a origem"""
+        key = (name, size)
+        if key not in self.paths:
+            self.paths[key] = self.find_icon(name, size)
+
+        source = self.paths[key]
+        if source is None:
+            return None
+
+        try:
+            mtime = os.stat(source).st_mtime_ns
+        except OSError:
+            return None
+
+        digest = hashlib.sha1(f"{source}:{mtime}:{size}".encode()).hexdigest()
+        cached_path = os.path.join(self.cache_dir, f"{digest}.png")
+
+        if os.path.exists(cached_path):
+            try:
+                image = tk.PhotoImage(master=self.root, file=cached_path)
+                self.disk_hits += 1
+                return image
+            except tk.TclError:
+                pass
+
+        if source.endswith(".svg"):
+            if on_ready is not None:
+                self._render_svg(key, source, cached_path, on_ready)
+            return None
+
+        image = self._decode(source, size)
+        if image is None:
+            return None
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{cached_path}.tmp"
+            image.write(tmp_path, format="png")
+            os.replace(tmp_path, cached_path)
+        except (OSError, tk.TclError):
+            pass
+
+        return image
+
+    def _render_svg(self, key, source, cached_path, on_ready):
+        """rsvg-convert direto para o cache em disco; fim detectado pelo EOF do pipe"""
+        if key in self.pending:
+            self.pending[key].append(on_ready)
+            return
+        if not shutil.which("rsvg-convert"):
+            return
+
+        size = key[1]
+        tmp_path = f"{cached_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            proc = subprocess.Popen(
+                ["rsvg-convert", "-w", str(size), "-h", str(size), "-o", tmp_path, source],
+                stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            )
+        except OSError:
+            return
+
+        self.pending[key] = [on_ready]
+        fd = proc.stdout.fileno()
+        timer = self.root.after(SVG_TIMEOUT_MS, proc.kill)
+
+        def finished(fd, mask):
+            self.root.tk.deletefilehandler(fd)
+            self.root.after_cancel(timer)
+            proc.stdout.close()
+            callbacks = self.pending.pop(key, [])
+
+            image = None
+            if proc.wait() == 0:
+                try:
+                    os.replace(tmp_path, cached_path)
+                    image = tk.PhotoImage(master=self.root, file=cached_path)
+                    self.disk_hits += 1
+                except (OSError, tk.TclError):
+                    image = None
+            if image is None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                return
+
+            self._store(key, image)
+            for callback in callbacks:
+                callback(image)
+
+        self.root.tk.createfilehandler(fd, tk.READABLE, finished)
+
+    def _decode(self, source, size):
+        """Decodificar PNG/GIF (Tk) no tamanho pedido"""
+        try:
+            image = tk.PhotoImage(master=self.root, file=source)
+        except tk.TclError:
+            return None
+
+        # Redução inteira (subsample) até caber no tamanho do botão
+        factor = math.ceil(max(image.width(), image.height()) / size)
+        if factor > 1:
+            image = image.subsample(factor)
+        return image
+
+    def find_icon(self, name, size):
+        """Resolver nome de ícone (ou caminho absoluto) para um arquivo"""
+        if not name:
+            return None
+        if os.path.isabs(name):
+            return name if os.path.exists(name) else None
+
+        # Tamanhos do tema: o menor que não precise ampliar, depois o resto
+        sizes = [f"{s}x{s}" for s in (24, 32, 22, 48, 64, 128, 256, 16) if s >= size]
+        sizes += [f"{s}x{s}" for s in (22, 16) if s < size] + ["scalable"]
+
+        # Tema do usuário antes dos de reserva; consulta em memória
+        for theme in self.themes:
+            index = self.theme_indexes.get(theme)
+            if index is None:
+                index = self.theme_indexes[theme] = index_theme(theme)
+            found = index.get(name)
+            if found:
+                for size_dir in sizes:
+                    if size_dir in found:
+                        return found[size_dir]
+                return next(iter(found.values()))
+
+        if self.pixmaps is None:
+            self.pixmaps = {}
+            for base in PIXMAP_DIRS:
+                try:
+                    filenames = os.listdir(base)
+                except OSError:
+                    continue
+                for filename in sorted(filenames, key=lambda f: os.path.splitext(f)[1] != ".png"):
+                    stem, ext = os.path.splitext(filename)
+                    if ext in EXTENSIONS:
+                        self.pixmaps.setdefault(stem, os.path.join(base, filename))
+        return self.pixmaps.get(name)
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Core S Instance
+Instância única (flock em pidfile) da taskbar e do manager.py, sem pgrep
+"""
+
+import fcntl
+import os
+import sys
+
+MANAGER_SCRIPT = "/opt/cores-system/scripts/manager.py"
+
+# Descritor do lock herdado pelo manager.py iniciado pela taskbar
+MANAGER_LOCK_ENV = "CORES_MANAGER_LOCK_FD"
+
+
+def runtime_path(name):
+    """Caminho em XDG_RUNTIME_DIR (ou /tmp por usuário)"""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return os.path.join(runtime_dir, name)
+    return f"/tmp/{name}_{os.getuid()}"
+
+
+class InstanceLock:
+    """Lock exclusivo liberado pelo kernel quando o processo termina"""
+
+    def __init__(self, name):
+        self.path = runtime_path(f"{name}.lock")
+        self.fd = None
+
+    def acquire(self):
+        """Tentar obter o lock sem bloquear (False se já há uma instância)"""
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+
+        self.fd = fd
+        self.write_pid(os.getpid())
+        return True
+
+    def adopt(self, fd):
+        """Assumir um lock já obtido por outro processo (descritor herdado)"""
+        self.fd = fd
+        self.write_pid(os.getpid())
+
+    def write_pid(self, pid):
+        os.ftruncate(self.fd, 0)
+        os.pwrite(self.fd, f"{pid}\n".encode(), 0)
+
+    def read_pid(self):
+        """PID registrado no pidfile (0 se vazio)"""
+        try:
+            with open(self.path) as f:
+                return int(f.read().strip() or 0)
+        except (OSError, ValueError):
+            return 0
+
+    def release(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+
+def acquire_manager_lock():
+    """Para uso no manager.py: lock herdado da taskbar ou obtido agora"""
+    lock = InstanceLock("cores_manager")
+    inherited = os.environ.pop(MANAGER_LOCK_ENV, None)
+    if inherited is not None:
+        lock.adopt(int(inherited))
+        return lock
+    return lock if lock.acquire() else None
+
+
+def ensure_manager_running(script=MANAGER_SCRIPT):
+    """Iniciar manager.py só se ninguém segura o lock dele (PID ou None)"""
+    lock = InstanceLock("cores_manager")
+    if not lock.acquire():
+        return None
+
+    if not os.path.exists(script):
+        lock.release()
+        print(f"⚠️ {script} não encontrado")
+        return None
+
+    # O filho herda o descritor: o flock vive enquanto o manager viver,
+    # mesmo que o manager.py não saiba nada sobre o lock
+    os.set_inheritable(lock.fd, True)
+    env = dict(os.environ, **{MANAGER_LOCK_ENV: str(lock.fd)})
+
+    try:
+        pid = os.posix_spawn(
+            sys.executable, [sys.executable, script], env,
+            file_actions=[
+                (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+                (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+                (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+            ]
+        )
+        lock.write_pid(pid)
+    finally:
+        lock.release()
+
+    return pid
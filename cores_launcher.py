@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Core S Launcher
+Lançamento de aplicativos sem shell (posix_spawn), com reaping e tabela de PIDs
+"""
+
+import os
+import shlex
+import shutil
+import signal
+import time
+import tkinter as tk
+from collections import namedtuple
+
+# Aplicativo lançado pela taskbar e ainda em execução
+LaunchedApp = namedtuple("LaunchedApp", ["pid", "name", "argv", "started", "pidfd"])
+
+
+class AppLauncher:
+    """Serviço de lançamento atendido pelo loop do Tk"""
+
+    def __init__(self, root):
+        self.root = root
+        self.argv_cache = {}  # comando -> argv resolvido (uma vez)
+        self.running = {}     # pid -> LaunchedApp
+        self.use_pidfd = hasattr(os, "pidfd_open")
+        self._sigchld_installed = False
+
+        # stdin/stdout/stderr em /dev/null, como o Popen com DEVNULL
+        self.file_actions = [
+            (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+            (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+            (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+        ]
+
+    def resolve(self, command):
+        """Converter linha de comando em argv absoluto (com cache)"""
+        argv = self.argv_cache.get(command)
+        if argv is None:
+            argv = shlex.split(command)
+            if not argv:
+                raise ValueError("comando vazio")
+
+            path = shutil.which(argv[0])
+            if path is None:
+                raise FileNotFoundError(f"{argv[0]} não encontrado no PATH")
+
+            argv = [path] + argv[1:]
+            self.argv_cache[command] = argv
+        return argv
+
+    def launch(self, command, name=None):
+        """Iniciar aplicativo diretamente (sem /bin/sh nem thread)"""
+        argv = self.resolve(command)
+        pid = os.posix_spawn(argv[0], argv, os.environ, file_actions=self.file_actions)
+        self.track(pid, name or os.path.basename(argv[0]), argv)
+        return pid
+
+    def track(self, pid, name, argv=None):
+        """Acompanhar (e coletar ao terminar) um filho iniciado em outro lugar"""
+        pidfd = None
+        if self.use_pidfd:
+            try:
+                pidfd = os.pidfd_open(pid)
+            except OSError:
+                self.use_pidfd = False
+
+        self.running[pid] = LaunchedApp(pid, name, argv or [], time.time(), pidfd)
+
+        if pidfd is not None:
+            # pidfd fica legível quando o processo termina
+            self.root.tk.createfilehandler(pidfd, tk.READABLE, lambda fd, mask, p=pid: self._reap(p))
+        else:
+            self._install_sigchld()
+
+    def _install_sigchld(self):
+        """Fallback sem pidfd: reaping via SIGCHLD"""
+        if self._sigchld_installed:
+            return
+        signal.signal(signal.SIGCHLD, lambda signum, frame: self.reap_all())
+        self._sigchld_installed = True
+
+    def _reap(self, pid):
+        """Coletar um filho que terminou"""
+        app = self.running.get(pid)
+        if app is None:
+            return
+
+        try:
+            finished, _ = os.waitpid(pid, os.WNOHANG)
+        except ChildProcessError:
+            finished = pid
+
+        if not finished:
+            return
+
+        if app.pidfd is not None:
+            try:
+                self.root.tk.deletefilehandler(app.pidfd)
+            except Exception:
+                pass
+            os.close(app.pidfd)
+
+        del self.running[pid]
+
+    def reap_all(self):
+        """Coletar todos os filhos da taskbar que já terminaram"""
+        # Só PIDs próprios: não roubar o status de outros subprocess
+        for pid in list(self.running):
+            self._reap(pid)
+
+    def running_apps(self):
+        """Aplicativos lançados pela taskbar ainda em execução"""
+        return list(self.running.values())
+
+    def close(self):
+        """Parar de acompanhar os filhos (os aplicativos continuam rodando)"""
+        for app in self.running.values():
+            if app.pidfd is not None:
+                try:
+                    self.root.tk.deletefilehandler(app.pidfd)
+                except Exception:
+                    pass
+                os.close(app.pidfd)
+        self.running.clear()
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Core S Loop Stats
+Instrumentação opcional do loop do Tk: tempo de cada callback de after(),
+bind(), command=, createfilehandler() e trace_add(), histograma por nome e
+alerta de travamentos
+"""
+
+import json
+import os
+import time
+import tkinter as tk
+from collections import deque
+
+from cores_instance import runtime_path
+
+# Limites superiores (ms) das faixas do histograma; a última é "acima de 256"
+HISTOGRAM_BOUNDS = (0.5, 1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+
+def callback_name(func):
+    """Nome legível de um callback (método, função ou lambda)"""
+    name = getattr(func, "__qualname__", None) or getattr(func, "__name__", None)
+    return name or repr(func)
+
+
+class CallbackStats:
+    """Contagem, soma, máximo e histograma de um callback"""
+
+    __slots__ = ("count", "total_ms", "max_ms", "histogram")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.histogram = [0] * (len(HISTOGRAM_BOUNDS) + 1)
+
+    def add(self, elapsed_ms):
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+
+        for i, bound in enumerate(HISTOGRAM_BOUNDS):
+            if elapsed_ms <= bound:
+                self.histogram[i] += 1
+                return
+        self.histogram[-1] += 1
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "histogram": self.histogram,
+        }
+
+
+class TimedTkApp:
+    """Interpretador do Tk com createfilehandler cronometrado
+
+    O tkapp é um tipo C sem subclasses: os demais métodos são repassados e
+    guardados na instância no primeiro acesso (sem custo nas chamadas seguintes).
+    """
+
+    def __init__(self, tkapp, profiler):
+        self._tkapp = tkapp
+        self._profiler = profiler
+
+    def createfilehandler(self, file, mask, func):
+        func = self._profiler.wrap(f"filehandler:{callback_name(func)}", func)
+        return self._tkapp.createfilehandler(file, mask, func)
+
+    def __getattr__(self, name):
+        value = getattr(self._tkapp, name)
+        setattr(self, name, value)
+        return value
+
+
+class LoopProfiler:
+    """Mede callbacks do Tk trocando after/bind/command=/filehandlers/traces por
+    versões cronometradas
+
+    Sem install() nada é alterado (custo zero com a instrumentação desligada).
+    """
+
+    def __init__(self, stall_ms=50.0, stats_path=None, write_interval=10.0):
+        self.stall_ms = stall_ms
+        self.stats_path = stats_path or runtime_path("cores_taskbar_loopstats.json")
+        self.write_interval = write_interval
+        self.stats = {}                 # nome -> CallbackStats
+        self.stalls = deque(maxlen=50)  # (timestamp, nome, ms) mais recentes
+        self.started = time.time()
+        self.root = None
+        self._originals = {}
+        self._write_after_id = None
+
+    def wrap(self, name, func):
+        """Versão cronometrada de um callback"""
+        record = self.record
+
+        def timed(*args):
+            start = time.perf_counter()
+            try:
+                return func(*args)
+            finally:
+                record(name, (time.perf_counter() - start) * 1000)
+
+        timed.__qualname__ = callback_name(func)
+        return timed
+
+    def record(self, name, elapsed_ms):
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = CallbackStats()
+        stats.add(elapsed_ms)
+
+        if elapsed_ms > self.stall_ms:
+            self.stalls.append((time.time(), name, round(elapsed_ms, 3)))
+            print(f"🐢 {name} bloqueou o loop por {elapsed_ms:.1f} ms")
+
+    def install(self):
+        """Instrumentar todos os widgets (chamar antes de criar a interface)"""
+        if self._originals:
+            return
+
+        profiler = self
+        after = tk.Misc.after
+        bind = tk.Misc.bind
+        bind_all = tk.Misc.bind_all
+        bind_class = tk.Misc.bind_class
+        tag_bind = tk.Canvas.tag_bind
+        options = tk.Misc._options
+        trace_add = tk.Variable.trace_add
+        tk_init = tk.Tk.__init__
+        self._originals = {
+            (tk.Misc, "after"): after,
+            (tk.Misc, "bind"): bind,
+            (tk.Misc, "bind_all"): bind_all,
+            (tk.Misc, "bind_class"): bind_class,
+            (tk.Canvas, "tag_bind"): tag_bind,
+            (tk.Misc, "_options"): options,
+            (tk.Variable, "trace_add"): trace_add,
+            (tk.Tk, "__init__"): tk_init,
+        }
+
+        # after_idle passa por after('idle', ...)
+        def timed_after(self, ms, func=None, *args):
+            if func is None:
+                return after(self, ms)
+            kind = "idle" if ms == "idle" else "after"
+            return after(self, ms, profiler.wrap(f"{kind}:{callback_name(func)}", func), *args)
+
+        def timed_bind(self, sequence=None, func=None, add=None):
+            if callable(func):
+                func = profiler.wrap(f"bind {sequence}:{callback_name(func)}", func)
+            return bind(self, sequence, func, add)
+
+        def timed_bind_all(self, sequence=None, func=None, add=None):
+            if callable(func):
+                func = profiler.wrap(f"bind_all {sequence}:{callback_name(func)}", func)
+            return bind_all(self, sequence, func, add)
+
+        def timed_bind_class(self, className, sequence=None, func=None, add=None):
+            if callable(func):
+                func = profiler.wrap(f"bind_class {sequence}:{callback_name(func)}", func)
+            return bind_class(self, className, sequence, func, add)
+
+        def timed_tag_bind(self, tagOrId, sequence=None, func=None, add=None):
+            if callable(func):
+                func = profiler.wrap(f"tag_bind {sequence}:{callback_name(func)}", func)
+            return tag_bind(self, tagOrId, sequence, func, add)
+
+        # command=, xscrollcommand=, ... de qualquer widget
+        def timed_options(self, cnf, kw=None):
+            if kw:
+                cnf = tk._cnfmerge((cnf, kw))
+            else:
+                cnf = tk._cnfmerge(cnf)
+            cnf = {
+                k: profiler.wrap(f"{k}:{callback_name(v)}", v) if callable(v) else v
+                for k, v in cnf.items()
+            }
+            return options(self, cnf)
+
+        def timed_trace_add(self, mode, callback):
+            return trace_add(self, mode, profiler.wrap(f"trace {mode}:{callback_name(callback)}", callback))
+
+        # Socket de comandos, hotkeys, pidfds, pipe de update e RandR chegam por
+        # createfilehandler do interpretador criado aqui (herdado pelos widgets)
+        def timed_tk_init(self, *args, **kwargs):
+            tk_init(self, *args, **kwargs)
+            self.tk = TimedTkApp(self.tk, profiler)
+
+        tk.Misc.after = timed_after
+        tk.Misc.bind = timed_bind
+        tk.Misc.bind_all = timed_bind_all
+        tk.Misc.bind_class = timed_bind_class
+        tk.Canvas.tag_bind = timed_tag_bind
+        tk.Misc._options = timed_options
+        tk.Variable.trace_add = timed_trace_add
+        tk.Tk.__init__ = timed_tk_init
+
+    def uninstall(self):
+        """Restaurar métodos originais (callbacks já registrados seguem cronometrados)"""
+        for (cls, name), original in self._originals.items():
+            setattr(cls, name, original)
+        self._originals = {}
+
+    def attach(self, root):
+        """Gravar o arquivo de estatísticas periodicamente"""
+        self.root = root
+        self._schedule_write()
+
+    def _schedule_write(self):
+        # after original: a própria gravação não entra nas estatísticas
+        after = self._originals.get((tk.Misc, "after"), tk.Misc.after)
+        self._write_after_id = after(self.root, int(self.write_interval * 1000), self._periodic_write)
+
+    def _periodic_write(self):
+        self.write_stats()
+        self._schedule_write()
+
+    def detach(self):
+        if self._write_after_id is not None:
+            self.root.after_cancel(self._write_after_id)
+            self._write_after_id = None
+
+    def snapshot(self):
+        """Estatísticas atuais (callbacks em ordem de tempo total)"""
+        callbacks = sorted(self.stats.items(), key=lambda item: item[1].total_ms, reverse=True)
+        return {
+            "pid": os.getpid(),
+            "started": self.started,
+            "timestamp": time.time(),
+            "stall_ms": self.stall_ms,
+            "histogram_bounds_ms": list(HISTOGRAM_BOUNDS),
+            "callbacks": {name: stats.as_dict() for name, stats in callbacks},
+            "stalls": [{"timestamp": t, "name": n, "ms": ms} for t, n, ms in self.stalls],
+        }
+
+    def write_stats(self):
+        """Gravar estatísticas de forma atômica"""
+        try:
+            tmp_path = f"{self.stats_path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(self.snapshot(), f, indent=1)
+            os.replace(tmp_path, self.stats_path)
+        except OSError as e:
+            print(f"Erro ao gravar estatísticas do loop: {e}")
+
+    def report(self, limit=10):
+        """Exibir callbacks mais caros"""
+        print(f"⏱️ Callbacks do loop (limite de travamento: {self.stall_ms:.0f} ms):")
+        callbacks = sorted(self.stats.items(), key=lambda item: item[1].total_ms, reverse=True)
+        for name, stats in callbacks[:limit]:
+            mean = stats.total_ms / stats.count
+            print(f"   {stats.total_ms:9.1f} ms  n={stats.count:<6} média {mean:6.2f}  "
+                  f"max {stats.max_ms:7.1f}  {name}")
+        print(f"   travamentos recentes: {len(self.stalls)} (arquivo: {self.stats_path})")
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Core S Metrics
+Amostragem de CPU/RAM/swap em thread própria com histórico em buffers circulares
+"""
+
+import bisect
+import math
+import threading
+import time
+from array import array
+from collections import deque, namedtuple
+
+from cores_procstats import create_stats_backend
+
+# Último valor publicado para a interface (trocado atomicamente)
+MetricsSnapshot = namedtuple("MetricsSnapshot", ["seq", "timestamp", "cpu", "ram", "swap"])
+
+# Taxas da amostra em lote: % por núcleo, bytes/s de disco e {iface: (rx, tx)} em bytes/s
+SystemDetail = namedtuple("SystemDetail", ["cores", "disk_read", "disk_write", "net"])
+
+
+class RingBuffer:
+    """Histórico circular compacto de floats (array('f'); 'd' para horários)"""
+
+    def __init__(self, capacity, typecode='f'):
+        self.capacity = capacity
+        self.data = array(typecode, bytes(array(typecode).itemsize * capacity))
+        self.index = 0  # próxima posição de escrita
+        self.count = 0
+
+    def append(self, value):
+        self.data[self.index] = value
+        self.index = (self.index + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def last(self, default=0.0):
+        if not self.count:
+            return default
+        return self.data[self.index - 1]
+
+    def values(self, n=None):
+        """Últimos n valores, do mais antigo ao mais recente"""
+        n = self.count if n is None else min(n, self.count)
+        start = (self.index - n) % self.capacity
+        if start + n <= self.capacity:
+            return self.data[start:start + n]
+        return self.data[start:] + self.data[:self.index]
+
+    def __len__(self):
+        return self.count
+
+
+class WakeupCounter:
+    """Contador de despertares na última janela de tempo"""
+
+    def __init__(self, window=60.0):
+        self.window = window
+        self.total = 0
+        self._times = deque()
+
+    def record(self):
+        now = time.monotonic()
+        self.total += 1
+        self._times.append(now)
+        self._trim(now)
+
+    def per_minute(self):
+        """Despertares por minuto (média da janela)"""
+        self._trim(time.monotonic())
+        return len(self._times) * 60.0 / self.window
+
+    def _trim(self, now):
+        while self._times and self._times[0] < now - self.window:
+            self._times.popleft()
+
+
+class CounterRates:
+    """Deltas entre duas leituras de contadores (SystemCounters) em taxas"""
+
+    def __init__(self):
+        self.prev = None
+
+    def update(self, counters):
+        """SystemDetail desde a leitura anterior (zeros na primeira)"""
+        prev = self.prev
+        self.prev = counters
+        if prev is None or len(prev.cores) != len(counters.cores):
+            # Primeira leitura ou núcleos ligados/desligados: só a base
+            return SystemDetail([0.0] * len(counters.cores), 0.0, 0.0,
+                                {name: (0.0, 0.0) for name in counters.net})
+
+        elapsed = counters.time - prev.time
+        if elapsed <= 0:
+            elapsed = 1e-9
+
+        cores = []
+        for (total, idle), (prev_total, prev_idle) in zip(counters.cores, prev.cores):
+            delta_total = total - prev_total
+            busy = delta_total - (idle - prev_idle)
+            cores.append(round(100.0 * busy / delta_total, 1) if delta_total > 0 else 0.0)
+
+        # Contadores que voltaram (dispositivo removido/recriado) contam como zero
+        disk_read = max(0, counters.disk[0] - prev.disk[0]) / elapsed
+        disk_write = max(0, counters.disk[1] - prev.disk[1]) / elapsed
+
+        net = {}
+        for name, (rx, tx) in counters.net.items():
+            prev_rx, prev_tx = prev.net.get(name, (rx, tx))
+            net[name] = (max(0, rx - prev_rx) / elapsed, max(0, tx - prev_tx) / elapsed)
+
+        return SystemDetail(cores, disk_read, disk_write, net)
+
+
+class MetricsSampler:
+    """Amostrador com cadência fixa fora da thread do Tk
+
+    As amostras caem nos múltiplos do intervalo no relógio de parede; on_sample
+    (se definido) é chamado nesta thread a cada amostra publicada.
+    """
+
+    METRICS = ("cpu", "ram", "swap")
+
+    def __init__(self, interval=1.0, history=3600, backend=None, on_sample=None):
+        self.interval = interval  # None = suspenso
+        self.on_sample = on_sample  # ex.: TkResultQueue.post (acordar a interface)
+        self.backend = backend or create_stats_backend()
+        self.history = {name: RingBuffer(history) for name in self.METRICS}
+        self.times = RingBuffer(history, 'd')  # horário (time.time()) de cada amostra
+        self.snapshot = MetricsSnapshot(0, 0.0, 0.0, 0.0, 0.0)
+        # Núcleos/disco/rede só quando há quem exiba (set_detailed)
+        self.detailed = False
+        self.detail = None
+        self.rates = CounterRates()
+        self.wakeups = WakeupCounter()
+        self._stopped = False
+        self._sample_requested = False
+        self._wake = threading.Event()
+        self._write_lock = threading.Lock()
+        self._thread = None
+
+    def start(self):
+        """Iniciar thread de amostragem"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="cores-metrics", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Parar amostragem"""
+        self._stopped = True
+        self._wake.set()
+
+    def set_interval(self, interval):
+        """Trocar cadência (None suspende por completo, sem despertares)"""
+        if interval == self.interval:
+            return
+        self.interval = interval
+        self._wake.set()
+
+    def request_sample(self):
+        """Amostrar já na thread (ao voltar de recolhido/oculto)"""
+        self._sample_requested = True
+        self._wake.set()
+
+    def set_detailed(self, detailed):
+        """Ativar a amostra em lote (núcleos, disco, rede) a partir da próxima amostra"""
+        with self._write_lock:
+            if detailed != self.detailed:
+                # Religada: a primeira amostra só refaz a base das taxas
+                self.rates.prev = None
+            self.detailed = detailed
+
+    def read_sample(self):
+        """Ler métricas atuais (cpu%, ram%, swap%)"""
+        if self.detailed:
+            # Uma leitura em lote: o agregado sai das mesmas linhas de /proc/stat
+            counters = self.backend.read_counters()
+            cpu = self.backend.cpu_delta(*counters.cpu)
+            self.detail = self.rates.update(counters)
+        else:
+            cpu = self.backend.cpu_percent()  # Delta desde a última leitura
+        ram, swap = self.backend.memory_percents()  # Uma leitura para os dois
+        return cpu, ram, swap
+
+    def sample_now(self):
+        """Coletar uma amostra, gravar no histórico e publicar"""
+        cpu, ram, swap = self.read_sample()
+        now = time.time()
+        # Lock só para gravar: window() lê horários e valores consistentes
+        with self._write_lock:
+            self.history["cpu"].append(cpu)
+            self.history["ram"].append(ram)
+            self.history["swap"].append(swap)
+            self.times.append(now)
+
+            # Atribuição única: o snapshot é lido sem lock
+            self.snapshot = MetricsSnapshot(self.snapshot.seq + 1, now, cpu, ram, swap)
+            return self.snapshot
+
+    def window(self, seconds):
+        """(horários, {métrica: valores}) das amostras nos últimos seconds antes da mais recente
+
+        Seleção pelo horário: a cadência muda com o estado da interface (3 s
+        expandida, 10 s recolhida), então a contagem de amostras não mede tempo.
+        """
+        with self._write_lock:
+            times = self.times.values()
+            if not times:
+                return times, {name: times for name in self.METRICS}
+            first = bisect.bisect_left(times, times[-1] - seconds)
+            n = len(times) - first
+            return times[first:], {name: self.history[name].values(n) for name in self.METRICS}
+
+    def _due_in(self, interval):
+        """Segundos até o próximo múltiplo de interval no relógio de parede"""
+        now = time.time()
+        return (math.floor(now / interval) + 1) * interval - now
+
+    def _run(self):
+        """Laço alinhado ao relógio (sem deriva; amostras perdidas são puladas)"""
+        # Primeira leitura de cpu_percent só estabelece a base
+        self.backend.cpu_percent()
+
+        while not self._stopped:
+            interval = self.interval
+            timeout = None if interval is None else self._due_in(interval)
+
+            if self._wake.wait(timeout):
+                # Cadência alterada, parada ou amostra pedida pela interface
+                self._wake.clear()
+                if not self._sample_requested or self._stopped:
+                    continue
+                self._sample_requested = False
+
+            self.wakeups.record()
+            try:
+                snapshot = self.sample_now()
+            except Exception:
+                continue
+
+            on_sample = self.on_sample
+            if on_sample is not None:
+                on_sample(snapshot)
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Core S Proc Stats
+Leitura de CPU/RAM/swap direto de /proc (arquivos abertos, buffer reutilizado)
+com fallback transparente para psutil; contadores por núcleo, disco e rede
+numa única leitura em lote
+"""
+
+import operator
+import os
+import time
+from collections import namedtuple
+
+# Contadores brutos de uma amostra em lote (taxas calculadas por quem consome)
+#   cpu:   (total, ocioso) agregados em jiffies
+#   cores: [(total, ocioso), ...] por núcleo
+#   disk:  (bytes lidos, bytes escritos) somando os discos inteiros
+#   net:   {interface: (bytes recebidos, bytes enviados)} sem "lo"
+SystemCounters = namedtuple("SystemCounters", ["time", "cpu", "cores", "disk", "net"])
+
+# Dispositivos que duplicariam a contagem dos discos físicos (ou não são discos)
+VIRTUAL_DISK_PREFIXES = ("loop", "ram", "zram", "dm-", "md")
+
+
+def cpu_times(fields):
+    """(total, ocioso) de uma linha "cpu" de /proc/stat (campos já separados)"""
+    user, nice, system, idle, iowait, irq, softirq, steal = map(int, fields[:8])
+    # guest/guest_nice já estão contidos em user/nice
+    return user + nice + system + idle + iowait + irq + softirq + steal, idle + iowait
+
+
+def list_block_disks(block_dir="/sys/block"):
+    """Discos inteiros (sem partições nem dispositivos virtuais)"""
+    try:
+        names = os.listdir(block_dir)
+    except OSError:
+        return frozenset()
+    # Nomes em bytes: comparados direto com os campos de /proc/diskstats
+    return frozenset(n.encode() for n in names if not n.startswith(VIRTUAL_DISK_PREFIXES))
+
+
+class StatsBackend:
+    """Base comum: uso agregado de CPU por delta de jiffies"""
+
+    def __init__(self):
+        self.prev_total = 0
+        self.prev_idle = 0
+
+    def cpu_delta(self, total, idle):
+        """Uso de CPU desde a última chamada (mesma conta do psutil)"""
+        delta_total = total - self.prev_total
+        delta_idle = idle - self.prev_idle
+        self.prev_total = total
+        self.prev_idle = idle
+
+        if delta_total <= 0:
+            return 0.0
+        return round(100.0 * (delta_total - delta_idle) / delta_total, 1)
+
+
+class ProcStatsReader(StatsBackend):
+    """Backend Linux: /proc/stat e /proc/meminfo via os.preadv"""
+
+    name = "proc"
+
+    def __init__(self, stat_path="/proc/stat", meminfo_path="/proc/meminfo",
+                 diskstats_path="/proc/diskstats", netdev_path="/proc/net/dev",
+                 block_dir="/sys/block"):
+        super().__init__()
+        # Arquivos ficam abertos; cada leitura é um único preadv no offset 0
+        self.stat_fd = os.open(stat_path, os.O_RDONLY)
+        self.meminfo_fd = os.open(meminfo_path, os.O_RDONLY)
+        self.buffer = bytearray(4096)
+        # Contadores em lote: abertos na primeira read_counters()
+        self.diskstats_path = diskstats_path
+        self.netdev_path = netdev_path
+        self.block_dir = block_dir
+        self.diskstats_fd = None
+        self.netdev_fd = None
+        self.disks = None
+        self.large_buffer = bytearray(16384)  # cresce para máquinas grandes
+
+    def _read(self, fd):
+        """Ler o início do arquivo para o buffer reutilizado (bytes lidos)"""
+        return os.preadv(fd, [self.buffer], 0)
+
+    def _read_large(self, fd, until=None):
+        """Ler o arquivo (ou até o marcador until) para o buffer grande"""
+        while True:
+            size = os.preadv(fd, [self.large_buffer], 0)
+            if size < len(self.large_buffer):
+                return size
+            if until is not None and self.large_buffer.find(until, 0, size) >= 0:
+                return size
+            # Buffer cheio sem o trecho necessário: dobrar e reler
+            self.large_buffer = bytearray(2 * len(self.large_buffer))
+
+    def cpu_percent(self):
+        """Uso de CPU desde a última chamada (só a primeira linha de /proc/stat)"""
+        size = self._read(self.stat_fd)
+        end = self.buffer.find(b"\n", 0, size)
+        # "cpu  user nice system idle iowait irq softirq steal guest guest_nice"
+        return self.cpu_delta(*cpu_times(self.buffer[5:end].split()))
+
+    def ram_percent(self):
+        """Uso de RAM (MemTotal - MemAvailable) em %"""
+        size = self._read(self.meminfo_fd)
+        total = self._meminfo_field(b"MemTotal:", size)
+        available = self._meminfo_field(b"MemAvailable:", size)
+        if not total:
+            return 0.0
+        return round(100.0 * (total - available) / total, 1)
+
+    def memory_percents(self):
+        """RAM e swap em % com uma única leitura de /proc/meminfo"""
+        size = self._read(self.meminfo_fd)
+        total = self._meminfo_field(b"MemTotal:", size)
+        available = self._meminfo_field(b"MemAvailable:", size)
+        swap_total = self._meminfo_field(b"SwapTotal:", size)
+        swap_free = self._meminfo_field(b"SwapFree:", size)
+
+        ram = round(100.0 * (total - available) / total, 1) if total else 0.0
+        swap = round(100.0 * (swap_total - swap_free) / swap_total, 1) if swap_total else 0.0
+        return ram, swap
+
+    def _meminfo_field(self, key, size):
+        """Valor em kB de um campo de /proc/meminfo já no buffer"""
+        start = self.buffer.find(key, 0, size)
+        if start < 0:
+            return 0
+        end = self.buffer.find(b"\n", start, size)
+        # int() aceita os espaços do alinhamento; só o sufixo " kB" é cortado
+        return int(self.buffer[start + len(key):end - 3])
+
+    def read_counters(self):
+        """Núcleos, discos e rede: um preadv por arquivo, sem taxas"""
+        if self.diskstats_fd is None:
+            self.diskstats_fd = os.open(self.diskstats_path, os.O_RDONLY)
+            self.netdev_fd = os.open(self.netdev_path, os.O_RDONLY)
+            self.disks = list_block_disks(self.block_dir)
+
+        now = time.monotonic()
+
+        # /proc/stat: linhas "cpu" vêm antes de "intr" (que pode ser enorme)
+        size = self._read_large(self.stat_fd, until=b"\nintr")
+        buf = self.large_buffer
+        end = buf.find(b"\nintr", 0, size) + 1
+        if not end:
+            while buf.startswith(b"cpu", end):
+                end = buf.find(b"\n", end, size) + 1
+
+        # Bloco inteiro num split; colunas somadas por fatias (sem laço por núcleo)
+        width = len(buf[:buf.find(b"\n")].split())  # nome + colunas da versão do kernel
+        tokens = bytes(buf[:end]).split()
+        # Só user .. steal são convertidas (guest/guest_nice já estão em user/nice)
+        columns = [list(map(int, tokens[k::width])) for k in range(1, 9)]
+        totals = list(map(sum, zip(*columns)))
+        idles = list(map(operator.add, columns[3], columns[4]))  # idle + iowait
+        cpu = (totals[0], idles[0])
+        cores = list(zip(totals[1:], idles[1:]))
+
+        # /proc/diskstats: "maj min nome lidas ... setores_lidos ... setores_escritos"
+        size = self._read_large(self.diskstats_fd)
+        read_sectors = write_sectors = 0
+        for line in bytes(self.large_buffer[:size]).splitlines():
+            fields = line.split()
+            if len(fields) > 9 and fields[2] in self.disks:
+                read_sectors += int(fields[5])
+                write_sectors += int(fields[9])
+        disk = (read_sectors * 512, write_sectors * 512)  # setores de 512 B no kernel
+
+        # /proc/net/dev: duas linhas de cabeçalho, depois "iface: rx_bytes ... tx_bytes"
+        size = self._read_large(self.netdev_fd)
+        net = {}
+        for line in bytes(self.large_buffer[:size]).splitlines()[2:]:
+            name, _, data = line.partition(b":")
+            name = name.strip().decode()
+            if name == "lo":
+                continue
+            fields = data.split()
+            net[name] = (int(fields[0]), int(fields[8]))
+
+        return SystemCounters(now, cpu, cores, disk, net)
+
+    def close(self):
+        for fd in (self.stat_fd, self.meminfo_fd, self.diskstats_fd, self.netdev_fd):
+            if fd is None:
+                continue
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
+class PsutilStats(StatsBackend):
+    """Backend portátil via psutil"""
+
+    name = "psutil"
+
+    def __init__(self):
+        super().__init__()
+        import psutil
+        self.psutil = psutil
+
+    def cpu_percent(self):
+        return self.psutil.cpu_percent(interval=None)
+
+    def ram_percent(self):
+        return self.psutil.virtual_memory().percent
+
+    def memory_percents(self):
+        return self.psutil.virtual_memory().percent, self.psutil.swap_memory().percent
+
+    def read_counters(self):
+        """Mesmos contadores com uma chamada psutil por tipo"""
+        now = time.monotonic()
+        cores = []
+        for t in self.psutil.cpu_times(percpu=True):
+            idle = t.idle + getattr(t, "iowait", 0.0)
+            # guest/guest_nice já contidos em user/nice (como no backend /proc)
+            total = sum(t) - getattr(t, "guest", 0.0) - getattr(t, "guest_nice", 0.0)
+            cores.append((total, idle))
+        cpu = (sum(c[0] for c in cores), sum(c[1] for c in cores))
+
+        io = self.psutil.disk_io_counters()
+        disk = (io.read_bytes, io.write_bytes) if io else (0, 0)
+
+        net = {name: (c.bytes_recv, c.bytes_sent)
+               for name, c in self.psutil.net_io_counters(pernic=True).items() if name != "lo"}
+        return SystemCounters(now, cpu, cores, disk, net)
+
+    def close(self):
+        pass
+
+
+def create_stats_backend(prefer="proc"):
+    """Backend /proc quando disponível, senão psutil"""
+    if prefer == "proc" and hasattr(os, "preadv"):
+        try:
+            backend = ProcStatsReader()
+            backend.cpu_percent()
+            backend.memory_percents()
+            return backend
+        except (OSError, ValueError):
+            pass
+    return PsutilStats()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Core S Scheduler
+Agendador periódico único no loop do Tk: tarefas alinhadas ao relógio de
+parede compartilham o mesmo despertar
+"""
+
+import math
+import time
+
+from cores_metrics import WakeupCounter
+
+
+class PeriodicTask:
+    """Tarefa registrada no agendador"""
+
+    __slots__ = ("name", "interval", "callback", "align", "next_due", "runs")
+
+    def __init__(self, name, interval, callback, align):
+        self.name = name
+        self.interval = interval  # segundos; None = pausada
+        self.callback = callback
+        self.align = align
+        self.next_due = None
+        self.runs = 0
+
+    def due_after(self, now):
+        """Próximo instante devido estritamente depois de now"""
+        if self.align:
+            # Múltiplos do intervalo no relógio de parede (1 s -> cada segundo cheio)
+            return (math.floor(now / self.interval) + 1) * self.interval
+        return now + self.interval
+
+
+class PeriodicScheduler:
+    """Um after() por despertar, executando todas as tarefas devidas"""
+
+    def __init__(self, root, slack=0.02):
+        self.root = root
+        self.slack = slack  # tarefas devidas dentro desta janela rodam juntas
+        self.tasks = {}
+        self.wakeups = WakeupCounter()
+        self._after_id = None
+        self._wake_at = None
+
+    def register(self, name, interval, callback, align=True):
+        """Registrar (ou substituir) tarefa a cada interval segundos"""
+        task = PeriodicTask(name, interval, callback, align)
+        self.tasks[name] = task
+        if interval is not None:
+            task.next_due = task.due_after(time.time())
+        self._reschedule()
+        return task
+
+    def unregister(self, name):
+        if self.tasks.pop(name, None) is not None:
+            self._reschedule()
+
+    def set_interval(self, name, interval):
+        """Trocar cadência (None pausa a tarefa sem custo)"""
+        task = self.tasks[name]
+        if interval == task.interval and (interval is None or task.next_due is not None):
+            return
+
+        task.interval = interval
+        task.next_due = None if interval is None else task.due_after(time.time())
+        self._reschedule()
+
+    def run_now(self, name):
+        """Executar uma tarefa imediatamente (sem mudar a cadência)"""
+        self._run(self.tasks[name])
+
+    def _run(self, task):
+        task.runs += 1
+        try:
+            task.callback()
+        except Exception as e:
+            print(f"Erro na tarefa {task.name}: {e}")
+
+    def _reschedule(self):
+        """Armar um único after() para a tarefa mais próxima"""
+        due = [t.next_due for t in self.tasks.values() if t.next_due is not None]
+        wake_at = min(due) if due else None
+        if wake_at == self._wake_at and self._after_id is not None:
+            return
+
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+        self._wake_at = wake_at
+        if wake_at is not None:
+            # Arredondar para cima: acordar logo depois da borda do segundo, nunca antes
+            delay = max(1, math.ceil((wake_at - time.time()) * 1000))
+            self._after_id = self.root.after(delay, self._tick)
+
+    def _tick(self):
+        self._after_id = None
+        self._wake_at = None
+        self.wakeups.record()
+
+        now = time.time()
+        for task in list(self.tasks.values()):
+            if task.next_due is None or task.next_due > now + self.slack:
+                continue
+
+            self._run(task)
+            # Ticks perdidos (suspensão, travamento) são pulados, não acumulados
+            if task.interval is not None and self.tasks.get(task.name) is task:
+                task.next_due = task.due_after(max(now, task.next_due))
+
+        self._reschedule()
+
+    def stop(self):
+        """Cancelar o despertar pendente"""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        self._wake_at = None
+        self.tasks.clear()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Core S Screens
+Geometria dos monitores (XRandR via ctypes), lida uma vez e atualizada só
+nos eventos de mudança do RandR; posições de canto pré-calculadas
+"""
+
+import ctypes
+import tkinter as tk
+from collections import namedtuple
+
+from cores_xhotkeys import XEvent, load_xlib
+
+# Máscaras/eventos do RandR
+RR_SCREEN_CHANGE_NOTIFY_MASK = 1 << 0
+RR_CRTC_CHANGE_NOTIFY_MASK = 1 << 1
+RR_OUTPUT_CHANGE_NOTIFY_MASK = 1 << 2
+RR_SCREEN_CHANGE_NOTIFY = 0
+RR_NOTIFY = 1
+
+# Rajadas de eventos (troca de modo gera vários) viram uma releitura
+REFRESH_DELAY_MS = 100
+
+Monitor = namedtuple("Monitor", ["name", "x", "y", "width", "height", "primary"])
+
+CORNERS = ("bottom_left", "top_left", "top_right", "bottom_right")
+
+
+class XRRMonitorInfo(ctypes.Structure):
+    _fields_ = [
+        ("name", ctypes.c_ulong),
+        ("primary", ctypes.c_int),
+        ("automatic", ctypes.c_int),
+        ("noutput", ctypes.c_int),
+        ("x", ctypes.c_int),
+        ("y", ctypes.c_int),
+        ("width", ctypes.c_int),
+        ("height", ctypes.c_int),
+        ("mwidth", ctypes.c_int),
+        ("mheight", ctypes.c_int),
+        ("outputs", ctypes.c_void_p),
+    ]
+
+
+def load_xrandr():
+    """Carregar libXrandr (None se indisponível ou sem RandR 1.5)"""
+    for name in ("libXrandr.so.2", "libXrandr.so"):
+        try:
+            xrandr = ctypes.CDLL(name)
+            break
+        except OSError:
+            continue
+    else:
+        return None
+
+    if not hasattr(xrandr, "XRRGetMonitors"):
+        return None
+
+    xrandr.XRRQueryExtension.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_int),
+                                         ctypes.POINTER(ctypes.c_int)]
+    xrandr.XRRSelectInput.argtypes = [ctypes.c_void_p, ctypes.c_ulong, ctypes.c_int]
+    xrandr.XRRGetMonitors.restype = ctypes.POINTER(XRRMonitorInfo)
+    xrandr.XRRGetMonitors.argtypes = [ctypes.c_void_p, ctypes.c_ulong, ctypes.c_int,
+                                      ctypes.POINTER(ctypes.c_int)]
+    xrandr.XRRFreeMonitors.argtypes = [ctypes.POINTER(XRRMonitorInfo)]
+    xrandr.XRRUpdateConfiguration.argtypes = [ctypes.POINTER(XEvent)]
+    return xrandr
+
+
+def build_corner_table(monitors, square_size, expanded_width, height, margin):
+    """{(monitor, canto, expandido): (largura, altura, x, y)} para todos os casos"""
+    table = {}
+    for index, m in enumerate(monitors):
+        for corner in CORNERS:
+            left = corner.endswith("left")
+            top = corner.startswith("top")
+            for expanded in (False, True):
+                # Só os cantos esquerdos expandem (a barra cresce para a direita)
+                width = expanded_width if expanded and left else square_size
+                x = m.x + margin if left else m.x + m.width - square_size - margin
+                y = m.y + margin if top else m.y + m.height - height - margin
+                table[(index, corner, expanded)] = (width, height, x, y)
+    return table
+
+
+class ScreenGeometry:
+    """Monitores atuais e notificação de mudanças via RandR"""
+
+    def __init__(self, root, on_change=None):
+        self.root = root
+        self.on_change = on_change
+        self.monitors = []
+        self.xlib = None
+        self.xrandr = None
+        self.display = None
+        self.root_window = None
+        self.fd = None
+        self.event_base = 0
+        self.event = XEvent()
+        self._refresh_after_id = None
+
+    def start(self, display_name=None):
+        """Ler layout (XRandR ou tela única do Tk); True se houver eventos RandR"""
+        if self._open_xrandr(display_name):
+            self.monitors = self.read_monitors()
+            self.xrandr.XRRSelectInput(
+                self.display, self.root_window,
+                RR_SCREEN_CHANGE_NOTIFY_MASK | RR_CRTC_CHANGE_NOTIFY_MASK | RR_OUTPUT_CHANGE_NOTIFY_MASK
+            )
+            self.xlib.XFlush(self.display)
+
+            self.fd = self.xlib.XConnectionNumber(self.display)
+            self.root.tk.createfilehandler(self.fd, tk.READABLE, self._on_readable)
+
+        if not self.monitors:
+            # Sem RandR: a tela X inteira como um monitor
+            self.monitors = [Monitor("screen", 0, 0, self.root.winfo_screenwidth(),
+                                     self.root.winfo_screenheight(), True)]
+        return self.fd is not None
+
+    def _open_xrandr(self, display_name):
+        self.xlib = load_xlib()
+        self.xrandr = load_xrandr() if self.xlib else None
+        if self.xrandr is None:
+            return False
+
+        self.display = self.xlib.XOpenDisplay(display_name.encode() if display_name else None)
+        if not self.display:
+            return False
+
+        event_base, error_base = ctypes.c_int(), ctypes.c_int()
+        if not self.xrandr.XRRQueryExtension(self.display, ctypes.byref(event_base),
+                                             ctypes.byref(error_base)):
+            self.stop()
+            return False
+
+        self.event_base = event_base.value
+        self.root_window = self.xlib.XDefaultRootWindow(self.display)
+        return True
+
+    def read_monitors(self):
+        """Monitores ativos, primário primeiro, depois da esquerda para a direita"""
+        count = ctypes.c_int()
+        info = self.xrandr.XRRGetMonitors(self.display, self.root_window, True, ctypes.byref(count))
+        if not info:
+            return []
+
+        monitors = []
+        try:
+            for i in range(count.value):
+                m = info[i]
+                name = self.xlib.XGetAtomName(self.display, m.name) if m.name else None
+                monitors.append(Monitor(
+                    ctypes.string_at(name).decode() if name else f"monitor-{i}",
+                    m.x, m.y, m.width, m.height, bool(m.primary)
+                ))
+                if name:
+                    self.xlib.XFree(name)
+        finally:
+            self.xrandr.XRRFreeMonitors(info)
+
+        monitors.sort(key=lambda m: (not m.primary, m.x, m.y))
+        return monitors
+
+    def find_monitor(self, target):
+        """Índice do monitor por nome, índice ou "primary" (0 se não encontrado)"""
+        if isinstance(target, int) or (isinstance(target, str) and target.isdigit()):
+            index = int(target)
+            return index if 0 <= index < len(self.monitors) else 0
+
+        for index, monitor in enumerate(self.monitors):
+            if monitor.name == target or (target == "primary" and monitor.primary):
+                return index
+        return 0
+
+    def _on_readable(self, fd, mask):
+        """Consumir eventos; releitura adiada para juntar a rajada"""
+        changed = False
+        while self.display and self.xlib.XPending(self.display):
+            self.xlib.XNextEvent(self.display, ctypes.byref(self.event))
+            if self.event.type in (self.event_base + RR_SCREEN_CHANGE_NOTIFY,
+                                   self.event_base + RR_NOTIFY):
+                self.xrandr.XRRUpdateConfiguration(ctypes.byref(self.event))
+                changed = True
+
+        if changed and self._refresh_after_id is None:
+            self._refresh_after_id = self.root.after(REFRESH_DELAY_MS, self.refresh)
+
+    def refresh(self):
+        """Reler monitores e avisar só se o layout mudou"""
+        self._refresh_after_id = None
+        monitors = self.read_monitors()
+        if monitors and monitors != self.monitors:
+            self.monitors = monitors
+            if self.on_change:
+                self.on_change(monitors)
+
+    def stop(self):
+        """Fechar conexão e sair do loop"""
+        if self._refresh_after_id is not None:
+            self.root.after_cancel(self._refresh_after_id)
+            self._refresh_after_id = None
+
+        if self.fd is not None:
+            try:
+                self.root.tk.deletefilehandler(self.fd)
+            except Exception:
+                pass
+            self.fd = None
+
+        if self.display:
+            self.xlib.XCloseDisplay(self.display)
+            self.display = None
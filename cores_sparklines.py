@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Core S Sparklines
+Mini gráficos de CPU/RAM/swap num canvas, pontos posicionados pelo horário da
+amostra: a cada amostra a linha existente é deslocada e ganha um ponto
+(move/insert/dchars), sem reenviar a série inteira
+"""
+
+from array import array
+from collections import deque
+
+# Janelas de visualização (segundos); clique alterna entre elas
+VIEWS = (60, 600)
+
+
+class Sparkline:
+    """Polilinha com x proporcional ao tempo, a amostra mais recente à direita"""
+
+    def __init__(self, canvas, x, y, width, height, color, outline, capacity, tags=()):
+        self.canvas = canvas
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.right = x + width
+        self.baseline = y + height
+        self.scale = height / 100.0
+
+        canvas.create_rectangle(x - 1, y - 1, x + width + 1, y + height + 1,
+                                outline=outline, width=1, tags=tags)
+        self.line = canvas.create_line(x, self.baseline, x + width, self.baseline,
+                                       fill=color, width=1, tags=tags)
+        self.times = deque()  # horário de cada ponto da linha
+        # Buffer x,y pré-alocado para o histórico inteiro (redesenho sem listas novas)
+        self.capacity = capacity
+        self.coords = array('d', bytes(16 * capacity))
+        self.set_view(VIEWS[0])
+
+    def set_view(self, seconds):
+        """Janela em segundos (largura inteira do gráfico)"""
+        self.view = seconds
+        self.time_scale = self.width / seconds
+        self.times.clear()
+
+    def y_of(self, value):
+        return self.baseline - min(max(value, 0.0), 100.0) * self.scale
+
+    def redraw(self, times, values):
+        """Série inteira a partir do histórico (ao exibir ou trocar de janela)"""
+        self.times.clear()
+        n = min(len(times), len(values), self.capacity)
+        if n < 2:
+            self.canvas.coords(self.line, self.x, self.baseline, self.right, self.baseline)
+            return
+
+        times = times[len(times) - n:]
+        right = self.right
+        last = times[-1]
+        time_scale = self.time_scale
+        baseline = self.baseline
+        scale = self.scale
+        coords = self.coords
+        index = 0
+        for t, value in zip(times, values[len(values) - n:]):
+            coords[index] = right - (last - t) * time_scale
+            coords[index + 1] = baseline - min(max(value, 0.0), 100.0) * scale
+            index += 2
+
+        # Uma única chamada coords com o trecho preenchido do buffer
+        self.canvas.coords(self.line, coords[:index].tolist())
+        self.times.extend(times)
+
+    def push(self, timestamp, value):
+        """Deslocar a linha pelo tempo decorrido e acrescentar o ponto novo
+
+        False quando não dá para deslocar (linha vazia, relógio voltou ou
+        intervalo maior que a janela): quem chama redesenha do histórico.
+        """
+        times = self.times
+        if len(times) < 2:
+            return False
+        elapsed = timestamp - times[-1]
+        if elapsed <= 0 or elapsed >= self.view:
+            return False
+
+        canvas = self.canvas
+        canvas.move(self.line, -elapsed * self.time_scale, 0)
+        canvas.insert(self.line, "end", (self.right, self.y_of(value)))
+        times.append(timestamp)
+
+        # Pontos que saíram pela esquerda (índices de coordenada x0, y0, x1, ...)
+        start = timestamp - self.view
+        gone = 0
+        while len(times) > 2 and times[0] < start:
+            times.popleft()
+            gone += 1
+        if gone:
+            canvas.dchars(self.line, 0, 2 * gone - 1)
+        return True
+
+
+class SparklineGroup:
+    """CPU, RAM e swap lado a lado sobre a mesma janela de tempo"""
+
+    def __init__(self, canvas, x, y, window, capacity, colors, outline,
+                 width=36, height=14, gap=4, tags=()):
+        self.window = window  # segundos -> (horários, {nome: valores}) ou None
+        self.lines = {}
+        for i, (name, color) in enumerate(colors.items()):
+            self.lines[name] = Sparkline(canvas, x + i * (width + gap), y, width, height,
+                                         color, outline, capacity, tags)
+        self.total_width = len(colors) * (width + gap) - gap
+        self.view = None
+        self.stale = True
+        self.set_view(VIEWS[0])
+
+    def set_view(self, seconds):
+        """Trocar janela (60 s / 10 min); redesenho no próximo refresh"""
+        self.view = seconds
+        for line in self.lines.values():
+            line.set_view(seconds)
+        self.stale = True
+
+    def toggle_view(self, event=None):
+        self.set_view(VIEWS[(VIEWS.index(self.view) + 1) % len(VIEWS)])
+        self.refresh()
+
+    def refresh(self):
+        """Redesenho completo só se amostras chegaram com os gráficos ocultos"""
+        if not self.stale:
+            return
+        window = self.window(self.view)
+        if window is not None:
+            times, series = window
+            for name, line in self.lines.items():
+                line.redraw(times, series[name])
+        self.stale = False
+
+    def push(self, snapshot):
+        """Amostra nova com os gráficos visíveis"""
+        if not self.stale:
+            for name, line in self.lines.items():
+                if not line.push(snapshot.timestamp, getattr(snapshot, name)):
+                    self.stale = True
+                    break
+            else:
+                return
+        self.refresh()  # o histórico já contém a amostra
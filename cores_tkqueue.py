@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Core S Tk Queue
+Resultados de threads entregues ao loop do Tk: fila + pipe observado por
+createfilehandler (sem polling e sem tocar em widgets fora da thread do Tk)
+"""
+
+import os
+import queue
+import threading
+import tkinter as tk
+
+
+class TkResultQueue:
+    """Fila cujo consumidor roda no loop do Tk
+
+    post() pode ser chamado de qualquer thread; depois de close() é ignorado
+    (o fd do pipe nunca é escrito já fechado ou reaproveitado).
+    """
+
+    def __init__(self, root, on_result, latest_only=False):
+        self.root = root
+        self.on_result = on_result
+        self.latest_only = latest_only  # entregar só o resultado mais recente
+        self.results = queue.Queue()
+        self.read_fd, self.write_fd = os.pipe()
+        os.set_blocking(self.read_fd, False)
+        # Pipe cheio = já há despertar pendente: post() não bloqueia
+        os.set_blocking(self.write_fd, False)
+        self._lock = threading.Lock()  # post() x close()
+        self._closed = False
+        self.root.tk.createfilehandler(self.read_fd, tk.READABLE, self._on_readable)
+
+    def post(self, result):
+        """Chamado da thread do worker (False se a fila já foi fechada)"""
+        with self._lock:
+            if self._closed:
+                return False
+            self.results.put(result)
+            try:
+                os.write(self.write_fd, b"\0")
+            except BlockingIOError:
+                pass
+            return True
+
+    def _on_readable(self, fd, mask):
+        try:
+            os.read(self.read_fd, 4096)
+        except BlockingIOError:
+            pass
+
+        pending = []
+        while True:
+            try:
+                pending.append(self.results.get_nowait())
+            except queue.Empty:
+                break
+        if self.latest_only:
+            pending = pending[-1:]
+        for result in pending:
+            self.on_result(result)
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        try:
+            self.root.tk.deletefilehandler(self.read_fd)
+        except Exception:
+            pass
+        os.close(self.read_fd)
+        os.close(self.write_fd)
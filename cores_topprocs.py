@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Core S Top Processes
+Tabela de processos incremental: nome/linha de comando (psutil, em oneshot())
+só de PIDs novos, os conhecidos releem apenas /proc/<pid>/stat, removidos os
+que saíram; atualizada numa thread própria com os textos entregues ao loop do
+Tk por fila + pipe
+"""
+
+import heapq
+import os
+import threading
+import time
+
+from cores_tkqueue import TkResultQueue
+
+
+class ProcessEntry:
+    """Processo em cache (nome/linha de comando lidos uma única vez)"""
+
+    __slots__ = ("pid", "name", "cmdline", "created", "cpu_time", "cpu", "rss")
+
+    def __init__(self, pid, name, cmdline, created, cpu_time, rss):
+        self.pid = pid
+        self.name = name
+        self.cmdline = cmdline
+        self.created = created    # starttime (jiffies desde o boot): identidade junto com o PID
+        self.cpu_time = cpu_time  # user + system acumulado (s)
+        self.cpu = 0.0            # % desde a atualização anterior (100 = um núcleo)
+        self.rss = rss
+
+
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+
+def read_stat(pid):
+    """(tempo de CPU em s, starttime, RSS em bytes) numa leitura de /proc/<pid>/stat
+
+    OSError se o processo já saiu.
+    """
+    fd = os.open(f"/proc/{pid}/stat", os.O_RDONLY)
+    try:
+        data = os.read(fd, 2048)
+    finally:
+        os.close(fd)
+    # O nome entre parênteses pode conter espaços e ")": campos depois do último ")"
+    fields = data[data.rindex(b")") + 2:].split()
+    # fields[0] é o campo 3 (estado): utime=14, stime=15, starttime=22, rss=24
+    cpu_time = (int(fields[11]) + int(fields[12])) / CLOCK_TICKS
+    return cpu_time, int(fields[19]), int(fields[21]) * PAGE_SIZE
+
+
+def format_top(by_cpu, by_rss):
+    """Textos das duas colunas do popover"""
+    return ("CPU\n" + "\n".join(f"{e.cpu:5.1f}% {e.name[:16]}" for e in by_cpu),
+            "RAM\n" + "\n".join(f"{e.rss / 1048576:5.0f}M {e.name[:16]}" for e in by_rss))
+
+
+class ProcessTable:
+    """Processos do sistema atualizados por diferença a cada refresh()"""
+
+    def __init__(self):
+        import psutil
+        self.psutil = psutil
+        self.entries = {}
+        self.last_refresh = None
+        self.stats = {"new": 0, "gone": 0, "updated": 0, "seconds": 0.0}
+
+    def _parse_new(self, pid):
+        """Leitura completa de um PID ainda não visto (None se já saiu)"""
+        psutil = self.psutil
+        try:
+            cpu_time, created, rss = read_stat(pid)
+            process = psutil.Process(pid)
+            with process.oneshot():
+                name = process.name()
+                try:
+                    cmdline = " ".join(process.cmdline())
+                except psutil.AccessDenied:
+                    cmdline = ""
+        except (OSError, ValueError, IndexError,
+                psutil.NoSuchProcess, psutil.ZombieProcess, psutil.AccessDenied):
+            return None
+        return ProcessEntry(pid, name, cmdline, created, cpu_time, rss)
+
+    def refresh(self):
+        """Um listdir de /proc; PIDs conhecidos só releem /proc/<pid>/stat"""
+        psutil = self.psutil
+        start = time.monotonic()
+        elapsed = start - self.last_refresh if self.last_refresh else None
+        self.last_refresh = start
+
+        pids = set(psutil.pids())
+        entries = self.entries
+
+        gone = entries.keys() - pids
+        for pid in gone:
+            del entries[pid]
+
+        new = 0
+        updated = 0
+        for pid in pids:
+            entry = entries.get(pid)
+            if entry is None:
+                entry = self._parse_new(pid)
+                if entry is not None:
+                    entries[pid] = entry
+                    new += 1
+                continue
+
+            try:
+                # Tempo de CPU, starttime e RSS vêm da mesma leitura
+                cpu_time, created, rss = read_stat(pid)
+            except (OSError, ValueError, IndexError):
+                del entries[pid]
+                continue
+
+            if created != entry.created:
+                # Outro processo com o mesmo PID (starttime diferente): leitura completa
+                entry = self._parse_new(pid)
+                if entry is None:
+                    del entries[pid]
+                else:
+                    entries[pid] = entry
+                continue
+
+            entry.cpu = 100.0 * (cpu_time - entry.cpu_time) / elapsed if elapsed else 0.0
+            entry.cpu_time = cpu_time
+            entry.rss = rss
+            updated += 1
+
+        self.stats = {"new": new, "gone": len(gone), "updated": updated,
+                      "seconds": time.monotonic() - start}
+
+    def top(self, n=5):
+        """(maiores por CPU, maiores por RSS)"""
+        entries = self.entries.values()
+        return (heapq.nlargest(n, entries, key=lambda e: e.cpu),
+                heapq.nlargest(n, entries, key=lambda e: e.rss))
+
+    def pause(self):
+        """Popover fechado: o cache fica, a base de CPU% recomeça na reabertura"""
+        self.last_refresh = None
+
+
+class TopProcessesMonitor:
+    """ProcessTable atualizada numa thread; o loop do Tk só recebe os textos"""
+
+    def __init__(self, root, on_result, count=5):
+        self.root = root
+        self.count = count
+        self.table = ProcessTable()  # ImportError sem psutil
+        # Só o resultado mais recente interessa
+        self.results = TkResultQueue(root, on_result, latest_only=True)
+
+        self._requested = False
+        self._paused = False
+        self._stopped = False
+        self._wake = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="cores-topprocs", daemon=True)
+        self._thread.start()
+
+    def request(self):
+        """Pedir uma atualização (tarefa do agendador; pedidos acumulados viram um)"""
+        self._requested = True
+        self._wake.set()
+
+    def pause(self):
+        """Popover fechado: a base de CPU% recomeça no próximo pedido"""
+        self._paused = True
+        self._wake.set()
+
+    def _run(self):
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            if self._stopped:
+                return
+
+            # Tabela só é tocada nesta thread
+            if self._paused:
+                self._paused = False
+                self.table.pause()
+            if not self._requested:
+                continue
+            self._requested = False
+
+            try:
+                self.table.refresh()
+                result = format_top(*self.table.top(self.count))
+            except Exception as e:
+                print(f"Erro ao ler processos: {e}")
+                continue
+
+            if not self.results.post(result):
+                return  # monitor já fechado
+
+    def close(self, timeout=1.0):
+        """Parar a thread (esperando uma leitura em andamento) e fechar a fila"""
+        self._stopped = True
+        self._wake.set()
+        self._thread.join(timeout)
+        self.results.close()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Core S Update Check
+Verificação de atualização em segundo plano, com resultado entregue ao
+loop do Tk por fila + pipe (sem polling e sem tocar em widgets na thread)
+"""
+
+import os
+import threading
+
+from cores_tkqueue import TkResultQueue
+from cores_updater import INSTALL_DIR, IOBudget, Updater, UpdateError, create_source, read_version
+
+
+class UpdateCheckWorker(threading.Thread):
+    """Thread de baixa prioridade que compara a instalação com a fonte"""
+
+    def __init__(self, on_result, install_dir=INSTALL_DIR, budget=None, nice=10):
+        super().__init__(name="cores-updatecheck", daemon=True)
+        self.on_result = on_result
+        self.install_dir = install_dir
+        self.budget = budget or IOBudget()
+        self.nice = nice
+
+    def run(self):
+        # No Linux a prioridade vale só para esta thread
+        try:
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), self.nice)
+        except (AttributeError, OSError):
+            pass
+
+        version = read_version(self.install_dir)
+        result = {"update": version["update"], "version": version["last_version"],
+                  "current": version["last_version"], "error": None}
+
+        if version["source"]:
+            try:
+                updater = Updater(create_source(version["source"]), self.install_dir, budget=self.budget)
+                info = updater.check()
+                if info:
+                    updater.mark_available(info)
+                    result.update(update=True, version=info.version)
+                else:
+                    result["update"] = False
+            except (UpdateError, OSError) as e:
+                result["error"] = str(e)
+
+        self.on_result(result)
+
+
+class UpdateNotifier:
+    """Recebe resultados de workers no loop do Tk (TkResultQueue)"""
+
+    def __init__(self, root, on_result):
+        self.root = root
+        self.on_result = on_result
+        self.results = TkResultQueue(root, on_result)
+
+    def post(self, result):
+        """Chamado da thread do worker (ignorado depois de close())"""
+        self.results.post(result)
+
+    def start_check(self, **kwargs):
+        """Iniciar uma verificação em segundo plano"""
+        worker = UpdateCheckWorker(self.post, **kwargs)
+        worker.start()
+        return worker
+
+    def close(self):
+        # Worker ainda em andamento só perde o resultado (post() vira no-op)
+        self.results.close()
@@ -0,0 +1,502 @@
+#!/usr/bin/env python3
+"""
+Core S Updater
+Atualização por diferença: manifestos SHA-256 por arquivo, só os arquivos
+alterados são baixados, troca por rename com diário e rollback
+
+Uso:
+    cores_updater.py manifest <versão> [diretório]   # gerar manifest.json (publicação)
+    cores_updater.py check [fonte]                   # verificar atualização
+    cores_updater.py apply [fonte]                   # verificar e aplicar
+
+A fonte é um diretório local ou uma URL http(s):// com manifest.json e os
+arquivos; sem argumento usa o campo "source" de version.json.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+import time
+import urllib.error
+import urllib.request
+from collections import namedtuple
+
+INSTALL_DIR = os.path.dirname(os.path.abspath(__file__))
+VERSION_FILE = "version.json"
+MANIFEST_FILE = "manifest.json"
+
+STAGING_DIR = ".update-staging"
+BACKUP_DIR = ".update-backup"
+JOURNAL_FILE = ".update-journal.json"
+
+# Nunca publicados nem comparados (version.json guarda estado local; a versão
+# publicada vem do campo "version" do manifesto)
+EXCLUDED_NAMES = {".git", "__pycache__", MANIFEST_FILE, VERSION_FILE, STAGING_DIR, BACKUP_DIR, JOURNAL_FILE}
+EXCLUDED_SUFFIXES = (".pyc", ".tmp")
+
+CHUNK_SIZE = 64 * 1024
+
+SHA256_PATTERN = re.compile(r"[0-9a-f]{64}")
+
+# Permissões aceitas do manifesto (sem setuid/setgid/sticky nem escrita para outros)
+MODE_MASK = 0o755
+
+# Resultado de uma verificação com atualização disponível
+UpdateInfo = namedtuple("UpdateInfo", ["version", "manifest", "changed", "removed", "download_bytes"])
+
+
+class UpdateError(Exception):
+    """Falha ao verificar ou aplicar atualização"""
+
+
+class IOBudget:
+    """Limite de leitura (bytes/s) e de CPU (fração ativa) para hashing em segundo plano"""
+
+    def __init__(self, bytes_per_sec=4 * 1024 * 1024, duty=0.25):
+        self.bytes_per_sec = bytes_per_sec
+        self.duty = duty
+        self.started = time.monotonic()
+        self.consumed = 0
+        self._cpu_mark = time.thread_time()
+
+    def consume(self, nbytes):
+        """Contabilizar um bloco e dormir o necessário para ficar no orçamento"""
+        busy = time.thread_time() - self._cpu_mark
+        pause = busy * (1 - self.duty) / self.duty
+
+        self.consumed += nbytes
+        ahead = self.consumed / self.bytes_per_sec - (time.monotonic() - self.started)
+        pause = max(pause, ahead)
+        if pause > 0:
+            time.sleep(pause)
+        self._cpu_mark = time.thread_time()
+
+
+def hash_file(path, budget=None):
+    """SHA-256 de um arquivo, lido em blocos"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+            if budget:
+                budget.consume(len(chunk))
+    return digest.hexdigest()
+
+
+class HashCache:
+    """Hashes por (mtime, tamanho): arquivo inalterado não é relido"""
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = read_json(path, {})  # caminho relativo -> [mtime_ns, tamanho, sha256]
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, root_dir, relpath, budget=None):
+        """SHA-256 do arquivo (None se não existe)"""
+        path = os.path.join(root_dir, relpath)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+
+        entry = self.entries.get(relpath)
+        if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            self.hits += 1
+            return entry[2]
+
+        self.misses += 1
+        digest = hash_file(path, budget)
+        self.entries[relpath] = [st.st_mtime_ns, st.st_size, digest]
+        self.dirty = True
+        return digest
+
+    def save(self):
+        if self.dirty:
+            write_json(self.path, self.entries)
+            self.dirty = False
+
+
+def iter_files(root_dir):
+    """Caminhos relativos dos arquivos publicáveis"""
+    for current, subdirs, files in os.walk(root_dir):
+        subdirs[:] = sorted(d for d in subdirs if d not in EXCLUDED_NAMES)
+        for filename in sorted(files):
+            if filename in EXCLUDED_NAMES or filename.endswith(EXCLUDED_SUFFIXES):
+                continue
+            yield os.path.relpath(os.path.join(current, filename), root_dir)
+
+
+def build_manifest(root_dir, version):
+    """Manifesto {arquivo: sha256/tamanho/modo} de uma árvore"""
+    files = {}
+    for relpath in iter_files(root_dir):
+        path = os.path.join(root_dir, relpath)
+        st = os.stat(path)
+        files[relpath] = {
+            "sha256": hash_file(path),
+            "size": st.st_size,
+            "mode": st.st_mode & 0o777,
+        }
+    return {"version": version, "files": files}
+
+
+def is_safe_relpath(relpath):
+    """Caminho relativo que fica dentro da instalação (sem absoluto nem "..")"""
+    if not isinstance(relpath, str) or not relpath or "\0" in relpath or os.path.isabs(relpath):
+        return False
+    normalized = os.path.normpath(relpath)
+    return normalized not in (".", "..") and not normalized.startswith(".." + os.sep)
+
+
+def is_int(value):
+    # bool é subclasse de int, mas true/false no JSON não é tamanho nem modo
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def validate_manifest(manifest):
+    """Manifesto bem formado e sem caminhos fora da instalação (UpdateError se não)
+
+    O manifesto vem da fonte (não confiável): tipos conferidos aqui para que
+    diff() e apply() não falhem com TypeError/ValueError no meio do caminho.
+    """
+    files = manifest.get("files") if isinstance(manifest, dict) else None
+    if not isinstance(files, dict):
+        raise UpdateError("manifesto inválido: sem lista de arquivos")
+    for relpath, meta in files.items():
+        if not is_safe_relpath(relpath):
+            raise UpdateError(f"manifesto inválido: caminho fora da instalação {relpath!r}")
+        if not isinstance(meta, dict):
+            raise UpdateError(f"manifesto inválido: metadados de {relpath!r}")
+
+        sha256 = meta.get("sha256")
+        if not isinstance(sha256, str) or not SHA256_PATTERN.fullmatch(sha256):
+            raise UpdateError(f"manifesto inválido: sha256 de {relpath!r}")
+        size = meta.get("size")
+        if not is_int(size) or size < 0:
+            raise UpdateError(f"manifesto inválido: tamanho de {relpath!r}")
+        if "mode" in meta and not is_int(meta["mode"]):
+            raise UpdateError(f"manifesto inválido: modo de {relpath!r}")
+    return manifest
+
+
+def read_json(path, default=None):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def write_json(path, data):
+    """Gravar JSON de forma atômica"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+    os.replace(tmp_path, path)
+
+
+def read_version(install_dir=INSTALL_DIR):
+    """Conteúdo de version.json (last_version, update, source)"""
+    data = read_json(os.path.join(install_dir, VERSION_FILE), {})
+    return {
+        "last_version": data.get("last_version"),
+        "update": bool(data.get("update", False)),
+        "source": data.get("source", ""),
+    }
+
+
+class LocalSource:
+    """Fonte de atualização num diretório (pendrive, NFS, testes)"""
+
+    def __init__(self, path):
+        self.path = path
+        self.location = os.path.abspath(path)
+
+    def fetch_manifest(self, validator=None):
+        """(manifesto, validador) ou (None, validador) se não mudou"""
+        manifest_path = os.path.join(self.path, MANIFEST_FILE)
+        try:
+            st = os.stat(manifest_path)
+        except OSError as e:
+            raise UpdateError(f"manifesto indisponível: {e}")
+
+        current = f"{st.st_mtime_ns}-{st.st_size}"
+        if current == validator:
+            return None, validator
+
+        manifest = read_json(manifest_path)
+        if manifest is None:
+            raise UpdateError(f"manifesto inválido: {manifest_path}")
+        return manifest, current
+
+    def fetch_file(self, relpath, dest):
+        try:
+            shutil.copyfile(os.path.join(self.path, relpath), dest)
+        except OSError as e:
+            raise UpdateError(f"falha ao copiar {relpath}: {e}")
+
+
+class HTTPSource:
+    """Fonte de atualização HTTP (GET condicional com ETag/Last-Modified)"""
+
+    def __init__(self, base_url, timeout=15):
+        self.base_url = base_url.rstrip("/") + "/"
+        self.location = self.base_url
+        self.timeout = timeout
+
+    def fetch_manifest(self, validator=None):
+        """(manifesto, validador) ou (None, validador) em 304 Not Modified"""
+        request = urllib.request.Request(self.base_url + MANIFEST_FILE)
+        etag, _, last_modified = (validator or "").partition("\n")
+        if etag:
+            request.add_header("If-None-Match", etag)
+        if last_modified:
+            request.add_header("If-Modified-Since", last_modified)
+
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                manifest = json.loads(response.read())
+                new_validator = f"{response.headers.get('ETag', '')}\n{response.headers.get('Last-Modified', '')}"
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return None, validator
+            raise UpdateError(f"manifesto indisponível: HTTP {e.code}")
+        except (urllib.error.URLError, OSError, ValueError) as e:
+            raise UpdateError(f"manifesto indisponível: {e}")
+
+        return manifest, new_validator if new_validator.strip() else None
+
+    def fetch_file(self, relpath, dest):
+        url = self.base_url + urllib.request.pathname2url(relpath)
+        try:
+            with urllib.request.urlopen(url, timeout=self.timeout) as response, open(dest, "wb") as f:
+                shutil.copyfileobj(response, f, CHUNK_SIZE)
+        except (urllib.error.URLError, OSError) as e:
+            raise UpdateError(f"falha ao baixar {relpath}: {e}")
+
+
+def create_source(location):
+    """Fonte a partir de um caminho ou URL"""
+    if not location:
+        raise UpdateError("nenhuma fonte de atualização configurada")
+    if location.startswith(("http://", "https://")):
+        return HTTPSource(location)
+    return LocalSource(os.path.expanduser(location))
+
+
+class Updater:
+    """Compara manifestos e aplica só os arquivos alterados"""
+
+    def __init__(self, source, install_dir=INSTALL_DIR, cache_dir=None, budget=None):
+        self.source = source
+        self.install_dir = install_dir
+        self.budget = budget
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+        self.cache_dir = cache_dir or os.path.join(cache_home, "cores-taskbar", "update")
+        self.remote_cache_path = os.path.join(self.cache_dir, "remote_manifest.json")
+        self.installed_path = os.path.join(self.cache_dir, "installed_manifest.json")
+        self.hash_cache = HashCache(os.path.join(self.cache_dir, "local_hashes.json"))
+
+    def local_hash(self, relpath):
+        """SHA-256 do arquivo instalado (None se não existe)"""
+        return self.hash_cache.get(self.install_dir, relpath, self.budget)
+
+    def check(self):
+        """UpdateInfo se há diferença, None se atualizado
+
+        Com o manifesto remoto inalterado (validador igual) e a última
+        verificação sem diferenças, custa uma leitura do cache e um stat/GET
+        condicional na fonte.
+        """
+        cached = read_json(self.remote_cache_path, {})
+        if cached.get("source") != self.source.location:
+            cached = {}  # validador de outra fonte não vale aqui
+        manifest, validator = self.source.fetch_manifest(cached.get("validator"))
+
+        if manifest is None:
+            if cached.get("up_to_date"):
+                return None
+            manifest = cached.get("manifest")
+            if manifest is None:
+                raise UpdateError("cache de manifesto ausente")
+
+        # Validado ao carregar: nada abaixo junta caminhos não verificados
+        validate_manifest(manifest)
+        info = self.diff(manifest)
+        write_json(self.remote_cache_path, {
+            "source": self.source.location,
+            "validator": validator,
+            "up_to_date": info is None,
+            "manifest": manifest,
+        })
+        return info
+
+    def diff(self, manifest):
+        """Arquivos alterados/removidos entre a instalação e o manifesto"""
+        files = manifest.get("files", {})
+        changed = [relpath for relpath, meta in files.items()
+                   if self.local_hash(relpath) != meta["sha256"]]
+
+        # Só remove o que veio de uma atualização anterior (nunca arquivos do usuário)
+        installed = read_json(self.installed_path, {}).get("files", {})
+        removed = [relpath for relpath in installed
+                   if relpath not in files and is_safe_relpath(relpath)
+                   and os.path.exists(os.path.join(self.install_dir, relpath))]
+
+        self.hash_cache.save()
+
+        same_version = read_version(self.install_dir)["last_version"] == manifest.get("version")
+        if not changed and not removed and same_version:
+            return None
+
+        download = sum(files[relpath]["size"] for relpath in changed)
+        return UpdateInfo(manifest.get("version"), manifest, changed, removed, download)
+
+    def mark_available(self, info):
+        """Sinalizar atualização em version.json (campo "update")"""
+        path = os.path.join(self.install_dir, VERSION_FILE)
+        data = read_json(path, {})
+        if not data.get("update"):
+            data["update"] = True
+            write_json(path, data)
+
+    def apply(self, info):
+        """Baixar, verificar e trocar os arquivos (rollback em qualquer falha)"""
+        self.recover()
+
+        staging = os.path.join(self.install_dir, STAGING_DIR)
+        backup = os.path.join(self.install_dir, BACKUP_DIR)
+        shutil.rmtree(staging, ignore_errors=True)
+        shutil.rmtree(backup, ignore_errors=True)
+
+        files = info.manifest["files"]
+        try:
+            # 1. Baixar tudo para o staging (mesmo sistema de arquivos: rename atômico)
+            for relpath in info.changed:
+                dest = os.path.join(staging, relpath)
+                os.makedirs(os.path.dirname(dest), exist_ok=True)
+                self.source.fetch_file(relpath, dest)
+                if hash_file(dest) != files[relpath]["sha256"]:
+                    raise UpdateError(f"hash divergente em {relpath}")
+                os.chmod(dest, int(files[relpath].get("mode", 0o644)) & MODE_MASK)
+        except (UpdateError, OSError):
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        # 2. Diário antes de tocar na instalação (recover() desfaz após queda)
+        journal = {"version": info.version, "changed": info.changed,
+                   "removed": info.removed, "done": []}
+        journal_path = os.path.join(self.install_dir, JOURNAL_FILE)
+        write_json(journal_path, journal)
+
+        try:
+            for relpath in info.changed + info.removed:
+                target = os.path.join(self.install_dir, relpath)
+                saved = os.path.join(backup, relpath)
+
+                # Registrado antes de mexer: se havia original, o rollback o
+                # restaura do backup; se não havia, o arquivo novo é removido
+                existed = os.path.exists(target)
+                journal["done"].append([relpath, existed])
+                write_json(journal_path, journal)
+
+                if existed:
+                    os.makedirs(os.path.dirname(saved), exist_ok=True)
+                    os.replace(target, saved)
+                if relpath in files:
+                    os.makedirs(os.path.dirname(target), exist_ok=True)
+                    os.replace(os.path.join(staging, relpath), target)
+        except OSError as e:
+            self.rollback(journal)
+            raise UpdateError(f"falha na troca, revertido: {e}")
+
+        # 3. Concluído: o diário sai por último
+        path = os.path.join(self.install_dir, VERSION_FILE)
+        data = read_json(path, {})
+        data.update(last_version=info.version, update=False)
+        write_json(path, data)
+
+        write_json(self.installed_path, info.manifest)
+        write_json(self.remote_cache_path, {
+            "source": self.source.location,
+            "validator": read_json(self.remote_cache_path, {}).get("validator"),
+            "up_to_date": True,
+            "manifest": info.manifest,
+        })
+        os.remove(journal_path)
+        shutil.rmtree(staging, ignore_errors=True)
+        shutil.rmtree(backup, ignore_errors=True)
+
+    def rollback(self, journal):
+        """Restaurar os originais dos arquivos já trocados"""
+        backup = os.path.join(self.install_dir, BACKUP_DIR)
+        for relpath, existed in reversed(journal["done"]):
+            target = os.path.join(self.install_dir, relpath)
+            saved = os.path.join(backup, relpath)
+            if existed:
+                # Sem cópia no backup a queda foi antes da troca: o original segue no lugar
+                if os.path.exists(saved):
+                    os.replace(saved, target)
+            elif os.path.exists(target):
+                os.remove(target)  # arquivo novo, não existia antes
+
+        os.remove(os.path.join(self.install_dir, JOURNAL_FILE))
+        shutil.rmtree(os.path.join(self.install_dir, STAGING_DIR), ignore_errors=True)
+        shutil.rmtree(backup, ignore_errors=True)
+
+    def recover(self):
+        """Desfazer uma atualização interrompida (diário presente)"""
+        journal = read_json(os.path.join(self.install_dir, JOURNAL_FILE))
+        if journal is None:
+            return False
+        print(f"⚠️ Atualização {journal.get('version')} interrompida, revertendo")
+        self.rollback(journal)
+        return True
+
+
+def main(argv):
+    """Função principal"""
+    if len(argv) < 2 or argv[1] not in ("manifest", "check", "apply"):
+        print(__doc__.strip().split("\n\n")[1], file=sys.stderr)
+        return 2
+
+    if argv[1] == "manifest":
+        if len(argv) < 3:
+            print("Uso: cores_updater.py manifest <versão> [diretório]", file=sys.stderr)
+            return 2
+        root_dir = argv[3] if len(argv) > 3 else INSTALL_DIR
+        write_json(os.path.join(root_dir, MANIFEST_FILE), build_manifest(root_dir, argv[2]))
+        print(f"📦 {MANIFEST_FILE} gerado para {argv[2]}")
+        return 0
+
+    try:
+        source = create_source(argv[2] if len(argv) > 2 else read_version()["source"])
+        updater = Updater(source)
+        info = updater.check()
+        if info is None:
+            print("✅ Core S já está atualizado")
+            return 0
+
+        print(f"⬆️ Versão {info.version}: {len(info.changed)} arquivo(s) alterado(s), "
+              f"{len(info.removed)} removido(s), {info.download_bytes} bytes")
+        if argv[1] == "check":
+            updater.mark_available(info)
+            return 0
+
+        updater.apply(info)
+        print(f"✅ Atualizado para {info.version}")
+        return 0
+    except UpdateError as e:
+        print(f"❌ Erro na atualização: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
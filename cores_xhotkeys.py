@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Core S X Hotkeys
+Atalhos globais nativos (XGrabKey na janela raiz) atendidos pelo loop do Tk
+"""
+
+import ctypes
+import ctypes.util
+import tkinter as tk
+
+# Constantes do Xlib
+KEY_PRESS = 2
+GRAB_MODE_ASYNC = 1
+LOCK_MASK = 1 << 1
+MOD1_MASK = 1 << 3  # Alt
+MOD2_MASK = 1 << 4  # NumLock
+
+# Combinações ignoradas (CapsLock/NumLock não podem quebrar o atalho)
+IGNORED_MASKS = (0, LOCK_MASK, MOD2_MASK, LOCK_MASK | MOD2_MASK)
+
+
+class XKeyEvent(ctypes.Structure):
+    _fields_ = [
+        ("type", ctypes.c_int),
+        ("serial", ctypes.c_ulong),
+        ("send_event", ctypes.c_int),
+        ("display", ctypes.c_void_p),
+        ("window", ctypes.c_ulong),
+        ("root", ctypes.c_ulong),
+        ("subwindow", ctypes.c_ulong),
+        ("time", ctypes.c_ulong),
+        ("x", ctypes.c_int),
+        ("y", ctypes.c_int),
+        ("x_root", ctypes.c_int),
+        ("y_root", ctypes.c_int),
+        ("state", ctypes.c_uint),
+        ("keycode", ctypes.c_uint),
+        ("same_screen", ctypes.c_int),
+    ]
+
+
+class XEvent(ctypes.Union):
+    _fields_ = [
+        ("type", ctypes.c_int),
+        ("xkey", XKeyEvent),
+        ("pad", ctypes.c_long * 24),
+    ]
+
+
+class XErrorEvent(ctypes.Structure):
+    _fields_ = [
+        ("type", ctypes.c_int),
+        ("display", ctypes.c_void_p),
+        ("resourceid", ctypes.c_ulong),
+        ("serial", ctypes.c_ulong),
+        ("error_code", ctypes.c_ubyte),
+        ("request_code", ctypes.c_ubyte),
+        ("minor_code", ctypes.c_ubyte),
+    ]
+
+
+XErrorHandler = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p, ctypes.POINTER(XErrorEvent))
+
+
+def load_xlib():
+    """Carregar libX11 via ctypes (None se indisponível)"""
+    # soname direto primeiro: find_library executa ldconfig (lento na inicialização)
+    try:
+        xlib = ctypes.CDLL("libX11.so.6")
+    except OSError:
+        path = ctypes.util.find_library("X11")
+        if not path:
+            return None
+        try:
+            xlib = ctypes.CDLL(path)
+        except OSError:
+            return None
+
+    xlib.XOpenDisplay.restype = ctypes.c_void_p
+    xlib.XOpenDisplay.argtypes = [ctypes.c_char_p]
+    xlib.XDefaultRootWindow.restype = ctypes.c_ulong
+    xlib.XDefaultRootWindow.argtypes = [ctypes.c_void_p]
+    xlib.XConnectionNumber.argtypes = [ctypes.c_void_p]
+    xlib.XStringToKeysym.restype = ctypes.c_ulong
+    xlib.XStringToKeysym.argtypes = [ctypes.c_char_p]
+    xlib.XKeysymToKeycode.restype = ctypes.c_ubyte
+    xlib.XKeysymToKeycode.argtypes = [ctypes.c_void_p, ctypes.c_ulong]
+    xlib.XGrabKey.argtypes = [
+        ctypes.c_void_p, ctypes.c_int, ctypes.c_uint, ctypes.c_ulong,
+        ctypes.c_int, ctypes.c_int, ctypes.c_int
+    ]
+    xlib.XUngrabKey.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_uint, ctypes.c_ulong]
+    xlib.XPending.argtypes = [ctypes.c_void_p]
+    xlib.XNextEvent.argtypes = [ctypes.c_void_p, ctypes.POINTER(XEvent)]
+    xlib.XSync.argtypes = [ctypes.c_void_p, ctypes.c_int]
+    xlib.XFlush.argtypes = [ctypes.c_void_p]
+    xlib.XCloseDisplay.argtypes = [ctypes.c_void_p]
+    xlib.XSetErrorHandler.restype = ctypes.c_void_p
+    xlib.XSetErrorHandler.argtypes = [ctypes.c_void_p]
+    xlib.XGetAtomName.restype = ctypes.c_void_p
+    xlib.XGetAtomName.argtypes = [ctypes.c_void_p, ctypes.c_ulong]
+    xlib.XFree.argtypes = [ctypes.c_void_p]
+    return xlib
+
+
+class XHotkeyGrabber:
+    """Captura Alt+<tecla> na janela raiz sem processos auxiliares"""
+
+    def __init__(self, root, bindings, modifiers=MOD1_MASK):
+        self.root = root
+        self.bindings = bindings  # {"1": callback, ...}
+        self.modifiers = modifiers
+        self.xlib = None
+        self.display = None
+        self.root_window = None
+        self.fd = None
+        self.keycodes = {}
+        self.event = XEvent()
+        self._grab_failed = False
+
+    def start(self, display_name=None):
+        """Conectar ao X e registrar os atalhos (False se não foi possível)"""
+        self.xlib = load_xlib()
+        if self.xlib is None:
+            return False
+
+        self.display = self.xlib.XOpenDisplay(display_name.encode() if display_name else None)
+        if not self.display:
+            return False
+
+        self.root_window = self.xlib.XDefaultRootWindow(self.display)
+
+        for key, callback in self.bindings.items():
+            keysym = self.xlib.XStringToKeysym(key.encode())
+            keycode = self.xlib.XKeysymToKeycode(self.display, keysym)
+            if keycode:
+                self.keycodes[keycode] = callback
+
+        if not self.keycodes or not self._grab_all():
+            self.stop()
+            return False
+
+        # Conexão X própria entra no loop do Tk como qualquer descritor
+        self.fd = self.xlib.XConnectionNumber(self.display)
+        self.root.tk.createfilehandler(self.fd, tk.READABLE, self._on_readable)
+
+        # Eventos que já chegaram durante o XSync
+        self._on_readable(self.fd, tk.READABLE)
+        return True
+
+    def _grab_all(self):
+        """XGrabKey para cada tecla e combinação de locks"""
+        def on_error(display, error):
+            self._grab_failed = True
+            return 0
+
+        # Handler temporário: BadAccess (atalho já capturado) não pode matar o processo
+        handler = XErrorHandler(on_error)
+        previous = self.xlib.XSetErrorHandler(ctypes.cast(handler, ctypes.c_void_p))
+        self._grab_failed = False
+
+        try:
+            for keycode in self.keycodes:
+                for extra in IGNORED_MASKS:
+                    self.xlib.XGrabKey(
+                        self.display, keycode, self.modifiers | extra,
+                        self.root_window, False, GRAB_MODE_ASYNC, GRAB_MODE_ASYNC
+                    )
+            self.xlib.XSync(self.display, False)
+        finally:
+            self.xlib.XSetErrorHandler(previous)
+
+        return not self._grab_failed
+
+    def _on_readable(self, fd, mask):
+        """Despachar todos os eventos de tecla pendentes"""
+        while self.display and self.xlib.XPending(self.display):
+            self.xlib.XNextEvent(self.display, ctypes.byref(self.event))
+            if self.event.type != KEY_PRESS:
+                continue
+
+            key = self.event.xkey
+            if key.state & ~(LOCK_MASK | MOD2_MASK) != self.modifiers:
+                continue
+
+            callback = self.keycodes.get(key.keycode)
+            if callback:
+                try:
+                    callback()
+                except Exception as e:
+                    print(f"Erro no atalho global: {e}")
+
+    def stop(self):
+        """Liberar atalhos e fechar conexão"""
+        if not self.display:
+            return
+
+        if self.fd is not None:
+            try:
+                self.root.tk.deletefilehandler(self.fd)
+            except Exception:
+                pass
+            self.fd = None
+
+        for keycode in self.keycodes:
+            for extra in IGNORED_MASKS:
+                self.xlib.XUngrabKey(self.display, keycode, self.modifiers | extra, self.root_window)
+
+        self.xlib.XCloseDisplay(self.display)
+        self.display = None
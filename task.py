@@ -10,9 +10,50 @@ from tkinter import ttk
 import subprocess
 import threading
 import time
+import re
+import shlex
+import sys
 import psutil
 from datetime import datetime
 
+from cores_command_channel import CommandServer, send_command
+from cores_instance import InstanceLock, ensure_manager_running
+
+# Cliente usado pelo xbindkeys para falar com a taskbar
+CTL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cores-taskbar-ctl")
+
+class XevKeyParser:
+    """Parser incremental da saída do xev (KeyPress com Alt)"""
+    
+    KEY_RE = re.compile(r"state (0x[0-9a-fA-F]+), keycode \d+ \(keysym 0x[0-9a-fA-F]+, ([^)]+)\)")
+    ALT_MASK = 0x8
+    
+    def __init__(self, callbacks):
+        self.callbacks = callbacks  # {"3": callback, ...}
+        self.buffer = b""
+        self.in_key_press = False
+    
+    def feed(self, data):
+        """Consumir um bloco de bytes e disparar atalhos completos"""
+        self.buffer += data
+        *lines, self.buffer = self.buffer.split(b"\n")
+        
+        for raw in lines:
+            line = raw.decode(errors="ignore")
+            
+            if line.startswith("KeyPress event"):
+                self.in_key_press = True
+            elif line.startswith("KeyRelease event") or not line.strip():
+                self.in_key_press = False
+            elif self.in_key_press:
+                match = self.KEY_RE.search(line)
+                if match:
+                    self.in_key_press = False
+                    state = int(match.group(1), 16)
+                    callback = self.callbacks.get(match.group(2))
+                    if callback and state & self.ALT_MASK:
+                        callback()
+
 class CoresFloatingTaskbar:
     def __init__(self):
         self.root = tk.Tk()
@@ -377,6 +418,11 @@ class CoresFloatingTaskbar:
         except Exception as e:
             print(f"Erro ao alternar visibilidade: {e}")
     
+    def show_taskbar(self):
+        """Exibir taskbar se estiver oculta"""
+        if not self.is_visible:
+            self.toggle_visibility()
+    
     def setup_hotkeys(self):
         """Configurar atalhos de teclado globais"""
         import threading
@@ -394,21 +440,38 @@ class CoresFloatingTaskbar:
         self.root.bind_all('<Alt-Key-2>', lambda e: self.move_to_next_corner())
         self.root.bind_all('<Alt-Key-3>', lambda e: self.toggle_visibility())
     
+    def start_command_server(self):
+        """Iniciar canal de comandos (socket Unix atendido pelo Tk)"""
+        self.command_server = CommandServer(self.root, {
+            "toggle_expansion": self.toggle_expansion,
+            "move_corner": self.move_to_next_corner,
+            "toggle_visibility": self.toggle_visibility,
+            "show": self.show_taskbar
+        })
+        
+        try:
+            self.command_server.start()
+        except Exception as e:
+            print(f"Erro no canal de comandos: {e}")
+    
     def start_global_hotkey_daemon(self):
         """Iniciar daemon para capturar atalhos globais"""
+        # Comandos chegam pelo socket, sem arquivo de polling
+        self.start_command_server()
+        
         def hotkey_daemon():
-            import time
             import subprocess
             
             # Criar script temporário para xbindkeys
-            xbindkeys_config = """
-"echo 'toggle_expansion' > /tmp/cores_taskbar_cmd"
+            ctl = shlex.quote(CTL_PATH)
+            xbindkeys_config = f"""
+"{ctl} toggle_expansion"
     Alt + 1
 
-"echo 'move_corner' > /tmp/cores_taskbar_cmd"
+"{ctl} move_corner"
     Alt + 2
 
-"echo 'toggle_visibility' > /tmp/cores_taskbar_cmd"
+"{ctl} toggle_visibility"
     Alt + 3
 """
             
@@ -423,59 +486,73 @@ class CoresFloatingTaskbar:
                 # Iniciar xbindkeys
                 subprocess.Popen(["xbindkeys", "-f", "/tmp/cores_xbindkeys"], 
                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                
-                # Monitor de comandos
-                while True:
-                    try:
-                        if os.path.exists("/tmp/cores_taskbar_cmd"):
-                            with open("/tmp/cores_taskbar_cmd", "r") as f:
-                                cmd = f.read().strip()
-                            
-                            os.remove("/tmp/cores_taskbar_cmd")
-                            
-                            # Executar comando correspondente
-                            if cmd == "toggle_expansion":
-                                self.root.after(0, self.toggle_expansion)
-                            elif cmd == "move_corner":
-                                self.root.after(0, self.move_to_next_corner)
-                            elif cmd == "toggle_visibility":
-                                self.root.after(0, self.toggle_visibility)
-                    
-                    except Exception:
-                        pass
-                    
-                    time.sleep(0.1)
             
             except Exception as e:
                 print(f"Erro no daemon de atalhos: {e}")
-                # Fallback: usar método alternativo
-                self.setup_fallback_hotkeys()
+                # Fallback: usar método alternativo (no thread do Tk)
+                self.root.after(0, self.setup_fallback_hotkeys)
         
         threading.Thread(target=hotkey_daemon, daemon=True).start()
     
     def setup_fallback_hotkeys(self):
-        """Método alternativo para atalhos globais"""
-        def check_hotkeys():
-            import time
-            import subprocess
-            
-            while True:
-                try:
-                    # Verificar se Alt+3 foi pressionado via xdotool
-                    result = subprocess.run(
-                        "timeout 0.1 xev -root | grep -c 'keycode 11.*state 0x8'",
-                        shell=True, capture_output=True, text=True
-                    )
-                    
-                    if result.stdout.strip() and int(result.stdout.strip()) > 0:
-                        self.root.after(0, self.toggle_visibility)
-                
-                except Exception:
-                    pass
-                
-                time.sleep(0.2)
+        """Método alternativo para atalhos globais: um único xev persistente"""
+        self.xev_parser = XevKeyParser({
+            "1": self.toggle_expansion,
+            "2": self.move_to_next_corner,
+            "3": self.toggle_visibility
+        })
+        
+        try:
+            self.xev_process = subprocess.Popen(
+                ["xev", "-root", "-event", "keyboard"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                stdin=subprocess.DEVNULL
+            )
+        except Exception as e:
+            print(f"Erro no fallback de atalhos: {e}")
+            self.xev_process = None
+            return
+        
+        # Eventos lidos conforme chegam, sem janela entre consultas
+        os.set_blocking(self.xev_process.stdout.fileno(), False)
+        self.root.tk.createfilehandler(
+            self.xev_process.stdout, tk.READABLE, self.on_xev_output
+        )
+    
+    def on_xev_output(self, stream, mask):
+        """Ler saída disponível do xev e alimentar o parser"""
+        try:
+            data = os.read(stream.fileno(), 65536)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+        
+        if data:
+            self.xev_parser.feed(data)
+            return
+        
+        # xev terminou: liberar e tentar novamente depois
+        self.stop_fallback_hotkeys()
+        self.root.after(5000, self.setup_fallback_hotkeys)
+    
+    def stop_fallback_hotkeys(self):
+        """Encerrar listener do xev"""
+        process = getattr(self, 'xev_process', None)
+        if process is None:
+            return
+        
+        try:
+            self.root.tk.deletefilehandler(process.stdout)
+        except Exception:
+            pass
         
-        threading.Thread(target=check_hotkeys, daemon=True).start()
+        process.stdout.close()
+        if process.poll() is None:
+            process.terminate()
+        process.wait()
+        self.xev_process = None
     
     def start_monitoring(self):
         """Iniciar monitoramento do sistema"""
@@ -538,11 +615,14 @@ class CoresFloatingTaskbar:
     
     def on_closing(self):
         """Fechar aplicação"""
+        if hasattr(self, 'command_server'):
+            self.command_server.stop()
+        
+        self.stop_fallback_hotkeys()
+        
         # Limpar arquivos temporários
         try:
             import os
-            if os.path.exists("/tmp/cores_taskbar_cmd"):
-                os.remove("/tmp/cores_taskbar_cmd")
             if os.path.exists("/tmp/cores_xbindkeys"):
                 os.remove("/tmp/cores_xbindkeys")
             
@@ -566,7 +646,19 @@ class CoresFloatingTaskbar:
 
 def main():
     """Função principal"""
+    # Só uma taskbar por usuário: repassar comando à que já está rodando
+    command = sys.argv[1] if len(sys.argv) > 1 else "show"
+    
+    instance_lock = InstanceLock("cores_taskbar")
+    if not instance_lock.acquire():
+        try:
+            send_command(command)
+        except OSError as e:
+            print(f"❌ Erro ao contatar a taskbar em execução: {e}")
+        return
+    
     try:
+        ensure_manager_running()
         taskbar = CoresFloatingTaskbar()
         taskbar.run()
     except KeyboardInterrupt:
@@ -575,5 +667,4 @@ def main():
         print(f"❌ Erro: {e}")
 
 if __name__ == "__main__":
-    os.system("python3 /opt/cores-system/scripts/manager.py &")
     main()
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Testes do atualizador: aplicação por diferença, rollback, recuperação pelo
+diário e validação do manifesto
+"""
+
+import os
+import shutil
+import stat
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cores_updater
+from cores_updater import (BACKUP_DIR, JOURNAL_FILE, MANIFEST_FILE, STAGING_DIR, LocalSource,
+                           Updater, UpdateError, build_manifest, read_json, validate_manifest,
+                           write_json)
+
+VALID_SHA = "0" * 64
+
+
+class Crash(BaseException):
+    """Queda simulada no meio da troca (não é OSError: apply() não reverte)"""
+
+
+def write_tree(root, files):
+    for relpath, content in files.items():
+        path = os.path.join(root, relpath)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(content)
+
+
+def read_tree(root):
+    """{caminho relativo: conteúdo} sem os arquivos de estado do atualizador"""
+    tree = {}
+    for relpath in cores_updater.iter_files(root):
+        with open(os.path.join(root, relpath)) as f:
+            tree[relpath] = f.read()
+    return tree
+
+
+class UpdaterTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix="cores-updater-test-")
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.install = os.path.join(self.tmp, "install")
+        self.release = os.path.join(self.tmp, "release")
+        self.cache = os.path.join(self.tmp, "cache")
+
+        self.old = {"a.py": "a1", "b.py": "b1", "lib/c.py": "c1"}
+        self.new = {"a.py": "a2", "b.py": "b1", "lib/d.py": "d1"}
+        write_tree(self.install, self.old)
+        write_json(os.path.join(self.install, "version.json"), {"last_version": "1.0"})
+        # Instalação anterior veio de uma atualização: c.py pode ser removido
+        write_json(os.path.join(self.cache, "installed_manifest.json"),
+                   build_manifest(self.install, "1.0"))
+
+        write_tree(self.release, self.new)
+        os.chmod(os.path.join(self.release, "a.py"), 0o755)
+        self.publish(build_manifest(self.release, "2.0"))
+
+    def publish(self, manifest):
+        write_json(os.path.join(self.release, MANIFEST_FILE), manifest)
+
+    def updater(self):
+        return Updater(LocalSource(self.release), self.install, cache_dir=self.cache)
+
+    def assert_clean(self):
+        for name in (STAGING_DIR, BACKUP_DIR, JOURNAL_FILE):
+            self.assertFalse(os.path.exists(os.path.join(self.install, name)), name)
+
+
+class ApplyTest(UpdaterTestCase):
+
+    def test_delta_fetches_only_changed_files(self):
+        updater = self.updater()
+        info = updater.check()
+        self.assertEqual(sorted(info.changed), ["a.py", "lib/d.py"])
+        self.assertEqual(info.removed, ["lib/c.py"])
+        self.assertEqual(info.download_bytes, 4)
+
+        fetched = []
+        fetch_file = updater.source.fetch_file
+        with mock.patch.object(updater.source, "fetch_file",
+                               side_effect=lambda r, d: (fetched.append(r), fetch_file(r, d))):
+            updater.apply(info)
+
+        self.assertEqual(sorted(fetched), ["a.py", "lib/d.py"])
+        self.assertEqual(read_tree(self.install), self.new)
+        self.assertEqual(read_json(os.path.join(self.install, "version.json"))["last_version"], "2.0")
+        self.assert_clean()
+        self.assertIsNone(self.updater().check())
+
+    def test_mode_is_masked(self):
+        manifest = build_manifest(self.release, "2.0")
+        manifest["files"]["a.py"]["mode"] = 0o4777
+        self.publish(manifest)
+
+        updater = self.updater()
+        updater.apply(updater.check())
+        mode = stat.S_IMODE(os.stat(os.path.join(self.install, "a.py")).st_mode)
+        self.assertEqual(mode, 0o755)
+
+    def test_hash_mismatch_leaves_install_untouched(self):
+        manifest = build_manifest(self.release, "2.0")
+        manifest["files"]["lib/d.py"]["sha256"] = VALID_SHA
+        self.publish(manifest)
+
+        updater = self.updater()
+        with self.assertRaises(UpdateError):
+            updater.apply(updater.check())
+        self.assertEqual(read_tree(self.install), self.old)
+        self.assert_clean()
+
+
+class RollbackTest(UpdaterTestCase):
+
+    def fail_swap_at(self, relpath, exception):
+        """os.replace falha ao mover o arquivo novo de relpath do staging"""
+        staged = os.path.join(self.install, STAGING_DIR, relpath)
+        replace = os.replace
+
+        def failing_replace(src, dst):
+            if src == staged:
+                raise exception
+            return replace(src, dst)
+
+        return mock.patch("os.replace", side_effect=failing_replace)
+
+    def test_swap_failure_rolls_back(self):
+        updater = self.updater()
+        info = updater.check()
+        # a.py já trocado quando lib/d.py falha
+        with self.fail_swap_at("lib/d.py", OSError("disco cheio")):
+            with self.assertRaises(UpdateError):
+                updater.apply(info)
+
+        self.assertEqual(read_tree(self.install), self.old)
+        self.assert_clean()
+
+    def test_crash_mid_swap_is_recovered_from_journal(self):
+        updater = self.updater()
+        info = updater.check()
+        with self.fail_swap_at("lib/d.py", Crash()):
+            with self.assertRaises(Crash):
+                updater.apply(info)
+
+        # Processo "morreu": diário e backup ficaram, instalação pela metade
+        self.assertTrue(os.path.exists(os.path.join(self.install, JOURNAL_FILE)))
+        self.assertNotEqual(read_tree(self.install), self.old)
+
+        self.assertTrue(self.updater().recover())
+        self.assertEqual(read_tree(self.install), self.old)
+        self.assert_clean()
+
+    def test_crash_before_backup_keeps_original(self):
+        updater = self.updater()
+        info = updater.check()
+        target = os.path.join(self.install, "a.py")
+        replace = os.replace
+
+        # Diário já registra a.py, mas o original ainda não foi para o backup
+        def crash_on_backup(src, dst):
+            if src == target:
+                raise Crash()
+            return replace(src, dst)
+
+        with mock.patch("os.replace", side_effect=crash_on_backup):
+            with self.assertRaises(Crash):
+                updater.apply(info)
+
+        self.assertTrue(self.updater().recover())
+        self.assertEqual(read_tree(self.install), self.old)
+        self.assert_clean()
+
+    def test_recover_without_journal_is_noop(self):
+        self.assertFalse(self.updater().recover())
+        self.assertEqual(read_tree(self.install), self.old)
+
+
+class ValidateManifestTest(unittest.TestCase):
+
+    def manifest(self, **meta):
+        entry = {"sha256": VALID_SHA, "size": 1, "mode": 0o644}
+        entry.update(meta)
+        return {"version": "2.0", "files": {"a.py": entry}}
+
+    def test_valid(self):
+        manifest = self.manifest()
+        self.assertIs(validate_manifest(manifest), manifest)
+        del manifest["files"]["a.py"]["mode"]
+        validate_manifest(manifest)
+
+    def test_rejects_paths_outside_install(self):
+        for relpath in ("../x", "/etc/passwd", "lib/../../x", "", "."):
+            with self.subTest(relpath=relpath), self.assertRaises(UpdateError):
+                validate_manifest({"files": {relpath: self.manifest()["files"]["a.py"]}})
+
+    def test_rejects_bad_types(self):
+        bad = [
+            {"sha256": "abc"},
+            {"sha256": "G" * 64},
+            {"sha256": 123},
+            {"size": "10"},
+            {"size": -1},
+            {"size": True},
+            {"mode": "755"},
+            {"mode": 4.5},
+        ]
+        for meta in bad:
+            with self.subTest(meta=meta), self.assertRaises(UpdateError):
+                validate_manifest(self.manifest(**meta))
+
+    def test_rejects_missing_keys(self):
+        for key in ("sha256", "size"):
+            manifest = self.manifest()
+            del manifest["files"]["a.py"][key]
+            with self.subTest(key=key), self.assertRaises(UpdateError):
+                validate_manifest(manifest)
+        with self.assertRaises(UpdateError):
+            validate_manifest({"version": "2.0"})
+
+
+if __name__ == "__main__":
+    unittest.main()